@@ -0,0 +1,69 @@
+"""
+启动时间基准测试：用 SDL dummy 视频/音频驱动多次冷启动 main.py，统计各启动里程碑的耗时。
+
+    python benchmarks/startup_benchmark.py --runs 5
+
+- window: 窗口打开（pygame.display.set_mode 完成）
+- first_intro_frame: 开场动画第一帧显示
+- interactive_menu: 菜单第一帧已处理输入并显示（包含开场动画本身的时长）
+时间从启动子进程开始计算（包含 Python 解释器启动和模块导入）。
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+MILESTONES = ["window", "first_intro_frame", "interactive_menu"]
+
+
+def run_once(project_root, timeout):
+    """启动一次游戏，返回 {里程碑: 毫秒}"""
+    env = dict(os.environ)
+    env["SDL_VIDEODRIVER"] = "dummy"
+    env["SDL_AUDIODRIVER"] = "dummy"
+    env["ICB_STARTUP_BENCHMARK"] = "1"
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+    start = time.time()
+    result = subprocess.run([sys.executable, "main.py"], cwd=project_root, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=timeout)
+
+    marks = {}
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) == 3 and parts[0] == "STARTUP":
+            marks[parts[1]] = (float(parts[2]) - start) * 1000
+    return marks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ice Cold Beer 启动时间基准测试")
+    parser.add_argument("--runs", type=int, default=5, help="冷启动次数")
+    parser.add_argument("--timeout", type=float, default=60, help="单次启动超时（秒）")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).resolve().parents[1]
+    results = {name: [] for name in MILESTONES}
+    for i in range(args.runs):
+        marks = run_once(project_root, args.timeout)
+        missing = [name for name in MILESTONES if name not in marks]
+        if missing:
+            print(f"第 {i + 1} 次启动缺少里程碑: {', '.join(missing)}")
+        for name in MILESTONES:
+            if name in marks:
+                results[name].append(marks[name])
+        print(f"run {i + 1}: " + "  ".join(f"{name}={marks.get(name, float('nan')):.0f}ms" for name in MILESTONES))
+
+    print()
+    print(f"{'milestone':20s} {'median':>9s} {'min':>9s} {'max':>9s}")
+    for name in MILESTONES:
+        values = results[name]
+        if values:
+            print(f"{name:20s} {statistics.median(values):8.0f}ms {min(values):8.0f}ms {max(values):8.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
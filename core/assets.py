@@ -0,0 +1,221 @@
+from collections import OrderedDict
+from pathlib import Path
+
+import pygame
+
+from utils.settings import ASSET_MEMORY_BUDGET
+
+
+class AssetManager:
+    """
+    进程级图片缓存：每张图片只解码、convert、缩放一次，按 (路径, 尺寸, 是否带透明, 是否平滑缩放) 缓存。
+    - 场景通过清单（manifest）声明需要的图片：acquire 时预加载并引用计数 +1，release 时 -1；
+      被引用的图片不会被淘汰。
+    - 超出内存预算时，按最近最少使用（LRU）淘汰没有被引用的图片。
+    - 只缓存需要的尺寸，不保留原图（原图往往比屏幕大很多）。
+    """
+
+    def __init__(self, budget=ASSET_MEMORY_BUDGET):
+        self.budget = budget  # 字节
+        self.memory = 0
+
+        self.images = OrderedDict()  # key -> Surface（按最近使用排序）
+        self.sizes = {}  # key -> 占用字节数
+        self.native_sizes = {}  # 路径 -> 原图尺寸
+        self._last_decoded = None  # (路径, 原图)：查询原图尺寸时解码的结果，紧接着的缩放直接复用
+
+        self.manifests = {}  # 清单名 -> [(path, size, alpha), ...]
+        self.manifest_refs = {}  # 清单名 -> 引用计数
+        self.pins = {}  # key -> 引用它的清单数量
+
+        # 统计
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.preloaded = 0  # 由后台加载器送来的图片数
+
+        self.project_root = Path(__file__).resolve().parents[1]
+
+    # ---------------- 加载 ----------------
+    def _resolve(self, path):
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.project_root / path
+        return str(path)
+
+    def _key(self, path, size=None, alpha=False, smooth=False):
+        return self._resolve(path), tuple(size) if size else None, alpha, smooth
+
+    def _decode(self, path, alpha):
+        """解码并转换成显示格式（失败时抛出 pygame.error / FileNotFoundError，与 pygame.image.load 一致）"""
+        if self._last_decoded is not None and self._last_decoded[0] == path:
+            image = self._last_decoded[1]
+        else:
+            image = pygame.image.load(path)
+            self.native_sizes[path] = image.get_size()
+        self._last_decoded = None
+        return image.convert_alpha() if alpha else image.convert()
+
+    def image(self, path, size=None, alpha=False, smooth=False):
+        """
+        获取图片
+        path: 相对项目根目录的路径（或绝对路径）
+        size: 目标尺寸 (宽, 高)，None 表示原图尺寸
+        alpha: 是否保留透明通道（convert_alpha）
+        smooth: 使用 smoothscale 而不是最近邻缩放
+        """
+        key = self._key(path, size, alpha, smooth)
+        surface = self.images.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.images.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        return self._build(key, self._decode(key[0], key[2]))
+
+    def _build(self, key, surface):
+        """把转换好的图片缩放到 key 指定的尺寸并放入缓存"""
+        size, smooth = key[1], key[3]
+        if size is not None and surface.get_size() != size:
+            scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+            surface = scale(surface, size)
+
+        self._store(key, surface)
+        return surface
+
+    def add_decoded(self, path, raw, size=None, alpha=False, smooth=False, native_size=None):
+        """
+        登记已在后台线程解码（可能已缩放）的图片（见 core.loader）。
+        convert 必须在主线程做，所以这里负责 convert、缩放和缓存；已缓存时什么都不做。
+        native_size: raw 已经缩放过时传入原图尺寸
+        """
+        key = self._key(path, size, alpha, smooth)
+        if key in self.images:
+            return self.images[key]
+        self.preloaded += 1
+        self.native_sizes[key[0]] = native_size or raw.get_size()
+        converted = raw.convert_alpha() if alpha else raw.convert()
+        return self._build(key, converted)
+
+    def image_size(self, path):
+        """原图尺寸（第一次查询时需要解码一次）"""
+        resolved = self._resolve(path)
+        if resolved not in self.native_sizes:
+            image = pygame.image.load(resolved)
+            self.native_sizes[resolved] = image.get_size()
+            self._last_decoded = (resolved, image)
+        return self.native_sizes[resolved]
+
+    @staticmethod
+    def fit_size(native_size, width=None, height=None):
+        """按给定宽度或高度等比缩放后的尺寸（都为 None 时返回 None，表示原图尺寸）"""
+        native_w, native_h = native_size
+        if width is not None:
+            return int(width), int(native_h * (width / native_w))
+        if height is not None:
+            return int(native_w * (height / native_h)), int(height)
+        return None
+
+    def image_scaled(self, path, width=None, height=None, alpha=False, smooth=False):
+        """按给定宽度或高度等比缩放的图片"""
+        size = self.fit_size(self.image_size(path), width, height)
+        return self.image(path, size, alpha, smooth)
+
+    def cached(self, path, size=None, alpha=False, smooth=False):
+        """图片是否已在缓存中（不解码、不更新 LRU 顺序）"""
+        return self._key(path, size, alpha, smooth) in self.images
+
+    def cached_scaled(self, path, width=None, height=None, alpha=False, smooth=False):
+        """等比缩放的图片是否已在缓存中（原图尺寸未知时视为未缓存）"""
+        native_size = self.native_sizes.get(self._resolve(path))
+        if native_size is None:
+            return False
+        return self.cached(path, self.fit_size(native_size, width, height), alpha, smooth)
+
+    # ---------------- 缓存与淘汰 ----------------
+    def _store(self, key, surface):
+        nbytes = surface.get_pitch() * surface.get_height()
+        self.images[key] = surface
+        self.sizes[key] = nbytes
+        self.memory += nbytes
+        self._enforce_budget()
+
+    def _enforce_budget(self):
+        """超出预算时从最久未使用的开始淘汰（跳过被清单引用的图片）"""
+        if self.memory <= self.budget:
+            return
+        for key in list(self.images):
+            if self.memory <= self.budget:
+                break
+            if self.pins.get(key, 0) > 0:
+                continue
+            self._evict(key)
+
+    def _evict(self, key):
+        del self.images[key]
+        self.memory -= self.sizes.pop(key)
+        self.evictions += 1
+
+    def clear(self):
+        """清空所有未被引用的图片"""
+        for key in list(self.images):
+            if self.pins.get(key, 0) <= 0:
+                self._evict(key)
+
+    # ---------------- 场景清单 ----------------
+    def register_manifest(self, name, specs):
+        """注册清单：specs 为 [(path, size, alpha), ...]"""
+        self.manifests[name] = list(specs)
+
+    def acquire(self, name):
+        """场景进入：预加载清单中的图片并增加引用计数"""
+        specs = self.manifests.get(name)
+        if specs is None:
+            print(f"资源清单 {name} 未注册")
+            return
+
+        self.manifest_refs[name] = self.manifest_refs.get(name, 0) + 1
+        if self.manifest_refs[name] > 1:
+            return
+
+        for path, size, alpha in specs:
+            key = self._key(path, size, alpha)
+            self.pins[key] = self.pins.get(key, 0) + 1
+            try:
+                self.image(path, size, alpha)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"预加载图片失败 {path}: {e}")
+
+    def release(self, name):
+        """场景退出：减少引用计数，归零后清单中的图片可以被淘汰"""
+        refs = self.manifest_refs.get(name, 0)
+        if refs <= 0:
+            return
+
+        self.manifest_refs[name] = refs - 1
+        if refs > 1:
+            return
+
+        for path, size, alpha in self.manifests.get(name, []):
+            key = self._key(path, size, alpha)
+            self.pins[key] = self.pins.get(key, 0) - 1
+            if self.pins[key] <= 0:
+                del self.pins[key]
+        self._enforce_budget()
+
+    def stats(self):
+        """缓存统计（调试用）"""
+        return {
+            "images": len(self.images),
+            "memory": self.memory,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "preloaded": self.preloaded,
+        }
+
+
+# 全局资源管理器
+asset_manager = AssetManager()
@@ -1,15 +1,46 @@
-from utils.settings import GAME_WIDTH, GAME_HEIGHT
+from utils.settings import GAME_WIDTH, GAME_HEIGHT, CULL_MARGIN
 
 
-class Camera:
+class CameraView:
+    """
+    某一渲染帧使用的摄像机位置（只读），由 Camera.view 插值得到。
+    zoom 是渲染目标相对游戏区域的缩放（低分辨率渲染时小于 1），实体绘制时尺寸也要乘以 zoom。
+    """
+
+    def __init__(self, x, y, zoom=1.0):
+        self.x = x
+        self.y = y
+        self.zoom = zoom
+
+    def world_to_screen(self, world_x, world_y):
+        """把世界坐标转换成屏幕（渲染目标）坐标"""
+        return (world_x - self.x) * self.zoom, (world_y - self.y) * self.zoom
+
+    def viewport(self, margin=CULL_MARGIN):
+        """可见区域的世界坐标包围盒 (left, top, right, bottom)，向外扩 margin"""
+        return (self.x - margin, self.y - margin,
+                self.x + GAME_WIDTH + margin, self.y + GAME_HEIGHT + margin)
+
+    @staticmethod
+    def intersects(bounds, viewport):
+        """包围盒是否与视口相交"""
+        left, top, right, bottom = bounds
+        view_left, view_top, view_right, view_bottom = viewport
+        return left <= view_right and right >= view_left and top <= view_bottom and bottom >= view_top
+
+
+class Camera(CameraView):
     def __init__(self, target_x, target_y, target_screen_x=None, target_screen_y=None, smooth=0.1):
+        super().__init__(0, 0)
         self.smooth = 1
-        self.x = 0
-        self.y = 0
 
         self.follow(target_x, target_y, target_screen_x, target_screen_y)
         self.smooth = smooth
 
+        # 上一个物理步的位置（用于渲染插值）
+        self.prev_x = self.x
+        self.prev_y = self.y
+
     def follow(self, target_x, target_y, target_screen_x=None, target_screen_y=None):
         """
         target_x/y: 世界坐标
@@ -24,6 +55,15 @@ class Camera:
         self.x += (target_x - target_screen_x - self.x) * self.smooth
         self.y += (target_y - target_screen_y - self.y) * self.smooth
 
-    def world_to_screen(self, world_x, world_y):
-        """把世界坐标转换成屏幕坐标"""
-        return world_x - self.x, world_y - self.y
+    def snapshot(self):
+        """物理步开始前记录当前位置"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def view(self, alpha=1.0, zoom=1.0):
+        """返回上一步与当前步之间按 alpha 插值的摄像机位置"""
+        return CameraView(
+            self.prev_x + (self.x - self.prev_x) * alpha,
+            self.prev_y + (self.y - self.prev_y) * alpha,
+            zoom
+        )
@@ -0,0 +1,100 @@
+import pygame
+
+
+class Layer:
+    """合成器中的一层（见 Compositor）"""
+
+    def __init__(self, name, paint, static=False, opaque=False):
+        self.name = name
+        self.paint = paint  # paint(surface)：把这一层画到 surface 上（坐标与屏幕相同）
+        self.static = static
+        self.opaque = opaque  # 不透明的层会盖住下面的所有内容（例如全屏背景）
+        self.dirty = True
+
+        # 静态层的缓存：只保存有内容的区域
+        self.surface = None
+        self.offset = (0, 0)
+
+
+class Compositor:
+    """
+    分层合成器：场景把画面拆成按顺序叠加的若干层。
+    - 静态层（static=True）：第一次合成时画到缓存的 Surface 上，之后每帧只 blit 一次，
+      内容变化时由场景调用 invalidate(名字) 显式标记重画；
+    - 动态层：每帧直接画到屏幕上（背景动画、选中项高亮、CRT 特效等）。
+    最底下连续的静态层（第一层不透明时）合并成一张不透明的底图，每帧一次不带 alpha 的 blit；
+    其他静态层缓存为透明 Surface，只保留有内容的区域。
+    """
+
+    def __init__(self):
+        self.layers = []
+        self._base = None  # 合并后的底图
+        self._base_dirty = True
+
+        # 本帧重画的静态层数（调试/性能统计用）
+        self.repaints = 0
+
+    def add(self, name, paint, static=False, opaque=False):
+        """在最上面加一层"""
+        self.layers.append(Layer(name, paint, static, opaque))
+        self._base_dirty = True
+        return self
+
+    def invalidate(self, name=None):
+        """标记静态层需要重画，name 为 None 时全部重画"""
+        for layer in self.layers:
+            if name is None or layer.name == name:
+                layer.dirty = True
+                if self._is_base(layer):
+                    self._base_dirty = True
+
+    def _base_count(self):
+        """可以合并成底图的层数"""
+        if not self.layers or not (self.layers[0].static and self.layers[0].opaque):
+            return 0
+        count = 0
+        while count < len(self.layers) and self.layers[count].static:
+            count += 1
+        return count
+
+    def _is_base(self, layer):
+        return layer in self.layers[:self._base_count()]
+
+    def _paint_base(self, size):
+        if self._base is None or self._base.get_size() != size:
+            self._base = pygame.Surface(size).convert()
+        for layer in self.layers[:self._base_count()]:
+            layer.paint(self._base)
+            layer.dirty = False
+            self.repaints += 1
+        self._base_dirty = False
+
+    def _paint_layer(self, layer, size):
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        layer.paint(surface)
+        # 只保留有内容的区域，减少每帧带 alpha 的 blit 面积
+        bounds = surface.get_bounding_rect()
+        layer.surface = surface.subsurface(bounds).copy() if bounds.width and bounds.height else None
+        layer.offset = bounds.topleft
+        layer.dirty = False
+        self.repaints += 1
+
+    def draw(self, screen):
+        """按顺序合成所有层"""
+        self.repaints = 0
+        size = screen.get_size()
+        base_count = self._base_count()
+        if base_count:
+            if self._base_dirty or self._base is None or self._base.get_size() != size:
+                self._paint_base(size)
+            screen.blit(self._base, (0, 0))
+
+        for layer in self.layers[base_count:]:
+            if not layer.static:
+                layer.paint(screen)
+                continue
+            if layer.dirty:
+                self._paint_layer(layer, size)
+            if layer.surface is not None:
+                screen.blit(layer.surface, layer.offset)
@@ -0,0 +1,62 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class FontCache:
+    """
+    字体与文字渲染缓存（LRU）。
+    SysFont 在 Linux 上要查找系统字体，非常慢，不能在 draw 里每帧创建；
+    font 缓存字体对象，render 缓存渲染好的文字 Surface。
+    返回的 Surface 是共享的，调用方只能 blit，不要修改它。
+    """
+
+    def __init__(self, max_fonts=32, max_texts=256):
+        self.max_fonts = max_fonts
+        self.max_texts = max_texts
+        self.fonts = OrderedDict()  # (face, size, bold) -> Font
+        self.texts = OrderedDict()  # (face, size, text, color, bold) -> Surface
+
+        # 命中统计（调试用）
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size, face=None, bold=False):
+        """获取字体；face 为 SysFont 的字体名，None 表示 pygame 默认字体"""
+        key = (face, size, bold)
+        font = self.fonts.get(key)
+        if font is not None:
+            self.fonts.move_to_end(key)
+            return font
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.SysFont(face, size, bold=bold)
+        self.fonts[key] = font
+        if len(self.fonts) > self.max_fonts:
+            self.fonts.popitem(last=False)
+        return font
+
+    def render(self, text, size, color, face=None, bold=False):
+        """渲染文字（抗锯齿），相同参数直接返回缓存的 Surface"""
+        key = (face, size, text, tuple(color), bold)
+        surface = self.texts.get(key)
+        if surface is not None:
+            self.texts.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.font(size, face, bold).render(text, True, color)
+        self.texts[key] = surface
+        if len(self.texts) > self.max_texts:
+            self.texts.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.fonts.clear()
+        self.texts.clear()
+
+
+# 全局字体缓存
+font_cache = FontCache()
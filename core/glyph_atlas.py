@@ -0,0 +1,124 @@
+import string
+
+import pygame
+
+
+class GlyphAtlas:
+    """
+    位图字体：把一种字体、一种颜色的常用字符（可打印 ASCII）一次性光栅化到一张图集上，
+    之后画字符串只是从图集里按字符取区域，用一次 Surface.blits 批量贴出来，不再调用 Font.render。
+    不在字符集里的字符第一次用到时单独渲染并缓存。
+    """
+
+    CHARSET = string.digits + string.ascii_letters + string.punctuation + " "
+
+    def __init__(self, font, color):
+        self.font = font
+        self.color = tuple(color)
+        self.height = font.get_height()
+        self.glyphs = {}  # 字符 -> (图集 Surface, 区域 Rect)
+
+        glyph_surfaces = [(char, font.render(char, True, self.color)) for char in self.CHARSET]
+        width = sum(surface.get_width() for _, surface in glyph_surfaces)
+        height = max(surface.get_height() for _, surface in glyph_surfaces)
+        self.atlas = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+        self.atlas.fill((0, 0, 0, 0))
+
+        x = 0
+        for char, surface in glyph_surfaces:
+            # 取最大值相当于直接复制像素（图集是全透明的），不会被 alpha 混合改变颜色
+            self.atlas.blit(surface, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            area = pygame.Rect(x, 0, surface.get_width(), surface.get_height())
+            self.glyphs[char] = (self.atlas, area)
+            x += surface.get_width()
+
+    def _glyph(self, char):
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            surface = self.font.render(char, True, self.color)
+            glyph = (surface, surface.get_rect())
+            self.glyphs[char] = glyph
+        return glyph
+
+    def layout(self, text, previous=None):
+        """
+        每个字符的横坐标。按字体排版前缀字符串的宽度来定位，
+        包含字距调整（kerning）和小数前进宽度，与 Font.render 整串渲染的位置一致。
+        第 i 个字符的坐标只取决于 text[:i]，previous 为上一次的 (文字, 坐标) 时，
+        公共前缀部分直接复用（例如分数只有最后几位变化时几乎不需要重新排版）。
+        """
+        start = 0
+        offsets = []
+        if previous is not None:
+            old_text, old_offsets = previous
+            start = min(_common_prefix(text, old_text) + 1, len(text), len(old_offsets))
+            offsets = old_offsets[:start]
+        size = self.font.size
+        offsets.extend(size(text[:i])[0] for i in range(start, len(text)))
+        return offsets
+
+    def size(self, text):
+        """字符串绘制后的 (宽, 高)"""
+        return self.font.size(text)[0], self.height
+
+    def draw(self, surface, text, pos, special_flags=0, offsets=None, start=0):
+        """
+        把 text 画到 surface 的 pos（左上角）处
+        offsets: layout 的结果（可选）；start: 从第几个字符开始画
+        """
+        x, y = pos
+        if offsets is None:
+            offsets = self.layout(text)
+        sequence = []
+        for i in range(start, len(text)):
+            source, area = self._glyph(text[i])
+            sequence.append((source, (x + offsets[i], y), area, special_flags))
+        surface.blits(sequence, doreturn=False)
+
+
+def _common_prefix(a, b):
+    """a 和 b 公共前缀的长度"""
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+class TextLabel:
+    """
+    HUD 文字标签：缓存上一次的文字及其渲染结果，只有文字变化时才用图集重新拼一次，
+    之后每帧只需一次 blit。
+    文字宽度不变时（例如分数只有最后几位变化）只擦掉并重画变化的部分。
+    """
+
+    def __init__(self, atlas):
+        self.atlas = atlas
+        self.text = None
+        self.offsets = None
+        self.surface = None
+
+    def render(self, text):
+        """返回 text 的渲染结果（Surface 是共享的，只能 blit）"""
+        if text == self.text:
+            return self.surface
+
+        previous = (self.text, self.offsets) if self.text is not None else None
+        self.offsets = self.atlas.layout(text, previous)
+        size = self.atlas.size(text)
+        if self.surface is not None and self.surface.get_size() == size:
+            # 从第一个变化的字符前一个字符开始重画：前一个字符的字形可能伸进变化的区域，
+            # 用取最大值的方式重画已经存在的像素结果不变
+            common = _common_prefix(text, self.text)
+            start = max(0, common - 1)
+            clear_x = self.offsets[common] if common < len(text) else size[0]
+            self.surface.fill((0, 0, 0, 0), (clear_x, 0, size[0] - clear_x, size[1]))
+        else:
+            self.surface = pygame.Surface(size, pygame.SRCALPHA)
+            self.surface.fill((0, 0, 0, 0))
+            start = 0
+
+        # 标签是全透明的，取最大值相当于直接复制字形像素
+        self.atlas.draw(self.surface, text, (0, 0), pygame.BLEND_RGBA_MAX, self.offsets, start)
+        self.text = text
+        return self.surface
@@ -0,0 +1,105 @@
+from collections import deque
+
+from core.postfx import postfx
+from utils.settings import (FPS, QUALITY_MEDIUM, QUALITY_LOW, GOVERNOR_WINDOW, GOVERNOR_DOWNGRADE_PERCENTILE,
+                            GOVERNOR_UPGRADE_HEADROOM, GOVERNOR_UPGRADE_WINDOWS)
+
+
+class QualityGovernor:
+    """
+    画质调节器：主循环每帧把上一帧的工作耗时（clock.get_rawtime()，不含 clock.tick 等待的时间）交给 record()，
+    每攒满一个窗口（GOVERNOR_WINDOW 帧）评估一次：
+    - 窗口内较慢的帧（GOVERNOR_DOWNGRADE_PERCENTILE 分位）超出一帧的预算时降一档；
+    - 连续 GOVERNOR_UPGRADE_WINDOWS 个窗口都只用了预算的 GOVERNOR_UPGRADE_HEADROOM 以内时才升一档，
+      降档很快、升档很慢，避免在两档之间来回切换。
+    档位逐级累加（第 n 档包含前面所有档的降级），只临时改变后期特效流水线和渲染方式，不改动存档中的设置。
+    宁可关掉扫描线，也不要在游戏中掉帧。
+    """
+
+    # 档位名：0 为完整画质
+    TIERS = [
+        "full",
+        "no glitch",  # 关闭故障横线
+        "interlaced aberration",  # 色差只处理隔行（画质上限为中）
+        "no crt",  # 关闭色差、扫描线和边缘渐暗
+        "no fuzzy",  # 醉酒效果不再扭曲画面
+        "low res",  # 游戏世界画到低分辨率目标上再放大（同像素化渲染模式）
+    ]
+
+    def __init__(self):
+        self.enabled = True
+        self.tier = 0
+        self.budget_ms = 1000.0 / FPS
+
+        self.frame_times = deque(maxlen=GOVERNOR_WINDOW)
+        self._good_windows = 0
+        self._skip_frames = 0
+
+        # 当前档位下的渲染降级（由 _apply_tier 设置）
+        self.skip_fuzzy = False
+        self.low_res = False
+
+    def reset_window(self, skip_frames=0):
+        """丢弃当前窗口，之后 skip_frames 帧也不计入（切换场景时调用，加载造成的长帧不计入）"""
+        self.frame_times.clear()
+        self._good_windows = 0
+        self._skip_frames = skip_frames
+
+    def record(self, frame_ms):
+        """记录一帧的耗时（毫秒），窗口满时评估是否需要换档"""
+        if not self.enabled:
+            return
+        if self._skip_frames > 0:
+            self._skip_frames -= 1
+            return
+        self.frame_times.append(frame_ms)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return
+
+        times = sorted(self.frame_times)
+        slow = times[min(len(times) - 1, int(len(times) * GOVERNOR_DOWNGRADE_PERCENTILE))]
+        self.frame_times.clear()
+
+        if slow > self.budget_ms:
+            self._good_windows = 0
+            if self.tier < len(self.TIERS) - 1:
+                self.set_tier(self.tier + 1, f"较慢的帧 {slow:.1f} ms 超出预算 {self.budget_ms:.1f} ms")
+        elif slow < self.budget_ms * GOVERNOR_UPGRADE_HEADROOM:
+            self._good_windows += 1
+            if self._good_windows >= GOVERNOR_UPGRADE_WINDOWS and self.tier > 0:
+                self._good_windows = 0
+                self.set_tier(self.tier - 1, f"较慢的帧 {slow:.1f} ms，预算有富余")
+        else:
+            self._good_windows = 0
+
+    def set_tier(self, tier, reason=""):
+        """切换到第 tier 档并记录日志"""
+        tier = max(0, min(len(self.TIERS) - 1, tier))
+        if tier == self.tier:
+            return
+        direction = "降低" if tier > self.tier else "提高"
+        self.tier = tier
+        self._apply_tier()
+        print(f"画质调节：画质{direction}，当前第 {tier} 档（{self.TIERS[tier]}）" + (f"，{reason}" if reason else ""))
+
+    def _apply_tier(self):
+        suppressed = set()
+        if self.tier >= 1:
+            suppressed.add("glitch")
+        if self.tier >= 3:
+            suppressed.update(("aberration", "scanlines"))
+        postfx.suppressed = suppressed
+        postfx.quality_cap = QUALITY_LOW if self.tier >= 3 else QUALITY_MEDIUM if self.tier >= 2 else None
+        self.skip_fuzzy = self.tier >= 4
+        self.low_res = self.tier >= 5
+
+    def disable(self):
+        """关闭调节器并恢复完整画质"""
+        self.tier = 0
+        self._apply_tier()
+        self.enabled = False
+        self.reset_window()
+
+
+# 全局画质调节器
+quality_governor = QualityGovernor()
@@ -0,0 +1,192 @@
+import importlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pygame
+
+from core.assets import asset_manager
+from core.sound import sound_manager
+
+# 启动时预加载的图片清单（菜单背景、游戏机背景帧）
+STARTUP_MANIFESTS = ("menu", "game_machine")
+# 注册上面这些清单的模块（场景模块是按需导入的，预加载前先导入它们）
+STARTUP_MODULES = ("core.scenes.main_menu.menuScene", "core.scenes.common.game_machine_mixin")
+
+# 启动时预加载的音效：音效名 -> 相对项目根目录的路径
+STARTUP_SOUNDS = {
+    "press_enter": "data/sounds/press_enter.mp3",
+    "option_voice": "data/sounds/option_voice.mp3",
+    "eat_coins": "data/sounds/eat_coins.mp3",
+    "spring": "data/sounds/spring.mp3",
+    "teleportation": "data/sounds/teleportation.mp3",
+    "ball_roll": "data/sounds/ball_roll.mp3",
+    "game_over": "data/sounds/game_over.mp3",
+    "winning": "data/sounds/winning.mp3",
+    "falling_hole": "data/sounds/falling_hole.mp3",
+}
+
+
+def _decode_image(path, size, width, height, smooth):
+    """
+    工作线程：解码图片并缩放到目标尺寸，返回 (原图尺寸, 目标尺寸, 图片)。
+    width/height 表示按宽度/高度等比缩放（与 asset_manager.image_scaled 一致）。
+    缩放是逐通道的，先缩放后 convert 与先 convert 后缩放结果相同，
+    这样主线程只需要 convert 缩放后的小图。
+    """
+    image = pygame.image.load(path)
+    native_size = image.get_size()
+    if size is None and (width is not None or height is not None):
+        size = asset_manager.fit_size(native_size, width, height)
+    if size is not None and native_size != tuple(size):
+        if not smooth:
+            image = pygame.transform.scale(image, size)
+        elif image.get_bitsize() in (24, 32):
+            image = pygame.transform.smoothscale(image, size)
+        # 其他格式 smoothscale 不支持，留给主线程 convert 之后再缩放
+    return native_size, size, image
+
+
+class AssetLoader:
+    """
+    后台资源加载器：开场动画播放期间（以及场景预热时），在工作线程里解码图片文件和音效文件。
+    - 工作线程做解码和缩放（pygame.image.load / pygame.mixer.Sound，解码时会释放 GIL）；
+    - convert 必须在主线程做：主线程每帧调用 poll，把完成的图片交给 asset_manager，
+      音效交给 sound_manager，每帧只占用一小段时间，不影响开场动画。
+    之后场景里的 asset_manager.image / sound_manager.load_sound 直接命中缓存。
+    """
+
+    def __init__(self, manifests=STARTUP_MANIFESTS, sounds=STARTUP_SOUNDS, modules=STARTUP_MODULES, workers=None):
+        self.manifests = manifests
+        self.modules = modules
+        self.sounds = sounds
+        self.workers = workers or min(4, os.cpu_count() or 1)
+
+        self.project_root = Path(__file__).resolve().parents[1]
+        self.pending = []  # [(类型, future, 参数), ...]
+        self.total = 0
+        self.finished = 0
+        self.started = False
+        self._requested = set()  # 正在加载的图片请求
+        self._executor = None
+
+    def start(self):
+        """提交所有加载任务（需要在 pygame.display.set_mode 之后调用）"""
+        self.started = True
+        for module_name in self.modules:
+            importlib.import_module(module_name)
+
+        for name in self.manifests:
+            self.request_manifest(name)
+
+        if self.sounds:
+            try:
+                # mixer 要在主线程初始化
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
+                for name, path in self.sounds.items():
+                    self.request_sound(name, path)
+            except pygame.error as e:
+                print(f"初始化 pygame.mixer 失败，跳过音效预加载: {e}")
+
+        if not self.pending:
+            self._shutdown()
+
+    def _submit(self, kind, args, fn, *fn_args):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asset-loader")
+        self.pending.append((kind, self._executor.submit(fn, *fn_args), args))
+        self.total += 1
+
+    def request_image(self, path, size=None, alpha=False, smooth=False, width=None, height=None):
+        """
+        在后台解码一张图片（参数同 asset_manager.image / image_scaled）。
+        已经缓存或已经在加载的图片不会重复提交。
+        """
+        key = (path, tuple(size) if size else None, alpha, smooth, width, height)
+        if key in self._requested:
+            return
+        if size is None and (width is not None or height is not None):
+            cached = asset_manager.cached_scaled(path, width, height, alpha, smooth)
+        else:
+            cached = asset_manager.cached(path, size, alpha, smooth)
+        if cached:
+            return
+        self._requested.add(key)
+        full_path = self.project_root / path
+        self._submit("image", (path, alpha, smooth, key), _decode_image, str(full_path), size, width, height, smooth)
+
+    def request_manifest(self, name):
+        """在后台解码清单中的所有图片（不增加引用计数）"""
+        for path, size, alpha in asset_manager.manifests.get(name, []):
+            self.request_image(path, size, alpha)
+
+    def request_sound(self, name, path):
+        """在后台加载一个音效（mixer 需已初始化）"""
+        full_path = self.project_root / path
+        if name in sound_manager.sounds or not full_path.exists():
+            return
+        self._submit("sound", (name, str(full_path)), pygame.mixer.Sound, str(full_path))
+
+    def _finish(self, kind, future, args):
+        """在主线程登记一个完成的任务"""
+        try:
+            result = future.result()
+            if kind == "image":
+                path, alpha, smooth, key = args
+                self._requested.discard(key)
+                native_size, size, image = result
+                asset_manager.add_decoded(path, image, size, alpha, smooth, native_size=native_size)
+            else:
+                name, path = args
+                sound_manager.add_sound(name, result, path)
+        except (pygame.error, OSError) as e:
+            # 加载失败时不影响启动，场景会在用到时再按原来的方式加载
+            print(f"后台加载资源失败 {args[0]}: {e}")
+        self.finished += 1
+
+    def poll(self, budget=0.004):
+        """
+        主线程每帧调用：登记已完成的任务
+        budget: 本帧最多用于 convert/缩放的时间（秒）
+        """
+        start = time.perf_counter()
+        remaining = []
+        for job in self.pending:
+            if job[1].done() and time.perf_counter() - start < budget:
+                self._finish(*job)
+            else:
+                remaining.append(job)
+        self.pending = remaining
+        if not self.pending:
+            self._shutdown()
+
+    def wait(self):
+        """阻塞直到全部任务完成（例如开场动画被提前关闭时）"""
+        if not self.started:
+            self.start()
+        for job in self.pending:
+            self._finish(*job)  # future.result() 会等待任务完成
+        self.pending = []
+        self._shutdown()
+
+    def _shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    @property
+    def done(self):
+        return self.started and not self.pending
+
+    @property
+    def progress(self):
+        """加载进度 0~1"""
+        if self.total == 0:
+            return 1.0
+        return self.finished / self.total
+
+
+# 全局后台加载器
+asset_loader = AssetLoader()
@@ -0,0 +1,134 @@
+import time
+
+from utils.settings import GAME_STATE, QUALITY_HIGH, QUALITY_LEVELS
+
+# 后期特效作用的画面
+TARGET_GAME = "game"  # 游戏区域（游戏机屏幕里的 1:1 画面）
+TARGET_SCREEN = "screen"  # 整个屏幕（菜单、设置等全屏场景）
+
+
+class PostFXStage:
+    """后期特效流水线中的一个阶段（见 PostFXPipeline）"""
+
+    def __init__(self, name, apply, label=None, targets=(TARGET_GAME, TARGET_SCREEN), min_quality=None,
+                 animated=False):
+        self.name = name
+        self.apply = apply  # apply(surface, quality)：原地处理 surface
+        self.label = label or name.upper()  # 设置界面上显示的名字
+        self.targets = tuple(targets)
+        self.min_quality = min_quality or QUALITY_LEVELS[0]  # 低于这个画质档位时跳过
+        self.animated = animated  # 画面内容不变时输出也会变（移动的扫描线、随机故障线）
+        self.enabled = True
+
+        # 耗时统计（毫秒）：上一帧的耗时和指数平均
+        self.last_ms = 0.0
+        self.avg_ms = 0.0
+        self._frame_ms = 0.0
+
+
+class PostFXPipeline:
+    """
+    后期特效流水线：特效按注册顺序组成若干阶段，每个阶段声明
+    - 可以作用的画面（TARGET_GAME / TARGET_SCREEN），
+    - 最低画质档位（GAME_STATE["quality"] 低于它时跳过），
+    - 开关（命令行参数和设置界面可以单独开关每个阶段，enabled=False 时全部关闭）。
+    场景调用 run(surface, target) 处理自己的画面；每个阶段每帧最多执行一次，
+    同一帧先处理游戏区域、再处理屏幕时不会叠加两次。
+    主循环每帧调用 end_frame()，各阶段的耗时记录在 stage.last_ms / stage.avg_ms 中。
+    """
+
+    # 耗时指数平均的权重
+    TIMING_SMOOTHING = 0.1
+
+    def __init__(self):
+        self.stages = []
+        self.enabled = True
+
+        # 画质调节器（core/governor.py）的临时降级，不写入存档：跳过的阶段名、画质上限
+        self.suppressed = set()
+        self.quality_cap = None
+
+        # 本帧已经执行过的阶段名
+        self._ran = set()
+        # 上一帧所有阶段的总耗时（毫秒）
+        self.last_frame_ms = 0.0
+
+    def register(self, name, apply, label=None, targets=(TARGET_GAME, TARGET_SCREEN), min_quality=None,
+                 animated=False):
+        """注册一个阶段（同名阶段会被替换）"""
+        stage = PostFXStage(name, apply, label, targets, min_quality, animated)
+        for i, existing in enumerate(self.stages):
+            if existing.name == name:
+                stage.enabled = existing.enabled
+                self.stages[i] = stage
+                return stage
+        self.stages.append(stage)
+        return stage
+
+    def stage(self, name):
+        for stage in self.stages:
+            if stage.name == name:
+                return stage
+        return None
+
+    def set_enabled(self, name, enabled):
+        """开关一个阶段，未知的名字返回 False"""
+        stage = self.stage(name)
+        if stage is None:
+            return False
+        stage.enabled = bool(enabled)
+        return True
+
+    def load_settings(self, settings):
+        """从存档的 {阶段名: 开关} 恢复各阶段的开关"""
+        for name, enabled in (settings or {}).items():
+            self.set_enabled(name, enabled)
+
+    def _quality(self):
+        """设置的画质档位（不超过 quality_cap）"""
+        quality = GAME_STATE.get("quality", QUALITY_HIGH)
+        rank = QUALITY_LEVELS.index(quality) if quality in QUALITY_LEVELS else len(QUALITY_LEVELS) - 1
+        if self.quality_cap is not None:
+            rank = min(rank, QUALITY_LEVELS.index(self.quality_cap))
+        return QUALITY_LEVELS[rank]
+
+    def active_stages(self, target=None):
+        """当前画质和开关下会执行的阶段（target 为 None 时不限画面）"""
+        if not self.enabled:
+            return []
+        rank = QUALITY_LEVELS.index(self._quality())
+        return [stage for stage in self.stages
+                if stage.enabled and stage.name not in self.suppressed
+                and rank >= QUALITY_LEVELS.index(stage.min_quality)
+                and (target is None or target in stage.targets)]
+
+    def animated(self, target=None):
+        """是否有会让画面每帧变化的阶段（有的话静态场景不能跳过重绘）"""
+        return any(stage.animated for stage in self.active_stages(target))
+
+    def run(self, surface, target):
+        """对 surface（target 画面）执行本帧还没执行过的阶段"""
+        quality = self._quality()
+        for stage in self.active_stages(target):
+            if stage.name in self._ran:
+                continue
+            self._ran.add(stage.name)
+            start = time.perf_counter()
+            stage.apply(surface, quality)
+            stage._frame_ms += (time.perf_counter() - start) * 1000
+        return surface
+
+    def end_frame(self):
+        """每帧结束时调用：记录各阶段耗时，清除本帧的执行记录"""
+        total = 0.0
+        for stage in self.stages:
+            stage.last_ms = stage._frame_ms
+            stage.avg_ms += (stage.last_ms - stage.avg_ms) * self.TIMING_SMOOTHING
+            stage._frame_ms = 0.0
+            total += stage.last_ms
+        self.last_frame_ms = total
+        self._ran.clear()
+
+
+# 全局后期特效流水线
+postfx = PostFXPipeline()
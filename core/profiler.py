@@ -0,0 +1,206 @@
+import time
+from collections import deque
+from contextlib import nullcontext
+
+from core.governor import quality_governor
+from core.postfx import postfx
+from core.sprite_cache import sprite_cache
+
+# 关闭时 section() 返回的空上下文（不计时，几乎没有开销）
+_NO_SECTION = nullcontext()
+
+
+class _Section:
+    """计时区段（见 FrameProfiler.section）"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        stack = self.profiler._stack
+        # 嵌套的区段按路径命名，例如 "update/physics/collisions"
+        self.name = f"{stack[-1]}/{self.name}" if stack else self.name
+        stack.append(self.name)
+        # 进入时登记，父区段排在子区段前面
+        self.profiler._frame.setdefault(self.name, 0.0)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = (time.perf_counter() - self.start) * 1000
+        profiler = self.profiler
+        profiler._stack.pop()
+        profiler._frame[self.name] += elapsed
+        return False
+
+
+class FrameProfiler:
+    """
+    帧耗时分析：F3 或命令行 --profile 打开，屏幕左上角显示
+    - 最近 HISTORY 帧的帧耗时 p50 / p95 / p99（只算本帧实际工作的时间，不含限制帧率和等待输入的时间）；
+    - 各区段的耗时（事件处理、更新、物理、碰撞、各类实体绘制、后期特效各阶段、flip），
+      代码里用 with profiler.section("名字") 标记，嵌套的区段缩进显示；
+    - 每帧的绘制调用次数、视口裁剪跳过的实体数、新分配的 Surface 数、新烘焙的精灵数。
+    数值是一个刷新周期内的每帧平均值。面板每 REFRESH_INTERVAL 秒才重新渲染一次，
+    其他帧只 blit 缓存的 Surface；面板本身的耗时不计入帧耗时，避免影响测量结果。
+    关闭时 section() / count() 直接返回，不做任何计时。
+    本模块只在绘制面板时才导入 pygame。World 不导入本模块，由场景把 section 交给它（见 World.section）。
+    """
+
+    HISTORY = 240  # 计算分位数用的帧数
+    REFRESH_INTERVAL = 0.25  # 面板刷新间隔（秒）
+    FONT_SIZE = 14
+    LINE_HEIGHT = 15
+    POSITION = (8, 8)
+
+    def __init__(self):
+        self.enabled = False
+
+        self.frame_times = deque(maxlen=self.HISTORY)
+        self._stack = []
+        self._frame = {}  # 本帧：区段名 -> 毫秒
+        self._counts = {}  # 本帧：计数名 -> 次数
+        self._frame_start = None
+        self._overhead = 0.0  # 本帧绘制面板花的时间（毫秒），从帧耗时中扣除
+
+        # 当前刷新周期内的累计值
+        self._window_sections = {}
+        self._window_counts = {}
+        self._window_frames = 0
+        self._sprite_misses = sprite_cache.misses
+
+        self.overlay = None
+        self._last_refresh = 0.0
+
+    def toggle(self):
+        self.set_enabled(not self.enabled)
+
+    def set_enabled(self, enabled):
+        self.enabled = bool(enabled)
+        self.frame_times.clear()
+        self._frame.clear()
+        self._counts.clear()
+        self._stack.clear()
+        self._window_sections.clear()
+        self._window_counts.clear()
+        self._window_frames = 0
+        self._frame_start = None
+        self.overlay = None
+        self._last_refresh = 0.0
+
+    def section(self, name):
+        """计时区段：with profiler.section("名字"): ..."""
+        if not self.enabled:
+            return _NO_SECTION
+        return _Section(self, name)
+
+    def count(self, name, n=1):
+        """本帧的计数（例如绘制调用次数）"""
+        if self.enabled:
+            self._counts[name] = self._counts.get(name, 0) + n
+
+    def begin_frame(self):
+        """主循环在等到下一帧之后调用"""
+        if not self.enabled:
+            return
+        self._frame.clear()
+        self._counts.clear()
+        self._stack.clear()
+        self._overhead = 0.0
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """主循环在一帧结束时调用（flip 之后）"""
+        if not self.enabled or self._frame_start is None:
+            return
+        frame_ms = (time.perf_counter() - self._frame_start) * 1000 - self._overhead
+        self.frame_times.append(frame_ms)
+
+        # 后期特效各阶段的耗时由流水线自己统计（已经包含在 draw 中，这里单独列出）
+        if postfx.last_frame_ms:
+            self._frame["postfx"] = postfx.last_frame_ms
+        for stage in postfx.stages:
+            if stage.last_ms:
+                self._frame[f"postfx/{stage.name}"] = stage.last_ms
+
+        from core.surface_pool import surface_pool
+        self.count("surface allocs", surface_pool.last_frame_allocations)
+        self.count("sprite bakes", sprite_cache.misses - self._sprite_misses)
+        self._sprite_misses = sprite_cache.misses
+
+        for name, ms in self._frame.items():
+            self._window_sections[name] = self._window_sections.get(name, 0.0) + ms
+        for name, n in self._counts.items():
+            self._window_counts[name] = self._window_counts.get(name, 0) + n
+        self._window_frames += 1
+
+    @staticmethod
+    def _percentile(values, fraction):
+        return values[min(len(values) - 1, int(len(values) * fraction))]
+
+    def _lines(self, fps):
+        """面板上的文字"""
+        lines = []
+        if self.frame_times:
+            times = sorted(self.frame_times)
+            lines.append(f"FRAME p50 {self._percentile(times, 0.5):5.2f}  p95 {self._percentile(times, 0.95):5.2f}"
+                         f"  p99 {self._percentile(times, 0.99):5.2f} ms")
+        lines.append(f"FPS {fps:5.1f}   QUALITY TIER {quality_governor.tier}")
+
+        frames = max(1, self._window_frames)
+        # 父区段排在子区段前面，同一层按第一次出现的顺序
+        for name, total in self._window_sections.items():
+            depth = name.count("/")
+            label = "  " * depth + name.rsplit("/", 1)[-1]
+            lines.append(f"{label:<22}{total / frames:6.2f}")
+
+        counts = self._window_counts
+        lines.append(f"draw calls {counts.get('draw calls', 0) / frames:.0f}"
+                     f"  culled {counts.get('culled', 0) / frames:.0f}"
+                     f"  allocs {counts.get('surface allocs', 0) / frames:.1f}"
+                     f"  bakes {counts.get('sprite bakes', 0) / frames:.1f}")
+        return lines
+
+    def _refresh(self, fps):
+        import pygame
+        from core.font_cache import font_cache
+
+        font = font_cache.font(self.FONT_SIZE, face="Courier")
+        lines = self._lines(fps)
+        rendered = [font.render(line, True, (120, 255, 120)) for line in lines]
+        width = max(surface.get_width() for surface in rendered) + 12
+        height = len(rendered) * self.LINE_HEIGHT + 10
+        if self.overlay is not None:
+            # 面板只变大不变小：静态场景不会重画面板下面的内容，缩小后会留下旧面板的边缘
+            width = max(width, self.overlay.get_width())
+            height = max(height, self.overlay.get_height())
+
+        # 不透明面板：静态场景不重画面板下面的内容时，反复 blit 也不会叠加
+        self.overlay = pygame.Surface((width, height)).convert()
+        self.overlay.fill((10, 10, 10))
+        pygame.draw.rect(self.overlay, (60, 60, 60), self.overlay.get_rect(), 1)
+        self.overlay.blits([(surface, (6, 5 + i * self.LINE_HEIGHT)) for i, surface in enumerate(rendered)],
+                           doreturn=False)
+
+        self._window_sections = {}
+        self._window_counts = {}
+        self._window_frames = 0
+
+    def draw(self, screen, fps=0.0):
+        """把面板画到 screen 上，返回面板区域（关闭时返回 None）"""
+        if not self.enabled:
+            return None
+        start = time.perf_counter()
+        if self.overlay is None or start - self._last_refresh >= self.REFRESH_INTERVAL:
+            self._last_refresh = start
+            self._refresh(fps)
+        rect = screen.blit(self.overlay, self.POSITION)
+        self._overhead += (time.perf_counter() - start) * 1000
+        return rect
+
+
+# 全局帧耗时分析器
+profiler = FrameProfiler()
@@ -1,43 +1,46 @@
 from pathlib import Path
 
-import pygame
-
-from core.ui import UI
+from core.assets import asset_manager
+from core.governor import quality_governor
+from core.surface_pool import surface_pool
+from core.ui import ui
 from utils.settings import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_WIDTH, GAME_HEIGHT, GAME_STATE
 
+# 游戏机背景动画帧（9 帧，缩放到屏幕大小）
+GAME_MACHINE_FRAMES = [(f"data/pictures/game_machine/game_machine-{i}.png", (SCREEN_WIDTH, SCREEN_HEIGHT), True)
+                       for i in range(9)]
+asset_manager.register_manifest("game_machine", GAME_MACHINE_FRAMES)
+
 
 class GameMachineMixin:
+    """
+    游戏机背景。使用它的场景要在 asset_manifests 中声明 "game_machine"，
+    这样切换场景时背景帧保持被引用，不会被重新加载。
+    """
+
     def __init__(self):
         super().__init__()
 
         # 背景色
         self.background_color = (30, 30, 30)
 
-        # 加载游戏机背景图片（动画序列）
+        # 加载游戏机背景图片（动画序列），由 asset_manager 缓存，场景之间共享
         project_root = Path(__file__).resolve().parents[3]
-        game_machine_dir = project_root / "data" / "pictures" / "game_machine"
 
         self.game_machine_frames = []
         self.animation_frame = 0.0
         self.animation_speed = 0.15  # 动画速度（每帧增加的帧数）
 
         try:
-            # 加载所有动画帧（0-8）
-            for i in range(9):
-                frame_path = game_machine_dir / f"game_machine-{i}.png"
-
-                frame = pygame.image.load(str(frame_path)).convert_alpha()
-
-                # 缩放背景到屏幕大小
-                frame = pygame.transform.scale(frame, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                self.game_machine_frames.append(frame)
+            # 加载所有动画帧（0-8），已缩放到屏幕大小
+            for frame_path, size, alpha in GAME_MACHINE_FRAMES:
+                self.game_machine_frames.append(asset_manager.image(frame_path, size, alpha))
 
             if len(self.game_machine_frames) == 0:
                 # 如果没有找到动画帧，尝试加载单个图片作为后备
                 game_machine_path = project_root / "data" / "pictures" / "game_machine.png"
                 if game_machine_path.exists():
-                    self.game_machine_bg = pygame.image.load(str(game_machine_path)).convert_alpha()
-                    self.game_machine_bg = pygame.transform.scale(self.game_machine_bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
+                    self.game_machine_bg = asset_manager.image(game_machine_path, (SCREEN_WIDTH, SCREEN_HEIGHT), True)
                     self.game_machine_frames = None
                 else:
                     self.game_machine_bg = None
@@ -68,6 +71,12 @@ class GameMachineMixin:
             if self.animation_frame >= len(self.game_machine_frames):
                 self.animation_frame = 0.0
 
+    def _machine_idle_timeout(self):
+        """到游戏机背景动画下一帧的时间（秒），没有动画时为 None"""
+        if not getattr(self, "game_machine_frames", None):
+            return None
+        return (1.0 - self.animation_frame % 1.0) / (self.animation_speed * 60)
+
     def _draw_with_bg(self, screen):
         # 如果加载了游戏机背景动画，使用游戏机屏幕效果
         if hasattr(self, 'game_machine_frames') and self.game_machine_frames:
@@ -81,21 +90,21 @@ class GameMachineMixin:
             current_bg = None
 
         if current_bg:
-            # 创建游戏内容surface（1:1 正方形）
-            game_surface = pygame.Surface((self.game_area_width, self.game_area_height))
+            # 游戏内容surface（1:1 正方形），所有游戏场景共用一个，不再每帧创建
+            game_surface = surface_pool.get("game_area", (self.game_area_width, self.game_area_height))
             game_surface.fill(self.background_color)
 
             result = self._draw_surface(game_surface)
             dx, dy = result if result is not None else (0, 0)
 
+            # 醉酒效果只作用在游戏区域上（画质调节器降档后跳过）
+            if GAME_STATE["slow_time"] and not quality_governor.skip_fuzzy:
+                ui.fuzzy(game_surface)
+
             # 将游戏机背景绘制到主屏幕（使用当前动画帧）
             screen.blit(current_bg, (0, 0))
 
             # 将游戏内容surface直接绘制到游戏区域（不缩放，保持 1:1 比例)
             screen.blit(game_surface, (self.game_area_x + dx, self.game_area_y + dy))
-
-            ui = UI()
-            if GAME_STATE["slow_time"]:
-                ui.fuzzy(screen)
         else:
             self._draw_surface(screen)
\ No newline at end of file
@@ -49,6 +49,13 @@ class MenuNavigationMixin:
             # 安全失败：不阻塞菜单逻辑
             pass
 
+    def _reset_navigation(self):
+        """场景复用时调用：选中第一项，清除摇杆防抖状态"""
+        self.selected_index = 0
+        for name in ("_joy_up", "_joy_down"):
+            if hasattr(self, name):
+                delattr(self, name)
+
     def _play_option_sound(self):
         try:
             self._ensure_option_sound_loaded()
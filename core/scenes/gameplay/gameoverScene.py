@@ -1,19 +1,20 @@
 import pygame
 
+from core.font_cache import font_cache
+from core.postfx import TARGET_GAME
 from core.scenes.common.game_machine_mixin import GameMachineMixin
 from core.scenes.scene import Scene
 from core.sound import sound_manager
-from core.ui import UI
+from core.ui import ui
 from utils.settings import GAME_STATE
 
 
 class GameoverScene(Scene, GameMachineMixin):
+    asset_manifests = ("game_machine",)
+
     def __init__(self):
         super().__init__()
 
-        self.font = pygame.font.SysFont(None, 50)
-        self.small_font = pygame.font.SysFont(None, 36)
-
         sound_manager.stop_sound("ball_roll")
 
 
@@ -62,8 +63,7 @@ class GameoverScene(Scene, GameMachineMixin):
         # 复古背景
         screen.fill((20, 20, 20))
 
-        ui = UI()
-        ui.apply_effects(screen)
+        ui.apply_effects(screen, TARGET_GAME)
 
         # 获取游戏统计数据
         score = GAME_STATE.get("score", 0)
@@ -87,23 +87,23 @@ class GameoverScene(Scene, GameMachineMixin):
         for i, line in enumerate(lines):
             # 使用不同字体和颜色
             if i == 0:
-                font = pygame.font.SysFont(None, int(line_height * 0.8))
+                font_size = int(line_height * 0.8)
                 color = (255, 0, 0)
             elif "SCORE" in line:
-                font = pygame.font.SysFont(None, int(line_height * 0.7))
+                font_size = int(line_height * 0.7)
                 color = (255, 255, 0)
             elif "COINS" in line:
-                font = pygame.font.SysFont(None, int(line_height * 0.7))
+                font_size = int(line_height * 0.7)
                 color = (255, 215, 0)
             else:
-                font = pygame.font.SysFont(None, int(line_height * 0.6))
+                font_size = int(line_height * 0.6)
                 color = (200, 200, 200)
 
-            text = font.render(line, True, color)
+            text = font_cache.render(line, font_size, color)
             rect = text.get_rect(center=(screen.get_width() // 2, start_y + i * line_height))
             screen.blit(text, rect)
 
-            hint_text = self.small_font.render("PRESS ESC OR ENTER TO RETURN", True, (150, 150, 200))
+            hint_text = font_cache.render("PRESS ESC OR ENTER TO RETURN", 36, (150, 150, 200))
             hint_rect = hint_text.get_rect(center=(screen.get_width() // 2, screen.get_height() - 30))
             screen.blit(hint_text, hint_rect)
 
@@ -3,13 +3,17 @@ from pathlib import Path
 
 import pygame
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from core.assets import asset_manager
 from core.scenes.common.game_mixin import GameMixin
 from core.scenes.common.menu_navigation_mixin import confirm_pressed
 from core.sound import sound_manager
-from entities.coin import Coin
-from entities.finishLine import FinishLine
-from entities.hole import Hole
-from entities.obstacle import MovingPlatform, Spring, Teleporter
+from core.surface_pool import surface_pool
+from core.world import LevelWorld
 from utils.helper import save_data
 from utils.settings import GAME_STATE, SCREEN_WIDTH, SCREEN_HEIGHT
 
@@ -34,106 +38,78 @@ def load_level_data(id):
 
 class LevelScene(GameMixin):
     def __init__(self, info):
-        super().__init__()
-
         level, life = info.rsplit("_", 1)
         level_data = load_level_data(level)
-        self.life = int(life)
 
-        # 终点线（在小球上方一定距离）
-        self.finish_line = None
+        super().__init__(LevelWorld(level_data))
 
-        self._init_obj(level_data)
+        self.life = int(life)
 
         self.level = level
+        # 对话图片打开时画好的整屏画面：(图片, 画面)，见 _draw_dialog
+        self._dialog_frame = None
         # 前置对话
         self.show_intro = False
         self.intro_image = None
         if level == "level_1":
-            project_root = Path(__file__).resolve().parents[3]
-            intro_path = project_root / "data" / "pictures" / "dialogs" / "before_game.png"
-
-            self.intro_image = pygame.image.load(intro_path).convert_alpha()
+            self.intro_image = self._load_dialog("before_game.png")
             self.show_intro = True
 
-    def _init_obj(self, level_data):
-        # 初始化终点线
-
-        self.finish_line = FinishLine(level_data["finish_line_y"])
-
-        # 初始化洞口
-        hole_positions = level_data.get("holes", [])
-        for pos in hole_positions:
-            hole = Hole(x=pos["x"], y=pos["y"])
-            self.holes.append(hole)
-
-        # 初始化金币
-        coin_positions = level_data.get("coins", [])
-        for pos in coin_positions:
-            coin = Coin(x=pos["x"], y=pos["y"])
-            self.coins.append(coin)
-
-        # 初始化障碍物
-        obstacles = level_data.get("obstacles", [])
-        for obstacle in obstacles:
-            if obstacle["type"] == "moving_platform":
-                platform = MovingPlatform(obstacle["x"], obstacle["y"], width=obstacle["width"],
-                                          height=obstacle["height"], direction=obstacle["direction"])
-                self.moving_platforms.append(platform)
-            elif obstacle["type"] == "spring":
-                spring = Spring(obstacle["x"], obstacle["y"])
-                self.springs.append(spring)
-            elif obstacle["type"] == "teleporterPair":
-                # 创建配对传送门，使用配对ID区分不同的传送门对
-                pair_id = len(self.teleporters)  # 每个传送门对使用不同的ID
-                teleporter1 = Teleporter(obstacle["x1"], obstacle["y1"], obstacle["x2"], obstacle["y2"],
-                                         pair_id=pair_id)
-                teleporter2 = Teleporter(obstacle["x2"], obstacle["y2"], obstacle["x1"], obstacle["y1"],
-                                         pair_id=pair_id)
-                # 设置配对引用
-                teleporter1.pair_teleporter = teleporter2
-                teleporter2.pair_teleporter = teleporter1
-                self.teleporters.append([teleporter1, teleporter2])
-
-    def _obj_update(self, dt):
-        self._update_game_func(dt)
-
-    def _fall_into_hole(self):
-        self._fall_into_hole_func()
-
-    def _update_entities(self, dt):
-        self.ball.update(self.platform, dt)
-
-        # 更新障碍物和金币
-        self._obj_update(dt)
-
-        # 碰撞边缘抖动
-        if self.ball.collision_side():
-            self.shake_timer = 10
-
-        # 判断是否碰撞洞口，如果碰撞则开始动画
-        self._fall_into_hole()
+    @classmethod
+    def prewarm_assets(cls, info):
+        # 对话图片原图有两千多像素宽，解码要一百多毫秒：预热时（以及关卡进行中）在后台解码，
+        # 关卡结束时 _finish 直接命中缓存
+        level, _ = info.rsplit("_", 1)
+        level_num = int(level.split("_")[1])
+        names = [f"win_{level_num}.png", f"gameover_{level_num}.png"]
+        if level == "level_1":
+            names.insert(0, "before_game.png")
+        return [cls._dialog_request(name) for name in names]
+
+    @staticmethod
+    def _dialog_request(name):
+        """对话图片的加载参数：缩放到宽度 SCREEN_WIDTH - 50"""
+        return dict(path=f"data/pictures/dialogs/{name}", width=SCREEN_WIDTH - 50, alpha=True, smooth=True)
+
+    @classmethod
+    def _load_dialog(cls, name):
+        """
+        对话图片（由 asset_manager 缓存，只缩放一次）。
+        原图的每个像素都是半透明的，以前靠每帧反复叠加才显示成不透明的样子；
+        这里直接生成叠加收敛后的副本：alpha 大于 0 的像素改为不透明，完全透明的像素保持透明，
+        画一次就是最终的样子，重复绘制结果也不变
+        """
+        image = asset_manager.image_scaled(**cls._dialog_request(name))
+        opaque = image.copy()
+        if numpy is not None:
+            alpha = pygame.surfarray.pixels_alpha(opaque)
+            alpha[alpha > 0] = 255
+            del alpha  # 释放数组，解除 Surface 锁定
+        else:
+            # 没有 numpy 时用遮罩：alpha 大于 0 的像素取 alpha 的最大值 255（较慢）
+            mask = pygame.mask.from_surface(image, 0)
+            opaque.blit(mask.to_surface(setcolor=(0, 0, 0, 255), unsetcolor=(0, 0, 0, 0)), (0, 0),
+                        special_flags=pygame.BLEND_RGBA_MAX)
+        return opaque
 
     def _finish(self, victory):
         sound_manager.stop_sound("ball_roll")
 
         # 保存游戏状态
-        GAME_STATE["score"] = self.score
-        if self.score > GAME_STATE["highest_score"]:
-            GAME_STATE["highest_score"] = self.score
-        GAME_STATE["total_coins"] += self.coins_collected
-        GAME_STATE["coins"] = self.coins_collected
+        GAME_STATE["score"] = self.world.score
+        if self.world.score > GAME_STATE["highest_score"]:
+            GAME_STATE["highest_score"] = self.world.score
+        GAME_STATE["total_coins"] += self.world.coins_collected
+        GAME_STATE["coins"] = self.world.coins_collected
         GAME_STATE["victory"] = victory
         self.game_over = True
 
-        project_root = Path(__file__).resolve().parents[3]
         level_num = int(self.level.split("_")[1])
         self.show_dialog = True
         if victory:
             sound_manager.play_sound("winning")
             # 设置胜利对话显示
-            dialog_path = project_root / "data" / "pictures" / "dialogs" / f"win_{level_num}.png"
-            self.dialog_image = pygame.image.load(dialog_path).convert_alpha()
+            self.dialog_image = self._load_dialog(f"win_{level_num}.png")
 
             if level_num == 1 or level_num == 2:
                 self.next_scene_after_dialog = f"level_{level_num + 1}_{self.life}"
@@ -148,16 +124,9 @@ class LevelScene(GameMixin):
 
             sound_manager.play_sound("game_over")
 
-            dialog_path = project_root / "data" / "pictures" / "dialogs" / f"gameover_{level_num}.png"
-            self.dialog_image = pygame.image.load(dialog_path).convert_alpha()
+            self.dialog_image = self._load_dialog(f"gameover_{level_num}.png")
             self.next_scene_after_dialog = f"level_{level_num}_{self.life - 1}" if self.life > 1 else "level_lose"
 
-    def _compute_progress(self):
-        total_distance = abs(self.start_y - self.finish_line.y)
-        current_distance = abs(self.ball.y - self.finish_line.y)
-
-        return 1.0 - (current_distance / total_distance) if total_distance > 0 else 0.0
-
     # 获取屏幕抖动参数
     def get_shake_offset(self):
         return self._get_shake_offset_func()
@@ -189,53 +158,49 @@ class LevelScene(GameMixin):
                 self.next_scene = getattr(self, "next_scene_after_dialog", None)
             return  # 渐变期间暂停游戏逻辑
 
-        if not self.paused:
-            # 更新终点线动画
-            self.finish_line.update(dt)
-
-            # 检查是否到达终点
-            if self.finish_line.check_reached(self.ball):
-                self._finish(True)
-
         self._update_common_func(dt)
 
+    @property
+    def animating(self):
+        # 对话图片显示期间游戏暂停、画面静止，等待玩家按确认键（对话图片只在打开时画一次，见 _draw_dialog）
+        return not (self.show_intro or getattr(self, "show_dialog", False))
+
     def draw(self, screen):
         if self.show_intro and self.intro_image:
-            # 获取原始尺寸
-            img_w, img_h = self.intro_image.get_size()
-
-            # 计算缩放比例，使宽度等于 SCREEN_WIDTH - 50
-            target_width = SCREEN_WIDTH - 50
-            scale_ratio = target_width / img_w
-            new_w = int(img_w * scale_ratio)
-            new_h = int(img_h * scale_ratio)
-
-            # 缩放图片
-            scaled_img = pygame.transform.smoothscale(self.intro_image, (new_w, new_h))
-
-            # 计算水平和垂直居中坐标
-            x = (SCREEN_WIDTH - new_w) // 2
-            y = (SCREEN_HEIGHT - new_h) // 2
-
-            # 绘制图片
-            screen.blit(scaled_img, (x, y))
+            self._draw_dialog(screen, self.intro_image)
         elif getattr(self, "show_dialog", False):
-            # 胜利对话绘制
-            img_w, img_h = self.dialog_image.get_size()
-            target_width = SCREEN_WIDTH - 50
-            scale_ratio = target_width / img_w
-            new_w = int(img_w * scale_ratio)
-            new_h = int(img_h * scale_ratio)
-            scaled_img = pygame.transform.smoothscale(self.dialog_image, (new_w, new_h))
-            x = (SCREEN_WIDTH - new_w) // 2
-            y = (SCREEN_HEIGHT - new_h) // 2
-            screen.blit(scaled_img, (x, y))
+            # 胜利/失败对话绘制
+            self._draw_dialog(screen, self.dialog_image)
         else:
+            self.dirty_rects = None
             self.draw_func(screen)
 
         # 如果渐变中，绘制黑色覆盖层
         if self.fade_out:
-            fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            fade_surface = surface_pool.get("fade", (SCREEN_WIDTH, SCREEN_HEIGHT))
             fade_surface.set_alpha(int(self.fade_alpha))
             fade_surface.fill((0, 0, 0))
             screen.blit(fade_surface, (0, 0))
+
+    def _draw_dialog(self, screen, image):
+        """
+        对话图片：打开时画到冻结的游戏画面上并保存整屏画面，之后画面不变，不再更新屏幕；
+        需要整屏重绘时（窗口被遮挡后恢复等）直接贴回保存的画面
+        """
+        if self._dialog_frame is not None and self._dialog_frame[0] is image:
+            if self.full_redraw:
+                self.full_redraw = False
+                screen.blit(self._dialog_frame[1], (0, 0))
+                self.dirty_rects = None
+            else:
+                self.dirty_rects = []
+            return
+
+        # 图片加载时已缩放到宽度 SCREEN_WIDTH - 50，这里只需居中绘制
+        new_w, new_h = image.get_size()
+        x = (SCREEN_WIDTH - new_w) // 2
+        y = (SCREEN_HEIGHT - new_h) // 2
+        screen.blit(image, (x, y))
+        self._dialog_frame = (image, screen.copy())
+        self.full_redraw = False
+        self.dirty_rects = None
@@ -2,12 +2,19 @@ import pygame
 import math
 from pathlib import Path
 
+from core.assets import asset_manager
 from core.scenes.scene import Scene
 from core.scenes.common.menu_navigation_mixin import confirm_pressed
 from core.sound import sound_manager
+from utils.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+LEVEL_END_BACKGROUND = "data/pictures/level_end_background.png"
+asset_manager.register_manifest("level_end", [(LEVEL_END_BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT), True)])
 
 
 class LevelendScene(Scene):
+    asset_manifests = ("level_end",)
+
     def __init__(self, win):
         super().__init__()
         self.win = win
@@ -40,6 +47,18 @@ class LevelendScene(Scene):
             except Exception as e:
                 print(f"无法预加载打翻啤酒音效: {e}")
 
+    @classmethod
+    def prewarm_assets(cls, win):
+        # 与 draw 中的尺寸一致：人物高度为屏幕的一半，猫和啤酒按人物高度缩放
+        bartender_height = int(SCREEN_HEIGHT / 2)
+        if win:
+            return [dict(path="data/pictures/characters/bartender_win.png", height=bartender_height, alpha=True)]
+        return [
+            dict(path="data/pictures/characters/bartender_lose.png", height=bartender_height, alpha=True),
+            dict(path="data/pictures/characters/failure_cat.PNG", height=int(bartender_height * 0.8), alpha=True),
+            dict(path="data/pictures/characters/spilled_beer.PNG", height=int(bartender_height * 0.4), alpha=True),
+        ]
+
     def handle_events(self, events):
         if confirm_pressed(events):
             self.next_scene = "menu"
@@ -106,29 +125,21 @@ class LevelendScene(Scene):
                     self.beer_tilt_angle = -30
 
     def draw(self, screen):
-        # 获取项目根目录
-        project_root = Path(__file__).resolve().parents[3]
+        # 图片都由 asset_manager 缓存：第一次绘制时解码并缩放，之后每帧直接复用
 
-        # 加载背景图并铺满屏幕
-        bg_path = project_root / "data/pictures/level_end_background.png"
-        background = pygame.image.load(str(bg_path)).convert_alpha()
-        background = pygame.transform.scale(background, screen.get_size())
+        # 背景图铺满屏幕
+        background = asset_manager.image(LEVEL_END_BACKGROUND, screen.get_size(), alpha=True)
         screen.blit(background, (0, 0))
 
-        # 根据胜负加载对应 bartender 图片
+        # 根据胜负选择对应 bartender 图片
         if self.win:
-            bartender_path = project_root / "data/pictures/characters/bartender_win.png"
+            bartender_path = "data/pictures/characters/bartender_win.png"
         else:
-            bartender_path = project_root / "data/pictures/characters/bartender_lose.png"
+            bartender_path = "data/pictures/characters/bartender_lose.png"
 
-        bartender_img_original = pygame.image.load(str(bartender_path)).convert_alpha()
         # 放大人物：高度为屏幕高度的1/2（更大更醒目）
         sw, sh = screen.get_size()
-        target_height = int(sh / 2)
-        bw, bh = bartender_img_original.get_size()
-        scale_ratio = target_height / bh
-        target_width = int(bw * scale_ratio)
-        bartender_img = pygame.transform.scale(bartender_img_original, (target_width, target_height))
+        bartender_img = asset_manager.image_scaled(bartender_path, height=int(sh / 2), alpha=True)
 
         # 计算目标位置（居中，但向右偏移一些）
         bw, bh = bartender_img.get_size()
@@ -174,25 +185,17 @@ class LevelendScene(Scene):
         # 失败场景：绘制猫和打翻的啤酒
         if not self.win and self.alpha >= 200:
             # 加载猫和啤酒图片
-            cat_path = project_root / "data/pictures/characters/failure_cat.PNG"
-            beer_path = project_root / "data/pictures/characters/spilled_beer.PNG"
+            cat_path = "data/pictures/characters/failure_cat.PNG"
+            beer_path = "data/pictures/characters/spilled_beer.PNG"
             
             try:
-                # 加载并缩放猫
-                cat_img_original = pygame.image.load(str(cat_path)).convert_alpha()
-                cat_height = int(bh * 0.8)  # 猫的高度是人物高度的60%
-                cw, ch = cat_img_original.get_size()
-                cat_scale = cat_height / ch
-                cat_width = int(cw * cat_scale)
-                cat_img = pygame.transform.scale(cat_img_original, (cat_width, cat_height))
+                # 猫（缩放后缓存）
+                cat_img = asset_manager.image_scaled(cat_path, height=int(bh * 0.8), alpha=True)  # 猫的高度是人物高度的80%
+                cat_width, cat_height = cat_img.get_size()
                 
-                # 加载并缩放啤酒
-                beer_img_original = pygame.image.load(str(beer_path)).convert_alpha()
-                beer_height = int(bh * 0.4)  # 啤酒的高度是人物高度的40%
-                bew, beh = beer_img_original.get_size()
-                beer_scale = beer_height / beh
-                beer_width = int(bew * beer_scale)
-                beer_img = pygame.transform.scale(beer_img_original, (beer_width, beer_height))
+                # 啤酒（缩放后缓存）
+                beer_img = asset_manager.image_scaled(beer_path, height=int(bh * 0.4), alpha=True)  # 啤酒的高度是人物高度的40%
+                beer_width, beer_height = beer_img.get_size()
                 
                 # 计算啤酒位置（人物左上，向右移动一些）
                 beer_offset_x = -beer_width + 40  # 人物左边，但更靠近（向右移动）
@@ -1,4 +1,5 @@
 import pygame
+from core.compositor import Compositor
 from core.scenes.scene import Scene
 from core.scenes.common.menu_navigation_mixin import confirm_pressed
 
@@ -18,6 +19,11 @@ class CreditsScene(Scene):
             self.text_font = pygame.font.SysFont("Courier", 22)
             self.small_font = pygame.font.SysFont("Courier", 18)
 
+        # 背景和文字都是静态层，合并成一张底图，只在第一次显示时渲染
+        self.compositor = Compositor()
+        self.compositor.add("background", self._draw_background, static=True, opaque=True)
+        self.compositor.add("text", self._draw_text, static=True)
+
     def handle_events(self, events):
         if confirm_pressed(events):
             self.next_scene = "menu"
@@ -26,10 +32,22 @@ class CreditsScene(Scene):
     def update(self, dt):
         pass
 
+    @property
+    def animating(self):
+        # 画面完全静态，等待输入即可
+        return False
+
     def draw(self, screen):
+        # 画面完全静态：只在进入场景（或窗口需要重绘）时整屏绘制，之后不再更新屏幕
+        if not self._needs_redraw():
+            return
+        self.compositor.draw(screen)
+
+    def _draw_background(self, screen):
         # 深色背景 - 与Help界面一致
         screen.fill((20, 20, 35))
         
+    def _draw_text(self, screen):
         # 制作人员内容
         credits_lines = [
             "CREDITS",
@@ -2,18 +2,28 @@ from pathlib import Path
 
 import pygame
 
+from core.assets import asset_manager
+from core.compositor import Compositor
+from core.font_cache import font_cache
+from core.postfx import postfx
 from core.scenes.scene import Scene
 import core.scenes.common.menu_navigation_mixin as menu_nav
 
-from core.ui import UI
+from core.ui import ui
 from utils.settings import SCREEN_WIDTH, SCREEN_HEIGHT
 
+# 菜单背景动画帧（不透明，拉伸到全屏）
+MENU_BACKGROUNDS = [(f"data/pictures/menu_background/menu_background-{i}.png", (SCREEN_WIDTH, SCREEN_HEIGHT), False)
+                    for i in range(3)]
+asset_manager.register_manifest("menu", MENU_BACKGROUNDS)
+
 
 class MenuScene(Scene, menu_nav.MenuNavigationMixin):
+    asset_manifests = ("menu",)
+
     def __init__(self):
         super().__init__()
 
-        self.font = pygame.font.SysFont(None, 48)
         self.options = ["Start Game", "Help", "Shop", "Setting", "Credits", "Quit"]
         self.selected_index = 0
 
@@ -27,20 +37,17 @@ class MenuScene(Scene, menu_nav.MenuNavigationMixin):
 
         try:
             # 加载两张背景图
-            for i in range(0, 3):
+            for i, (path, size, alpha) in enumerate(MENU_BACKGROUNDS):
                 bg_path = menu_bg_dir / f"menu_background-{i}.png"
                 if bg_path.exists():
-                    bg = pygame.image.load(str(bg_path)).convert()
-                    # 拉伸到全屏
-                    bg = pygame.transform.scale(bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                    self.background_frames.append(bg)
+                    # 已拉伸到全屏
+                    self.background_frames.append(asset_manager.image(path, size, alpha))
             
             # 如果加载失败，使用默认背景作为后备
             if len(self.background_frames) == 0:
                 bg_path = project_root / "data" / "pictures" / "menu_background.png"
                 if bg_path.exists():
-                    self.background = pygame.image.load(str(bg_path)).convert()
-                    self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+                    self.background = asset_manager.image(bg_path, (SCREEN_WIDTH, SCREEN_HEIGHT))
                 else:
                     self.background = None
                 self.background_frames = None
@@ -51,12 +58,20 @@ class MenuScene(Scene, menu_nav.MenuNavigationMixin):
             # 后备方案：使用默认背景
             bg_path = project_root / "data" / "pictures" / "menu_background.png"
             if bg_path.exists():
-                self.background = pygame.image.load(str(bg_path)).convert()
-                self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+                self.background = asset_manager.image(bg_path, (SCREEN_WIDTH, SCREEN_HEIGHT))
             else:
                 self.background = None
             self.background_frames = None
 
+        self._build_compositor()
+
+    def reset(self):
+        super().reset()
+        self._reset_navigation()
+        self.animation_timer = 0.0
+        # GAME_STATE 可能在其他场景中变化
+        self.compositor.invalidate("stats")
+
     def _select_option(self):
         if self.selected_index == 0:  # Start Game
             self.next_scene = "mode"  # 切换到模式选择场景
@@ -89,7 +104,31 @@ class MenuScene(Scene, menu_nav.MenuNavigationMixin):
             self.animation_timer += dt
             # 持续累加，在 draw 中通过取模实现循环
 
-    def draw(self, screen):
+    @property
+    def animating(self):
+        # 动态特效关闭后，只有背景动画换帧时才需要重画
+        return postfx.animated()
+
+    def idle_timeout(self):
+        """到背景动画下一帧的时间（秒）"""
+        if not self.background_frames:
+            return None
+        period = self.animation_speed / len(self.background_frames)
+        return period - self.animation_timer % period
+
+    def _build_compositor(self):
+        """
+        画面分层：背景动画和 CRT 特效（动态）→ GAME_STATE 信息、操作提示（静态，进入菜单时重画）
+        → 菜单选项（动态，选中项会变）
+        """
+        self.compositor = Compositor()
+        self.compositor.add("background", self._draw_background)
+        self.compositor.add("effects", ui.apply_effects)
+        self.compositor.add("stats", ui.menu_stats, static=True)
+        self.compositor.add("hint", self._draw_hint, static=True)
+        self.compositor.add("options", self._draw_options)
+
+    def _draw_background(self, screen):
         # 绘制背景（流水灯效果）
         if self.background_frames and len(self.background_frames) > 0:
             # 根据动画时间选择当前帧
@@ -101,10 +140,8 @@ class MenuScene(Scene, menu_nav.MenuNavigationMixin):
             # 后备方案：使用静态背景
             screen.blit(self.background, (0, 0))
 
-        ui = UI()
-        ui.menu_ui(screen)
-
-        option_height = self.font.get_height()
+    def _draw_options(self, screen):
+        option_height = font_cache.font(48).get_height()
         line_spacing = 30
         start_y = int(SCREEN_HEIGHT * 0.4)
 
@@ -119,16 +156,15 @@ class MenuScene(Scene, menu_nav.MenuNavigationMixin):
             else:
                 color = (255, 255, 255)
 
-            text_surface = self.font.render(option, True, color)
+            text_surface = font_cache.render(option, 48, color)
             rect = text_surface.get_rect(
                 center=(SCREEN_WIDTH // 2, start_y + menu_index * (option_height + line_spacing)))
             screen.blit(text_surface, rect)
             menu_index += 1  # 只有绘制了才增加计数
 
         # ----------- 右侧商城按钮 -----------
-        shop_font = pygame.font.SysFont(None, 40)
         color = (255, 255, 0) if 2 == self.selected_index else (255, 255, 255)
-        shop_text = shop_font.render("Shop", True, color)
+        shop_text = font_cache.render("Shop", 40, color)
 
         # 固定在右侧位置（你可以调整）
         shop_x = SCREEN_WIDTH - 120
@@ -137,11 +173,14 @@ class MenuScene(Scene, menu_nav.MenuNavigationMixin):
 
         screen.blit(shop_text, shop_rect)
 
+    def _draw_hint(self, screen):
         # ----------- 操作提示 -----------
-        hint_font = pygame.font.SysFont(None, 28)
         hint_text = "Use UP/DOWN arrows to navigate, ENTER to select"
-        hint_surface = hint_font.render(hint_text, True, (200, 200, 200))
+        hint_surface = font_cache.render(hint_text, 28, (200, 200, 200))
         hint_y = int(SCREEN_HEIGHT * 0.9)
         hint_rect = hint_surface.get_rect(center=(SCREEN_WIDTH // 2, hint_y))
 
         screen.blit(hint_surface, hint_rect)
+
+    def draw(self, screen):
+        self.compositor.draw(screen)
@@ -1,12 +1,16 @@
 import pygame
 
+from core.postfx import postfx, TARGET_GAME
 from core.scenes.common.game_machine_mixin import GameMachineMixin
 from core.scenes.scene import Scene
 import core.scenes.common.menu_navigation_mixin as menu_nav
-from core.ui import UI
+from core.ui import ui
+from utils.settings import GAME_STATE
 
 
 class ModeScene(Scene, menu_nav.MenuNavigationMixin, GameMachineMixin):
+    asset_manifests = ("game_machine",)
+
     def __init__(self):
         super().__init__()
 
@@ -14,6 +18,11 @@ class ModeScene(Scene, menu_nav.MenuNavigationMixin, GameMachineMixin):
         self.options = ["Stage Mode", "Endless Mode", "Return"]
         self.selected_index = 0
 
+    def reset(self):
+        super().reset()
+        self._reset_navigation()
+        self.animation_frame = 0.0
+
     def _select_option(self):
         if self.selected_index == 0:  # Start Game
             self.next_scene = "select"  # 切换到模式选择场景
@@ -31,6 +40,14 @@ class ModeScene(Scene, menu_nav.MenuNavigationMixin, GameMachineMixin):
     def update(self, dt):
         self._update_game_machine_animation(dt)
 
+    @property
+    def animating(self):
+        # 动态特效和醉酒效果每帧都在变；否则只有背景动画换帧时才需要重画
+        return postfx.animated() or GAME_STATE["slow_time"]
+
+    def idle_timeout(self):
+        return self._machine_idle_timeout()
+
     def _draw_surface(self, screen):
         lines = self.options
 
@@ -44,8 +61,13 @@ class ModeScene(Scene, menu_nav.MenuNavigationMixin, GameMachineMixin):
             rect = text.get_rect(center=(screen.get_width() // 2, start_y + i * line_height))
             screen.blit(text, rect)
 
-        ui = UI()
-        ui.apply_effects(screen)
+        ui.apply_effects(screen, TARGET_GAME)
 
     def draw(self, screen):
-        self._draw_with_bg(screen)
+        # 只在背景动画换帧或选中项变化时重绘（CRT 特效开启时每帧重绘，醉酒效果每帧随机也要重绘）
+        frames = getattr(self, "game_machine_frames", None)
+        frame = int(self.animation_frame) % len(frames) if frames else 0
+        if GAME_STATE["slow_time"]:
+            self.invalidate()
+        if self._needs_redraw((self.selected_index, frame), effects=True):
+            self._draw_with_bg(screen)
@@ -2,9 +2,10 @@ import pygame
 
 from core.scenes.scene import Scene
 import core.scenes.common.menu_navigation_mixin as menu_nav
+from core.postfx import postfx
 from core.sound import sound_manager
-from core.ui import UI
-from utils.settings import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_STATE
+from core.ui import ui
+from utils.settings import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_STATE, QUALITY_HIGH, QUALITY_LEVELS
 from utils.helper import save_data
 
 
@@ -17,117 +18,248 @@ class SettingScene(Scene, menu_nav.MenuNavigationMixin):
         self.value_font = pygame.font.SysFont(None, 36)
         self.hint_font = pygame.font.SysFont(None, 24)
 
-        self.options = ["Volume", "Vibration", "Return"]
+        self.options = ["Volume", "Vibration", "Effects", "Quality", "Pixel", "Return"]
         self.selected_index = 0
 
         self.volume = GAME_STATE["volume"]
         self.vibration = GAME_STATE["vibration"]
+        self.effect_index = 0  # Effects 选项当前显示的后期特效（postfx 中的阶段）
+
+    def reset(self):
+        super().reset()
+        self._reset_navigation()
+        self.volume = GAME_STATE["volume"]
+        self.vibration = GAME_STATE["vibration"]
+        self.effect_index = 0
 
     def handle_events(self, events):
         self._handle_common_navigation(events)
 
         for event in events:
             if event.type == pygame.KEYDOWN:
-                if self.options[self.selected_index] == "Volume":
-                    if event.key == pygame.K_LEFT:
-                        self.volume = max(0, self.volume - 1)
-                        sound_manager.set_volume(self.volume / 10)
-                        GAME_STATE["volume"] = self.volume
-                        save_data()
-                    if event.key == pygame.K_RIGHT:
-                        self.volume = min(10, self.volume + 1)
-                        sound_manager.set_volume(self.volume / 10)
-                        GAME_STATE["volume"] = self.volume
-                        save_data()
-
-            # Joystick left/right to adjust volume
-            if event.type == pygame.JOYAXISMOTION and self.options[self.selected_index] == "Volume":
+                if event.key == pygame.K_LEFT:
+                    self._adjust_option(-1)
+                if event.key == pygame.K_RIGHT:
+                    self._adjust_option(1)
+
+            # Joystick left/right to adjust volume / effects / quality
+            if event.type == pygame.JOYAXISMOTION:
                 if event.axis == 0:  # horizontal axis
                     if event.value < -0.5:
-                        self.volume = max(0, self.volume - 1)
-                        sound_manager.set_volume(self.volume / 10)
-                        GAME_STATE["volume"] = self.volume
-                        save_data()
+                        self._adjust_option(-1)
                     elif event.value > 0.5:
-                        self.volume = min(10, self.volume + 1)
-                        sound_manager.set_volume(self.volume / 10)
-                        GAME_STATE["volume"] = self.volume
-                        save_data()
+                        self._adjust_option(1)
 
         if menu_nav.confirm_pressed(events):
             self._select_option()
 
+    def _adjust_option(self, step):
+        """左右键：调整音量、切换显示的特效、切换画质、开关像素化渲染"""
+        option = self.options[self.selected_index]
+        if option == "Volume":
+            self.volume = max(0, min(10, self.volume + step))
+            sound_manager.set_volume(self.volume / 10)
+            GAME_STATE["volume"] = self.volume
+            save_data()
+        elif option == "Effects" and postfx.stages:
+            self.effect_index = (self.effect_index + step) % len(postfx.stages)
+        elif option == "Quality":
+            quality = GAME_STATE.get("quality", QUALITY_HIGH)
+            index = QUALITY_LEVELS.index(quality) if quality in QUALITY_LEVELS else len(QUALITY_LEVELS) - 1
+            GAME_STATE["quality"] = QUALITY_LEVELS[max(0, min(len(QUALITY_LEVELS) - 1, index + step))]
+            save_data()
+            # 特效变化后整屏重绘
+            self.invalidate()
+        elif option == "Pixel":
+            self._toggle_pixel_mode()
+
+    @staticmethod
+    def _toggle_pixel_mode():
+        """像素化渲染：游戏世界画到低分辨率目标上再放大（见 GameMixin._draw_surface）"""
+        GAME_STATE["pixel_mode"] = not GAME_STATE.get("pixel_mode", False)
+        save_data()
+
     def _select_option(self):
         option = self.options[self.selected_index]
         if self.options[self.selected_index] == "Vibration":
             self.vibration = not self.vibration
             GAME_STATE["vibration"] = self.vibration
             save_data()
+        elif option == "Effects" and postfx.stages:
+            stage = postfx.stages[self.effect_index % len(postfx.stages)]
+            postfx.set_enabled(stage.name, not stage.enabled)
+            # 只保存这一项（命令行临时关闭的其他特效不写入存档）
+            GAME_STATE["effects"] = dict(GAME_STATE.get("effects", {}), **{stage.name: stage.enabled})
+            save_data()
+            self.invalidate()
+        elif option == "Quality":
+            # 回车循环切换画质
+            quality = GAME_STATE.get("quality", QUALITY_HIGH)
+            index = QUALITY_LEVELS.index(quality) if quality in QUALITY_LEVELS else 0
+            GAME_STATE["quality"] = QUALITY_LEVELS[(index + 1) % len(QUALITY_LEVELS)]
+            save_data()
+            self.invalidate()
+        elif option == "Pixel":
+            self._toggle_pixel_mode()
         elif option == "Return":
             self.next_scene = "menu"
 
     def update(self, dt):
         pass
 
+    @property
+    def animating(self):
+        # 只有动态特效（移动的扫描线等）开启时画面才会自己变化
+        return postfx.animated()
+
+    # 布局：选项行的起始位置和行高、操作提示的位置
+    OPTION_START_Y = 150
+    OPTION_SPACING = 56  # 文字形式的选项行的高度
+    # 比较高的选项行：音量条连同下面的数值、振动开关
+    OPTION_HEIGHTS = {"Volume": 80, "Vibration": 72}
+    HINT_Y = SCREEN_HEIGHT - 30
+
+    def _row_y(self, i):
+        """第 i 个选项行的纵坐标"""
+        return self.OPTION_START_Y + sum(self.OPTION_HEIGHTS.get(option, self.OPTION_SPACING)
+                                         for option in self.options[:i])
+
+    def _current_effect(self):
+        """Effects 选项当前显示的特效阶段"""
+        if not postfx.stages:
+            return None
+        return postfx.stages[self.effect_index % len(postfx.stages)]
+
+    def _row_state(self, i):
+        """第 i 个选项行的显示状态（状态不变时这一行的画面不变）"""
+        option = self.options[i]
+        effect = self._current_effect()
+        return (i == self.selected_index,
+                self.volume if option == "Volume" else None,
+                self.vibration if option == "Vibration" else None,
+                (effect.name, effect.enabled) if option == "Effects" and effect else None,
+                GAME_STATE.get("quality") if option == "Quality" else None,
+                GAME_STATE.get("pixel_mode", False) if option == "Pixel" else None)
+
+    def _row_rect(self, i):
+        """第 i 个选项行占据的区域（包括右侧的音量条/开关）"""
+        option = self.options[i]
+        return pygame.Rect(0, self._row_y(i) - 10, SCREEN_WIDTH, self.OPTION_HEIGHTS.get(option, self.OPTION_SPACING))
+
+    def _hint_rect(self):
+        return pygame.Rect(0, self.HINT_Y - 20, SCREEN_WIDTH, 40)
+
     def draw(self, screen):
-        # 背景
-        screen.fill((20, 20, 20))
-        
-        # 应用CRT效果
-        ui = UI()
-        ui.apply_effects(screen)
+        row_states = [self._row_state(i) for i in range(len(self.options))]
 
-        center_x = SCREEN_WIDTH // 2
-        
-        # 绘制标题
-        title_y = 80
-        title = self.title_font.render("SETTINGS", True, (255, 255, 0))
-        title_rect = title.get_rect(center=(center_x, title_y))
-        screen.blit(title, title_rect)
-        
-        # 绘制分隔线
-        line_y = title_y + 50
-        pygame.draw.line(screen, (100, 100, 100), (center_x - 200, line_y), (center_x + 200, line_y), 2)
-        
-        # 选项起始位置
-        option_start_y = 200
-        option_spacing = 120  # 选项之间的间距
-        
-        for i, option in enumerate(self.options):
-            option_y = option_start_y + i * option_spacing
-            is_selected = i == self.selected_index
-            
-            # 选项名称颜色
-            option_color = (255, 255, 0) if is_selected else (255, 255, 255)
-            
-            # 绘制选项名称（更靠左，避免与内容重叠）
-            option_text = self.option_font.render(option, True, option_color)
-            option_x = 150  # 左侧固定位置，给右侧内容留出空间
-            screen.blit(option_text, (option_x, option_y))
-            
-            # 绘制选项内容（右侧区域）
-            content_x = center_x + 50  # 内容区域从中心偏右开始
-            if option == "Volume":
-                self._draw_volume_setting(screen, content_x, option_y, is_selected)
-            elif option == "Vibration":
-                self._draw_vibration_setting(screen, content_x, option_y, is_selected)
-            elif option == "Return":
-                # Return选项不需要额外内容
-                pass
-        
-        # 绘制操作提示
-        hint_y = SCREEN_HEIGHT - 60
-        if self.selected_index == 0:  # Volume
+        if self._needs_redraw(effects=True):
+            # 背景
+            screen.fill((20, 20, 20))
+
+            # 应用CRT效果
+            ui.apply_effects(screen)
+
+            center_x = SCREEN_WIDTH // 2
+
+            # 绘制标题
+            title_y = 80
+            title = self.title_font.render("SETTINGS", True, (255, 255, 0))
+            title_rect = title.get_rect(center=(center_x, title_y))
+            screen.blit(title, title_rect)
+
+            # 绘制分隔线
+            line_y = title_y + 50
+            pygame.draw.line(screen, (100, 100, 100), (center_x - 200, line_y), (center_x + 200, line_y), 2)
+
+            for i in range(len(self.options)):
+                self._draw_option(screen, i)
+            self._draw_hint(screen)
+        else:
+            # 画面静止（CRT 特效关闭）：只重画状态变化的选项行和操作提示，主循环只更新这些区域
+            for i, state in enumerate(row_states):
+                if state != self._drawn_rows[i]:
+                    rect = self._row_rect(i)
+                    screen.fill((20, 20, 20), rect)
+                    self._draw_option(screen, i)
+                    self.dirty_rects.append(rect)
+            if self.selected_index != self._drawn_hint:
+                rect = self._hint_rect()
+                screen.fill((20, 20, 20), rect)
+                self._draw_hint(screen)
+                self.dirty_rects.append(rect)
+
+        self._drawn_rows = row_states
+        self._drawn_hint = self.selected_index
+
+    def _draw_option(self, screen, i):
+        """绘制第 i 个选项：左侧名称 + 右侧内容"""
+        option = self.options[i]
+        option_y = self._row_y(i)
+        is_selected = i == self.selected_index
+
+        # 选项名称颜色
+        option_color = (255, 255, 0) if is_selected else (255, 255, 255)
+
+        # 绘制选项名称（更靠左，避免与内容重叠）
+        option_text = self.option_font.render(option, True, option_color)
+        option_x = 150  # 左侧固定位置，给右侧内容留出空间
+        screen.blit(option_text, (option_x, option_y))
+
+        # 绘制选项内容（右侧区域）
+        content_x = SCREEN_WIDTH // 2 + 50  # 内容区域从中心偏右开始
+        if option == "Volume":
+            self._draw_volume_setting(screen, content_x, option_y, is_selected)
+        elif option == "Vibration":
+            self._draw_vibration_setting(screen, content_x, option_y, is_selected)
+        elif option == "Effects":
+            effect = self._current_effect()
+            if effect is not None:
+                status = "ON" if effect.enabled else "OFF"
+                color = (100, 255, 120) if effect.enabled else (150, 150, 150)
+                self._draw_value(screen, content_x, option_y, f"{effect.label}: {status}", color, is_selected)
+        elif option == "Quality":
+            quality = GAME_STATE.get("quality", QUALITY_HIGH)
+            self._draw_value(screen, content_x, option_y, quality.upper(), (200, 220, 255), is_selected)
+        elif option == "Pixel":
+            enabled = GAME_STATE.get("pixel_mode", False)
+            status = "ON" if enabled else "OFF"
+            color = (100, 255, 120) if enabled else (150, 150, 150)
+            self._draw_value(screen, content_x, option_y, status, color, is_selected)
+        elif option == "Return":
+            # Return选项不需要额外内容
+            pass
+
+    def _draw_hint(self, screen):
+        """绘制操作提示"""
+        option = self.options[self.selected_index]
+        if option == "Volume":
             hint_text = "Use LEFT/RIGHT arrows to adjust volume"
-        elif self.selected_index == 1:  # Vibration
+        elif option == "Vibration":
             hint_text = "Press ENTER to toggle vibration"
+        elif option == "Effects":
+            hint_text = "LEFT/RIGHT to choose an effect, ENTER to toggle it"
+        elif option == "Quality":
+            hint_text = "Use LEFT/RIGHT arrows to change effect quality"
+        elif option == "Pixel":
+            hint_text = "LEFT/RIGHT or ENTER to toggle low-resolution pixel rendering"
         else:  # Return
             hint_text = "Press ENTER to return to menu"
-        
+
         hint_surface = self.hint_font.render(hint_text, True, (150, 150, 150))
-        hint_rect = hint_surface.get_rect(center=(center_x, hint_y))
+        hint_rect = hint_surface.get_rect(center=(SCREEN_WIDTH // 2, self.HINT_Y))
         screen.blit(hint_surface, hint_rect)
 
+    def _draw_value(self, screen, content_x, y, text, color, is_selected):
+        """绘制文字形式的设置值（选中时两侧显示左右箭头）"""
+        if is_selected:
+            text = f"< {text} >"
+        value_surface = self.value_font.render(text, True, color)
+        value_rect = value_surface.get_rect(center=(content_x, y + 20))
+        # 文字阴影
+        shadow_surface = self.value_font.render(text, True, (0, 0, 0))
+        screen.blit(shadow_surface, (value_rect.x + 2, value_rect.y + 2))
+        screen.blit(value_surface, value_rect)
+
     def _draw_volume_setting(self, screen, content_x, y, is_selected):
         """绘制音量设置（像素风格）"""
         # 音量条参数
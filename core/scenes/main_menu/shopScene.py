@@ -3,13 +3,23 @@ import math
 
 import pygame
 
+from core.assets import asset_manager
 from core.scenes.common.menu_navigation_mixin import confirm_pressed
 from core.scenes.scene import Scene
 from core.sound import sound_manager
 from utils.helper import save_data
 from utils.settings import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_STATE
 
+SHOP_BACKGROUND = "data/pictures/shop_background.png"
+SHOP_BEER = "data/pictures/characters/beer_with_ice.png"
+asset_manager.register_manifest("shop", [
+    (SHOP_BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT), False),
+    (SHOP_BEER, None, True),  # 原图：动画每帧按比例缩放
+])
+
 class ShopScene(Scene):
+    asset_manifests = ("shop",)
+
     def __init__(self):
         super().__init__()
         
@@ -21,13 +31,10 @@ class ShopScene(Scene):
 
         # 加载背景图
         project_root = Path(__file__).resolve().parents[3]
-        path = project_root / "data/pictures/shop_background.png"
-        img = pygame.image.load(path).convert()
-        self.background = pygame.transform.scale(img, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.background = asset_manager.image(SHOP_BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT))
 
         # 啤酒淡入淡出动画
-        beer_path = project_root / "data/pictures/characters/beer_with_ice.png"
-        self.beer_img_original = pygame.image.load(beer_path).convert_alpha()
+        self.beer_img_original = asset_manager.image(SHOP_BEER, alpha=True)
         w, h = self.beer_img_original.get_size()
         self.beer_base_size = (int(w * 0.3), int(h * 0.3))
         self.beer_img = pygame.transform.scale(self.beer_img_original, self.beer_base_size)
@@ -163,6 +170,11 @@ class ShopScene(Scene):
                     self.beer_state = None
                     self.next_scene = "menu"
 
+    @property
+    def animating(self):
+        # 只有购买啤酒的动画在播放时画面才会变化
+        return self.beer_state is not None
+
     def draw(self, screen):
         # 先绘制背景
         screen.blit(self.background, (0, 0))
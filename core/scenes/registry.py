@@ -0,0 +1,140 @@
+import importlib
+import re
+
+from core.loader import asset_loader
+
+
+class SceneSpec:
+    """
+    场景注册项
+    pattern: 场景名的正则（完整匹配），例如 "menu"、r"level_(\d)_(\d)"
+    module / class_name: 场景类所在模块和类名，第一次用到时才导入
+    args: 由匹配结果得到构造参数的函数，None 表示无参数
+    pooled: 无状态场景，退出后放回池中，下次进入时 reset 复用而不是重新创建
+    likely_next: 进入该场景后可能切换到的场景，空闲时提前预热；
+                 也可以是由匹配结果得到场景名列表的函数（例如关卡的下一关由场景名中的关卡号和生命数决定）
+    """
+
+    def __init__(self, pattern, module, class_name, args=None, pooled=False, likely_next=()):
+        self.pattern = re.compile(pattern)
+        self.module = module
+        self.class_name = class_name
+        self.args = args
+        self.pooled = pooled
+        self.likely_next = likely_next
+
+    def scene_class(self):
+        return getattr(importlib.import_module(self.module), self.class_name)
+
+    def scene_args(self, match):
+        return self.args(match) if self.args else ()
+
+    def next_scenes(self, match):
+        return self.likely_next(match) if callable(self.likely_next) else self.likely_next
+
+
+class SceneRegistry:
+    """
+    场景注册表：按名字创建场景，复用池中的无状态场景，并预热可能的下一个场景。
+    - create(name) 创建/复用场景并调用 on_enter
+    - release(scene) 调用 on_exit，可复用的场景放回池中
+    - prewarm_step() 主循环每帧调用一次，每次最多预热一个场景：
+      可复用的场景直接创建好放进池里；其他场景导入模块，并把图片交给后台加载器解码
+    """
+
+    def __init__(self, specs):
+        self.specs = list(specs)
+        self.pool = {}  # 场景名 -> 空闲的场景实例
+        self.prewarm_queue = []
+
+    def _match(self, name):
+        for spec in self.specs:
+            match = spec.pattern.fullmatch(name or "")
+            if match:
+                return spec, match
+        return None, None
+
+    def create(self, name):
+        """按场景名创建场景，未知场景名返回 None"""
+        spec, match = self._match(name)
+        if spec is None:
+            return None
+
+        scene = self.pool.pop(name, None)
+        if scene is not None:
+            scene.reset()
+        else:
+            scene = spec.scene_class()(*spec.scene_args(match))
+        scene.scene_name = name
+        scene.on_enter()
+
+        # 场景自己用到的大图（例如关卡结束时的对话图片）在场景运行期间后台解码
+        self._request_assets(spec, match)
+        self.prewarm_queue = list(spec.next_scenes(match))
+        return scene
+
+    def release(self, scene):
+        """场景退出"""
+        scene.on_exit()
+        name = getattr(scene, "scene_name", None)
+        spec, _ = self._match(name)
+        if spec is not None and spec.pooled:
+            self.pool[name] = scene
+
+    def prewarm(self, name):
+        """预热一个场景"""
+        spec, match = self._match(name)
+        if spec is None:
+            return
+
+        scene_class = self._request_assets(spec, match)
+        if spec.pooled and name not in self.pool:
+            self.pool[name] = scene_class(*spec.scene_args(match))
+
+    @staticmethod
+    def _request_assets(spec, match):
+        """把场景的清单和 prewarm_assets 交给后台加载器（已缓存的图片会被跳过），返回场景类"""
+        scene_class = spec.scene_class()
+        for manifest in scene_class.asset_manifests:
+            asset_loader.request_manifest(manifest)
+        for request in scene_class.prewarm_assets(*spec.scene_args(match)):
+            asset_loader.request_image(**request)
+        return scene_class
+
+    def prewarm_step(self):
+        """主循环每帧调用：预热队列中的下一个场景，并登记后台加载完成的图片"""
+        if self.prewarm_queue:
+            self.prewarm(self.prewarm_queue.pop(0))
+        asset_loader.poll()
+
+
+def _level_next(match):
+    """关卡的下一个场景：胜利进入下一关（第三关进入通关画面），失败减一条命重来（没有命时进入失败画面）"""
+    level, life = int(match.group(1)), int(match.group(2))
+    win = f"level_{level + 1}_{life}" if level < 3 else "level_win"
+    lose = f"level_{level}_{life - 1}" if life > 1 else "level_lose"
+    return win, lose
+
+
+SCENES = [
+    SceneSpec("menu", "core.scenes.main_menu.menuScene", "MenuScene", pooled=True, likely_next=("mode",)),
+    SceneSpec("mode", "core.scenes.main_menu.modeScene", "ModeScene", pooled=True,
+              likely_next=("select", "endless")),
+    SceneSpec("select", "core.scenes.main_menu.selectScene", "SelectScene", pooled=True,
+              likely_next=("level_1_3", "level_2_3", "level_3_3", "mode")),
+    SceneSpec("help", "core.scenes.main_menu.helpScene", "HelpScene", pooled=True, likely_next=("menu",)),
+    SceneSpec("credits", "core.scenes.main_menu.creditsScene", "CreditsScene", pooled=True, likely_next=("menu",)),
+    SceneSpec("setting", "core.scenes.main_menu.settingScene", "SettingScene", pooled=True, likely_next=("menu",)),
+    SceneSpec("shop", "core.scenes.main_menu.shopScene", "ShopScene", likely_next=("menu",)),
+    SceneSpec("endless", "core.scenes.gameplay.endlessScene", "EndlessScene", likely_next=("gameover",)),
+    SceneSpec("gameover", "core.scenes.gameplay.gameoverScene", "GameoverScene", likely_next=("menu",)),
+    SceneSpec("level_win", "core.scenes.gameplay.levelendScene", "LevelendScene", args=lambda m: (True,),
+              likely_next=("menu",)),
+    SceneSpec("level_lose", "core.scenes.gameplay.levelendScene", "LevelendScene", args=lambda m: (False,),
+              likely_next=("menu",)),
+    SceneSpec(r"level_([1-3])_([1-3])", "core.scenes.gameplay.levelScene", "LevelScene",
+              args=lambda m: (m.group(0),), likely_next=_level_next),
+]
+
+# 全局场景注册表
+scene_registry = SceneRegistry(SCENES)
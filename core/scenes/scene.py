@@ -1,5 +1,7 @@
 import pygame
 
+from core.assets import asset_manager
+from core.postfx import postfx
 from core.sound import sound_manager
 
 
@@ -13,11 +15,20 @@ def get_joystick():
 
 
 class Scene:
+    # 场景需要的图片清单名（见 core.assets），进入场景时预加载，退出时释放
+    asset_manifests = ()
+
     def __init__(self):
         self.next_scene = ""
         self.joystick = get_joystick()
         self.sound_manager = sound_manager
 
+        # 脏矩形模式：draw 之后主循环读取 dirty_rects，None 表示整屏刷新（flip），
+        # 列表表示只把这些区域更新到屏幕上（空列表表示画面没有变化）
+        self.dirty_rects = None
+        # 下一帧需要整屏重绘（进入场景、窗口被遮挡后恢复时）
+        self.full_redraw = True
+
         super().__init__()
 
     def handle_events(self, events):
@@ -28,3 +39,59 @@ class Scene:
 
     def draw(self, screen):
         raise NotImplementedError
+
+    @classmethod
+    def prewarm_assets(cls, *args):
+        """
+        预热时需要提前在后台解码的图片（清单之外的），
+        返回 asset_loader.request_image 的参数字典列表；args 与构造参数相同
+        """
+        return []
+
+    def reset(self):
+        """从场景池中复用时调用：恢复到刚创建时的状态"""
+        self.next_scene = ""
+        self.joystick = get_joystick()
+
+    @property
+    def animating(self):
+        """
+        画面是否在持续变化（物理模拟、动画、动态特效）。
+        返回 False 时主循环不再按 FPS 刷新，而是阻塞等待输入（有输入时立即唤醒），
+        最多等待 idle_timeout() 秒
+        """
+        return True
+
+    def idle_timeout(self):
+        """静止时最多等待多久（秒）必须再画一帧（例如背景动画的下一帧），None 表示只等输入"""
+        return None
+
+    def invalidate(self):
+        """要求下一帧整屏重绘"""
+        self.full_redraw = True
+
+    def _needs_redraw(self, state=(), effects=False):
+        """
+        静态场景的脏矩形模式：在 draw 开头调用，state 为决定画面内容的状态（可比较的元组）。
+        需要整屏重绘时（进入场景、窗口重绘、画面上有特效、state 变化）返回 True，dirty_rects 设为 None；
+        否则画面与上一帧相同，dirty_rects 设为空列表，本帧不需要绘制。
+        effects: 场景是否叠加了后期特效（移动的扫描线等动态特效开启时只能整屏重绘）
+        """
+        if self.full_redraw or (effects and postfx.animated()) or state != getattr(self, "_drawn_state", None):
+            self.full_redraw = False
+            self._drawn_state = state
+            self.dirty_rects = None
+            return True
+        self.dirty_rects = []
+        return False
+
+    def on_enter(self):
+        """成为当前场景时调用：引用图片清单，下一帧整屏重绘"""
+        self.full_redraw = True
+        for name in self.asset_manifests:
+            asset_manager.acquire(name)
+
+    def on_exit(self):
+        """切换到其他场景时调用：释放图片清单"""
+        for name in self.asset_manifests:
+            asset_manager.release(name)
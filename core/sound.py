@@ -8,6 +8,7 @@ class SoundManager:
         self.is_playing = False
         self.music_file = None
         self.sounds = {}  # 音效字典，用于存储不同事件的音效
+        self.sound_paths = {}  # 音效名 -> 文件路径（同一文件不重复加载）
 
         # 如果提供了音乐文件路径，则加载
         if music_file:
@@ -77,14 +78,21 @@ class SoundManager:
             return
 
         path = Path(filepath)
+        if name in self.sounds and self.sound_paths.get(name) == str(path):
+            return  # 已加载（例如启动时由 core.loader 在后台预加载）
         if not path.exists():
             print(f"音效文件 {filepath} 未找到！")
             return
         try:
-            self.sounds[name] = pygame.mixer.Sound(str(path))
+            self.add_sound(name, pygame.mixer.Sound(str(path)), filepath)
         except pygame.error as e:
             print(f"加载音效失败 ({filepath}): {e}")
 
+    def add_sound(self, name: str, sound, filepath: str):
+        """登记一个已经加载好的音效"""
+        self.sounds[name] = sound
+        self.sound_paths[name] = str(Path(filepath))
+
     def play_sound(self, name: str):
         """播放指定名字的音效，带存在性检查和异常处理。"""
         if name in self.sounds:
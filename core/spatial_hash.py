@@ -0,0 +1,92 @@
+import math
+
+
+class SpatialHash:
+    """
+    均匀网格空间哈希：按世界坐标把实体放进 cell_size 大小的格子里。
+    实体用包围盒 (left, top, right, bottom) 登记，可能同时占据多个格子；
+    碰撞检测只需要查询小球附近格子里的实体，而不是遍历全部实体。
+    query 按插入顺序返回结果，保证和逐个遍历列表时的判定顺序一致。
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}  # (cx, cy) -> {item: 插入序号}
+        self.items = {}  # item -> (插入序号, 格子范围)
+        self._counter = 0
+
+    def _cell_range(self, bounds):
+        left, top, right, bottom = bounds
+        size = self.cell_size
+        return (math.floor(left / size), math.floor(top / size),
+                math.floor(right / size), math.floor(bottom / size))
+
+    def _add_cells(self, item, order, cell_range):
+        cx1, cy1, cx2, cy2 = cell_range
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                self.cells.setdefault((cx, cy), {})[item] = order
+
+    def _remove_cells(self, item, cell_range):
+        cx1, cy1, cx2, cy2 = cell_range
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is None:
+                    continue
+                cell.pop(item, None)
+                if not cell:
+                    del self.cells[(cx, cy)]
+
+    def insert(self, item, bounds):
+        """登记实体（已存在时等同于 move）"""
+        if item in self.items:
+            self.move(item, bounds)
+            return
+        cell_range = self._cell_range(bounds)
+        order = self._counter
+        self._counter += 1
+        self.items[item] = (order, cell_range)
+        self._add_cells(item, order, cell_range)
+
+    def remove(self, item):
+        """移除实体（不存在时忽略）"""
+        entry = self.items.pop(item, None)
+        if entry is not None:
+            self._remove_cells(item, entry[1])
+
+    def move(self, item, bounds):
+        """实体移动后更新格子；仍在原来的格子范围内时不做任何事"""
+        entry = self.items.get(item)
+        if entry is None:
+            self.insert(item, bounds)
+            return
+        order, old_range = entry
+        cell_range = self._cell_range(bounds)
+        if cell_range == old_range:
+            return
+        self._remove_cells(item, old_range)
+        self.items[item] = (order, cell_range)
+        self._add_cells(item, order, cell_range)
+
+    def query(self, bounds):
+        """返回与包围盒所在格子重叠的实体（按插入顺序，可能包含包围盒并不相交的实体）"""
+        cx1, cy1, cx2, cy2 = self._cell_range(bounds)
+        found = {}
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return sorted(found, key=found.__getitem__)
+
+    def clear(self):
+        self.cells.clear()
+        self.items.clear()
+        self._counter = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.items
@@ -0,0 +1,44 @@
+from collections import OrderedDict
+
+
+class SpriteCache:
+    """
+    预烘焙精灵缓存（LRU）：key -> 带透明通道的 Surface。
+    实体的外观只取决于少数几个参数（颜色、半径、缩放、动画相位……），
+    第一次用到某组参数时调用 bake() 画好，之后每帧只需要 blit 一次。
+    key 的第一项约定为实体类型名，避免不同实体之间冲突。
+    返回的 Surface 是共享的，调用方只能 blit，不要修改它。
+    """
+
+    def __init__(self, max_sprites=4096):
+        self.max_sprites = max_sprites
+        self.sprites = OrderedDict()
+
+        # 命中统计（调试用）
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, bake):
+        """获取精灵；不在缓存中时调用 bake() 生成"""
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = bake()
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)
+        return sprite
+
+    def clear(self):
+        self.sprites.clear()
+
+    def __len__(self):
+        return len(self.sprites)
+
+
+# 全局精灵缓存
+sprite_cache = SpriteCache()
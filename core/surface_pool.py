@@ -0,0 +1,56 @@
+import pygame
+
+
+class SurfacePool:
+    """
+    渲染目标池：按名字复用每帧都要用到的临时 Surface（游戏区域、低分辨率目标、渐变/暂停遮罩……），
+    不同场景之间也共用同一个。只有尺寸或格式（flags、显示器像素格式）变化时才重新分配。
+    返回的 Surface 内容是上一次使用留下的，调用方需要自己 fill。
+    主循环每帧调用 end_frame()；last_frame_allocations 是上一帧新分配的数量，
+    正常运行时应该一直是 0，不为 0 说明有渲染目标在每帧重新创建。
+    """
+
+    def __init__(self):
+        self.surfaces = {}  # 名字 -> (格式, Surface)
+
+        # 分配统计（调试用）
+        self.allocations = 0
+        self.frame_allocations = 0
+        self.last_frame_allocations = 0
+
+    @staticmethod
+    def _display_bitsize():
+        display = pygame.display.get_surface()
+        return display.get_bitsize() if display is not None else None
+
+    def get(self, name, size, flags=0):
+        """获取名为 name 的渲染目标（flags 可以是 pygame.SRCALPHA）"""
+        size = (int(size[0]), int(size[1]))
+        surface_format = (size, flags, self._display_bitsize())
+        entry = self.surfaces.get(name)
+        if entry is not None and entry[0] == surface_format:
+            return entry[1]
+
+        surface = pygame.Surface(size, flags)
+        if surface_format[2] is not None:
+            # 转成显示器的像素格式，blit 到屏幕时不需要再转换
+            surface = surface.convert_alpha() if flags & pygame.SRCALPHA else surface.convert()
+        self.surfaces[name] = (surface_format, surface)
+        self.allocations += 1
+        self.frame_allocations += 1
+        return surface
+
+    def end_frame(self):
+        """每帧结束时调用：记录本帧的分配次数"""
+        self.last_frame_allocations = self.frame_allocations
+        self.frame_allocations = 0
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def __len__(self):
+        return len(self.surfaces)
+
+
+# 全局渲染目标池
+surface_pool = SurfacePool()
@@ -0,0 +1,32 @@
+class FixedTimestep:
+    """
+    固定步长累加器：渲染帧的 dt 累加进来，按固定的 step_dt 切成若干物理步。
+    单帧最多执行 max_substeps 步，多余的时间直接丢弃，避免卡顿后越追越慢。
+    """
+
+    def __init__(self, step_dt, max_substeps=5):
+        self.step_dt = step_dt
+        self.max_substeps = max_substeps
+        self.accumulator = 0.0
+
+    def advance(self, dt):
+        """累加本帧时间，返回本帧需要执行的物理步数"""
+        self.accumulator += max(0.0, dt)
+
+        steps = int(self.accumulator / self.step_dt)
+        if steps > self.max_substeps:
+            # 追帧上限：丢掉追不上的时间
+            steps = self.max_substeps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_dt
+
+        return steps
+
+    @property
+    def alpha(self):
+        """插值系数（0~1）：上一物理状态与当前物理状态之间的渲染位置"""
+        return min(1.0, self.accumulator / self.step_dt)
+
+    def reset(self):
+        self.accumulator = 0.0
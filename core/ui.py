@@ -1,88 +1,182 @@
+import math
 import random
 
 import pygame
 
-from utils.settings import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_STATE
+try:
+    import numpy
+except ImportError:
+    numpy = None  # 没有 numpy 时色差效果自动关闭
+
+from core.font_cache import font_cache
+from core.glyph_atlas import GlyphAtlas, TextLabel
+from core.postfx import postfx, TARGET_GAME, TARGET_SCREEN
+from core.surface_pool import surface_pool
+from utils.settings import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_STATE, QUALITY_HIGH, QUALITY_MEDIUM
 
 
 class UI:
+    """
+    UI/特效渲染服务，全局共享一个实例（模块底部的 ui），不要每帧创建。
+    主循环每帧调用 begin_frame(dt)，CRT 动画状态在 begin_frame 中推进；
+    CRT 特效注册在后期特效流水线中（core/postfx.py）。
+    """
+
+    # 醉酒效果旋转角度的量化步长（度）
+    FUZZY_ANGLE_STEP = 0.25
+
     def __init__(self, font_size=26):
-        pygame.font.init()
-        # 使用像素风格字体（如果系统有的话）
-        try:
-            self.font = pygame.font.Font(None, font_size)
-        except:
-            self.font = pygame.font.SysFont("Courier", font_size)
+        self.font_size = font_size
+        self._font = None  # 第一次使用时再加载（模块导入时 pygame 可能还没初始化）
 
         self.crt_time = 0.0
-        self.scanline_offset = 0
-
-    def _draw_text(self, screen, text, x, y, color=(255, 255, 255)):
-        surface = self.font.render(text, True, color)
+        self.scanline_offset = 0.0
+        self.scanline_speed = 30.0  # 扫描线移动速度（像素/秒）
+        self.scanline_spacing = 3
+        self._crt_overlays = {}  # (宽, 高, 间距) -> 每个扫描线相位一张叠加层
+
+        # 醉酒效果的位移表：(宽, 高, 角度档位) -> 条带位移
+        self._warp_tables = {}
+
+        self._register_effects()
+
+        # HUD 文字：(字体, 颜色) -> 字形图集；标签名 -> TextLabel（文字不变时不重新渲染）
+        self._atlases = {}
+        self._labels = {}
+
+    @property
+    def font(self):
+        if self._font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            # 使用像素风格字体（如果系统有的话）
+            try:
+                self._font = pygame.font.Font(None, self.font_size)
+            except:
+                self._font = pygame.font.SysFont("Courier", self.font_size)
+        return self._font
+
+    def begin_frame(self, dt):
+        """每帧开始时调用：推进 CRT 动画"""
+        self.crt_time += dt
+        self.scanline_offset = (self.scanline_offset + self.scanline_speed * dt) % self.scanline_spacing
+
+    def _register_effects(self):
+        """
+        把 CRT 特效注册到后期特效流水线（见 core/postfx.py），按顺序执行：
+        色差（中画质以上）→ 扫描线 + 边缘渐暗 → 故障横线。
+        像素化不在流水线中，见 GameMixin 的低分辨率渲染模式（GAME_STATE["pixel_mode"]）
+        """
+        postfx.register("aberration", self._aberration_stage, "ABERRATION", min_quality=QUALITY_MEDIUM)
+        postfx.register("scanlines", self._scanline_stage, "SCANLINES", animated=True)
+        postfx.register("glitch", self._glitch_lines_stage, "GLITCH", animated=True)
+
+    def _aberration_stage(self, surface, quality):
+        # 高画质逐行处理；中画质隔行处理（画面带隔行条纹，样子与高画质不同）
+        self._chromatic_aberration(surface, interlace=1 if quality == QUALITY_HIGH else 2)
+
+    def _scanline_stage(self, surface, quality):
+        # 扫描线 + 边缘渐暗：一次 blit 预烘焙的叠加层
+        # 叠加层是全屏大小，贴在 (0, 0)，绘制到游戏区域时超出部分被裁掉（与原来逐行绘制一致）
+        surface.blit(self._crt_overlay(), (0, 0))
+
+    def _glitch_lines_stage(self, surface, quality):
+        self._glitch_lines(surface)
+
+    def _label(self, name, font, color):
+        """获取名为 name 的 HUD 标签"""
+        label = self._labels.get(name)
+        if label is None or label.atlas.font is not font or label.atlas.color != tuple(color):
+            key = (font, tuple(color))
+            atlas = self._atlases.get(key)
+            if atlas is None:
+                atlas = self._atlases[key] = GlyphAtlas(font, color)
+            label = self._labels[name] = TextLabel(atlas)
+        return label
+
+    def _draw_text(self, screen, name, text, x, y, color=(255, 255, 255)):
+        surface = self._label(name, self.font, color).render(text)
         screen.blit(surface, (x, y))
 
-    # 增强的扫描线效果（带轻微移动）
-    def _scanlines(self, screen, spacing=3, intensity=0.15):
-        self.scanline_offset += 0.5
-        if self.scanline_offset >= spacing:
-            self.scanline_offset = 0
-
-        for y in range(0, SCREEN_HEIGHT, spacing):
-            # 创建半透明黑色扫描线
-            scanline_y = int(y + self.scanline_offset)
-            if 0 <= scanline_y < SCREEN_HEIGHT:
-                alpha = int(255 * intensity)
-                scanline_surface = pygame.Surface((SCREEN_WIDTH, 1))
-                scanline_surface.set_alpha(alpha)
-                scanline_surface.fill((0, 0, 0))
-                screen.blit(scanline_surface, (0, scanline_y))
-
-    # CRT边缘弯曲效果（优化版）
-    def _crt_curvature(self, screen):
-        # 创建边缘渐暗效果（使用更高效的方法）
+    # CRT 叠加层：扫描线（带轻微移动）+ 边缘渐暗，按分辨率预先烘焙
+    def _bake_crt_overlay(self, phase, spacing=3, intensity=0.15):
+        """
+        烘焙一张全屏叠加层：边缘渐暗 + 第 phase 相位的扫描线。
+        原来两层黑色半透明效果依次混合，这里把 alpha 预先合成为
+        1 - (1 - a1)(1 - a2)，一次 blit 的结果与逐层绘制误差不超过 1。
+        """
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 0))
 
-        # 只在边缘区域绘制渐暗效果
+        # 边缘渐暗效果（只在左右边缘区域）
         fade_width = int(SCREEN_WIDTH * 0.3)
+        column_alpha = [0] * SCREEN_WIDTH
         for x in range(fade_width):
             fade = 1 - (x / fade_width)
             alpha = int(fade * 30)
+            column_alpha[x] = column_alpha[SCREEN_WIDTH - x - 1] = alpha
             pygame.draw.line(overlay, (0, 0, 0, alpha), (x, 0), (x, SCREEN_HEIGHT))
             pygame.draw.line(overlay, (0, 0, 0, alpha), (SCREEN_WIDTH - x - 1, 0),
                              (SCREEN_WIDTH - x - 1, SCREEN_HEIGHT))
 
-        screen.blit(overlay, (0, 0))
+        # 扫描线所在的行：与边缘渐暗合成后的 alpha
+        scan_alpha = int(255 * intensity)
+        row = pygame.Surface((SCREEN_WIDTH, 1), pygame.SRCALPHA)
+        for x, alpha in enumerate(column_alpha):
+            row.set_at((x, 0), (0, 0, 0, 255 - (255 - scan_alpha) * (255 - alpha) // 255))
 
-    # CRT色差效果（RGB分离）
-    # TODO: 加了这个就非常卡
-    def _chromatic_aberration(self, screen, intensity=1):
-        if intensity <= 0:
-            return screen
+        for y in range(0, SCREEN_HEIGHT, spacing):
+            scanline_y = y + phase
+            if 0 <= scanline_y < SCREEN_HEIGHT:
+                # 合成后的 alpha 总是不小于渐暗的 alpha，取最大值即覆盖这一行
+                overlay.blit(row, (0, scanline_y), special_flags=pygame.BLEND_RGBA_MAX)
 
-        # 创建RGB分离效果
-        r_channel = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        g_channel = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        b_channel = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        return overlay
 
-        # 提取RGB通道
-        for x in range(SCREEN_WIDTH):
-            for y in range(SCREEN_HEIGHT):
-                color = screen.get_at((x, y))
-                r_channel.set_at((x, y), (color[0], 0, 0))
-                g_channel.set_at((x, y), (0, color[1], 0))
-                b_channel.set_at((x, y), (0, 0, color[2]))
+    def _crt_overlay(self):
+        """当前扫描线相位对应的叠加层（每种分辨率烘焙一次）"""
+        key = (SCREEN_WIDTH, SCREEN_HEIGHT, self.scanline_spacing)
+        overlays = self._crt_overlays.get(key)
+        if overlays is None:
+            overlays = [self._bake_crt_overlay(phase, self.scanline_spacing)
+                        for phase in range(self.scanline_spacing)]
+            self._crt_overlays[key] = overlays
 
-        # 创建最终表面
-        result = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        result.fill((0, 0, 0))
+        # 偏移量由 begin_frame 按时间推进
+        return overlays[int(self.scanline_offset) % self.scanline_spacing]
 
-        # 轻微偏移RGB通道
+    # CRT色差效果（RGB分离）
+    def _chromatic_aberration(self, screen, intensity=1, interlace=1):
+        """
+        红色通道左移、蓝色通道右移 intensity 像素（原地修改 screen）。
+        用 surfarray 直接操作像素数组，没有逐像素的 Python 循环；移出画面的边缘补黑。
+        interlace > 1 时只处理每 interlace 行中的一行（隔行模式，开销按比例降低），其余行保持原样，画面带隔行条纹。
+        （半分辨率计算后写回每一行的做法写入量不变，实测比逐行处理还慢，所以没有采用）
+        没有安装 numpy 时不做任何处理。
+        """
         offset = int(intensity)
-        result.blit(r_channel, (-offset, 0))
-        result.blit(g_channel, (0, 0))
-        result.blit(b_channel, (offset, 0))
+        if offset <= 0 or numpy is None:
+            return screen
 
-        return result
+        width = screen.get_width()
+        if offset >= width:
+            return screen
+
+        pixels = pygame.surfarray.pixels3d(screen)  # (宽, 高, 3) 的视图，修改会直接写回 screen
+        try:
+            rows = pixels[:, ::interlace] if interlace > 1 else pixels
+            red = rows[:, :, 0]
+            blue = rows[:, :, 2]
+
+            red[:-offset] = red[offset:]
+            red[-offset:] = 0
+            blue[offset:] = blue[:-offset]
+            blue[:offset] = 0
+        finally:
+            # 释放数组，解除 Surface 锁定
+            del pixels
+
+        return screen
 
     # 坏死横线 glitch（增强版）
     def _glitch_lines(self, screen, chance=0.01):
@@ -111,29 +205,67 @@ class UI:
                         # 如果subsurface失败，就跳过这个效果
                         pass
 
-    # 像素化效果（可选）
-    # TODO: 效果不是很明显，但是不一定要非常明显也
-    def _pixelation(self, screen, pixel_size=2):
-        if pixel_size <= 1:
-            return screen
-
-        small_screen = pygame.transform.scale(
-            screen,
-            (SCREEN_WIDTH // pixel_size, SCREEN_HEIGHT // pixel_size)
-        )
-        return pygame.transform.scale(small_screen, (SCREEN_WIDTH, SCREEN_HEIGHT))
-
-    def fuzzy(self, screen, intensity=5):
+    def _shear_bands(self, length, factor):
         """
-        模拟醉酒视觉效果
-        :param screen: pygame.Surface
-        :param intensity: 效果强度，像素偏移量
+        一个方向上的剪切：第 i 行（或列）平移 round(factor * (i + 0.5 - length / 2)) 像素，
+        平移量相同的相邻行合并成一条，返回 [(起始, 条宽, 平移量), ...]。
+        小角度下平移量变化很慢，一个方向只有十几二十条。
+        """
+        bands = []
+        for i in range(length):
+            shift = round(factor * (i + 0.5 - length / 2))
+            if bands and bands[-1][2] == shift:
+                start, size, _ = bands[-1]
+                bands[-1] = (start, size + 1, shift)
+            else:
+                bands.append((i, 1, shift))
+        return bands
+
+    def _warp_table(self, width, height, angle_index):
+        """
+        旋转 angle_index * FUZZY_ANGLE_STEP 度的位移表（每种尺寸和角度只计算一次）。
+        旋转分解成 水平剪切 → 垂直剪切 → 水平剪切 三步（Paeth 分解），
+        每一步都是按条带平移，返回 (水平剪切条带, 垂直剪切条带)
+        """
+        key = (width, height, angle_index)
+        table = self._warp_tables.get(key)
+        if table is None:
+            theta = math.radians(angle_index * self.FUZZY_ANGLE_STEP)
+            # 方向与 pygame.transform.rotate 一致（正角度逆时针）
+            table = (self._shear_bands(height, math.tan(theta / 2)),
+                     self._shear_bands(width, -math.sin(theta)))
+            self._warp_tables[key] = table
+        return table
+
+    @staticmethod
+    def _shear(source, target, bands, horizontal):
+        """按条带位移表把 source 平移到 target（水平剪切按行，垂直剪切按列）"""
+        width, height = source.get_size()
+        black = (0, 0, 0)
+        if horizontal:
+            target.blits([(source, (shift, y), (0, y, width, size)) for y, size, shift in bands], doreturn=False)
+            for y, size, shift in bands:
+                if shift > 0:
+                    target.fill(black, (0, y, shift, size))
+                elif shift < 0:
+                    target.fill(black, (width + shift, y, -shift, size))
+        else:
+            target.blits([(source, (x, shift), (x, 0, size, height)) for x, size, shift in bands], doreturn=False)
+            for x, size, shift in bands:
+                if shift > 0:
+                    target.fill(black, (x, 0, size, shift))
+                elif shift < 0:
+                    target.fill(black, (x, height + shift, size, -shift))
+
+    def fuzzy(self, surface, intensity=5):
+        """
+        模拟醉酒视觉效果：画面随机平移并小角度旋转，露出的边缘为黑色
+        :param surface: pygame.Surface（游戏区域）
+        :param intensity: 效果强度，像素偏移量（旋转角度最大为 intensity / 2 度）
+        旋转用预先计算的条带位移表完成（整块 blit，不逐像素计算），角度量化到 FUZZY_ANGLE_STEP 度
         """
         if intensity <= 0:
-            return screen
-
-        # 创建副本
-        temp = screen.copy()
+            return surface
 
         # 随机水平和垂直偏移
         offset_x = random.randint(-intensity, intensity)
@@ -141,42 +273,46 @@ class UI:
 
         # 随机旋转角度（小角度）
         angle = random.uniform(-intensity / 2, intensity / 2)
-
-        # 旋转图像
-        rotated = pygame.transform.rotate(temp, angle)
-
-        # 获取旋转后图像的矩形中心
-        rect = rotated.get_rect(center=(SCREEN_WIDTH // 2 + offset_x, SCREEN_HEIGHT // 2 + offset_y))
-
-        # 清屏
-        screen.fill((0, 0, 0))
-
-        # 绘制扭曲后的图像
-        screen.blit(rotated, rect.topleft)
-
-        return screen
-
-    def apply_effects(self, screen):
-        self._scanlines(screen)
-        self._crt_curvature(screen)
-        self._glitch_lines(screen)
-        # TODO: 像素化效果可选
-        self._pixelation(screen)
+        angle_index = round(angle / self.FUZZY_ANGLE_STEP)
+
+        width, height = surface.get_size()
+        rows, columns = self._warp_table(width, height, angle_index)
+        first = surface_pool.get("fuzzy_a", (width, height))
+        second = surface_pool.get("fuzzy_b", (width, height))
+
+        # 水平剪切 → 垂直剪切 → 水平剪切；每一步只需把平移后露出的边缘涂黑
+        self._shear(surface, first, rows, horizontal=True)
+        self._shear(first, second, columns, horizontal=False)
+        self._shear(second, first, rows, horizontal=True)
+
+        # 绘制扭曲后的图像，露出的边缘涂黑
+        surface.blit(first, (offset_x, offset_y))
+        if offset_x > 0:
+            surface.fill((0, 0, 0), (0, 0, offset_x, height))
+        elif offset_x < 0:
+            surface.fill((0, 0, 0), (width + offset_x, 0, -offset_x, height))
+        if offset_y > 0:
+            surface.fill((0, 0, 0), (0, 0, width, offset_y))
+        elif offset_y < 0:
+            surface.fill((0, 0, 0), (0, height + offset_y, width, -offset_y))
+
+        return surface
+
+    def apply_effects(self, screen, target=TARGET_SCREEN):
+        """对 screen 执行后期特效流水线（target：游戏区域或整个屏幕）"""
+        postfx.run(screen, target)
 
     def game_ui(self, screen, score, coins=0, progress=0.0):
-        self.apply_effects(screen)
-
-        # 更新CRT时间
-        self.crt_time += 0.016  # 假设60fps
+        self.apply_effects(screen, TARGET_GAME)
 
         # 左上角显示分数（像素风格）
-        self._draw_text(screen, f"SCORE: {score:06d}", 20, 20, (255, 255, 0))
+        self._draw_text(screen, "score", f"SCORE: {score:06d}", 20, 20, (255, 255, 0))
 
         # 显示金币数
-        self._draw_text(screen, f"COINS: {coins}", 20, 50, (255, 215, 0))
+        self._draw_text(screen, "coins", f"COINS: {coins}", 20, 50, (255, 215, 0))
 
         # 绘制啤酒数量
-        self._draw_text(screen, f"BEER: {GAME_STATE.get('beer', 0)}", 20, 80, (255, 180, 50))
+        self._draw_text(screen, "beer", f"BEER: {GAME_STATE.get('beer', 0)}", 20, 80, (255, 180, 50))
 
         # 绘制进度条
         if progress > 0:
@@ -211,8 +347,7 @@ class UI:
         # 绘制百分比文字
         percent_text = f"{int(progress * 100)}%"
         try:
-            font = pygame.font.SysFont("Courier", 16)
-            text = font.render(percent_text, True, (255, 255, 255))
+            text = self._label("progress", font_cache.font(16, face="Courier"), (255, 255, 255)).render(percent_text)
             text_rect = text.get_rect(center=(bar_x + bar_width // 2, bar_y + bar_height // 2))
             screen.blit(text, text_rect)
         except:
@@ -220,7 +355,10 @@ class UI:
 
     def menu_ui(self, screen):
         self.apply_effects(screen)
+        self.menu_stats(screen)
 
+    def menu_stats(self, screen):
+        """菜单上的 GAME_STATE 信息（只在数值变化时需要重画）"""
         # 绘制 GAME_STATE 信息
         state_color = (100, 255, 100)  # 柔和一点的绿色，不要太刺眼
 
@@ -245,3 +383,7 @@ class UI:
         text_surface = self.font.render(beer_text, True, (255, 180, 50))  # 金黄色
         text_rect = text_surface.get_rect(topright=(SCREEN_WIDTH - 40, 40))  # 右上角
         screen.blit(text_surface, text_rect)
+
+
+# 全局 UI 实例
+ui = UI()
@@ -0,0 +1,555 @@
+import random
+from contextlib import nullcontext
+
+from core.camera import Camera
+from core.spatial_hash import SpatialHash
+from entities.ball import Ball
+from entities.coin import Coin
+from entities.finishLine import FinishLine
+from entities.hole import Hole
+from entities.obstacle import MovingPlatform, Spring, Teleporter
+from entities.platform import Platform
+from utils.settings import GAME_STATE, GAME_WIDTH, GAME_HEIGHT, SCREEN_HEIGHT, BALL_BOUNCE, BALL_RADIUS, \
+    HOLE_RADIUS, BEER_DURATION, SIM_DT, GRID_CELL_SIZE, CHUNK_HEIGHT
+
+# 不计时的空区段（World.section 的默认值）
+_NO_SECTION = nullcontext()
+
+
+def _no_section(name):
+    return _NO_SECTION
+
+
+class World:
+    """
+    纯 Python 的游戏世界：持有小球、平台、洞口、金币、障碍物和终点线。
+    不导入 pygame，也不加载任何图片/音效/字体，可以脱离窗口以任意速度 step（测试、机器人、调参）。
+    场景只负责读取输入、消费 step 返回的事件（音效、结算）并绘制。
+    实体必须通过 add_* 方法加入世界，以便同时登记到碰撞网格（空间哈希）中。
+
+    step 返回的事件：
+        "coin" / "spring" / "teleport" / "hole"  与实体发生交互
+        "fall_start" / "fall_stop"               小球开始/停止在平台下方掉落
+        "fall_out"                               掉落中的小球离开屏幕
+        "win" / "lose"                           本局结束（之后 step 不再推进）
+    """
+
+    def __init__(self):
+        # 计时区段：section(name) 返回上下文管理器，默认不计时；
+        # 场景可以换成 profiler.section（World 不导入渲染相关的模块）
+        self.section = _no_section
+
+        # 初始化平台
+        self.platform = Platform()
+
+        # 初始化小球在平台上方
+        self.ball = Ball(
+            bounce=BALL_BOUNCE,
+            x=GAME_WIDTH // 2,
+            y=self.platform.y1 - BALL_RADIUS - 100
+        )
+
+        self.holes = []
+
+        # 金币系统
+        self.coins = []
+        self.coins_collected = 0
+
+        # 障碍物系统
+        self.moving_platforms = []
+        self.springs = []
+        self.teleporters = []
+
+        self._next_pair_id = 0  # 传送门配对ID（用于颜色区分）
+
+        # 碰撞网格：每类实体一张，碰撞检测只查询小球附近的格子
+        self.hole_grid = SpatialHash(GRID_CELL_SIZE)
+        self.coin_grid = SpatialHash(GRID_CELL_SIZE)
+        self.moving_platform_grid = SpatialHash(GRID_CELL_SIZE)
+        self.spring_grid = SpatialHash(GRID_CELL_SIZE)
+        self.teleporter_grid = SpatialHash(GRID_CELL_SIZE)
+
+        # 终点线（只有关卡模式有）
+        self.finish_line = None
+
+        # 计分系统
+        self.score = 0
+        self.start_y = self.ball.y  # 记录起始位置，用于计算进度
+        self.last_distance = 0.0  # 上一次计算的距离，用于增量计算
+
+        # 道具系统
+        self.beer = False  # 是否使用啤酒道具
+        self.beer_timer = 0.0  # 啤酒道具持续时间（秒）
+
+        # 初始化摄像机
+        self.camera = Camera(self.ball.x, self.ball.y)
+        self.shake_timer = 0
+
+        # 小球状态（场景据此播放滚动/掉落音效）
+        self.ball_rolling = False
+        self.ball_falling = False
+        self.last_ball_y = self.ball.y  # 上一步小球Y坐标，用于检测高度持续降低
+
+        # 结算
+        self.finished = False
+        self.victory = False
+
+        self.events = []
+
+    # ---------------- 实体管理 ----------------
+    def add_hole(self, x, y):
+        hole = Hole(x=x, y=y)
+        self.holes.append(hole)
+        self.hole_grid.insert(hole, hole.bounds())
+        return hole
+
+    def add_coin(self, x, y):
+        coin = Coin(x=x, y=y)
+        self.coins.append(coin)
+        self.coin_grid.insert(coin, coin.bounds())
+        return coin
+
+    def add_moving_platform(self, x, y, **kwargs):
+        platform = MovingPlatform(x, y, **kwargs)
+        self.moving_platforms.append(platform)
+        self.moving_platform_grid.insert(platform, platform.bounds())
+        return platform
+
+    def add_spring(self, x, y):
+        spring = Spring(x, y)
+        self.springs.append(spring)
+        self.spring_grid.insert(spring, spring.bounds())
+        return spring
+
+    def add_teleporter_pair(self, x1, y1, x2, y2):
+        """创建一对互相传送的传送门"""
+        # 使用配对ID区分不同的传送门对
+        pair_id = self._next_pair_id
+        self._next_pair_id += 1
+        teleporter1 = Teleporter(x1, y1, x2, y2, pair_id=pair_id)
+        teleporter2 = Teleporter(x2, y2, x1, y1, pair_id=pair_id)
+        # 设置配对引用
+        teleporter1.pair_teleporter = teleporter2
+        teleporter2.pair_teleporter = teleporter1
+        self.teleporters.append([teleporter1, teleporter2])
+        self.teleporter_grid.insert(teleporter1, teleporter1.bounds())
+        self.teleporter_grid.insert(teleporter2, teleporter2.bounds())
+        return teleporter1, teleporter2
+
+    # ---------------- 输入 ----------------
+    def start_beer(self):
+        """开始啤酒慢动作效果（道具库存由调用方扣除）"""
+        if self.beer:
+            return False
+        self.beer = True
+        self.beer_timer = BEER_DURATION
+        GAME_STATE["slow_time"] = True
+        return True
+
+    # ---------------- 模拟 ----------------
+    def step(self, inputs=(), dt=SIM_DT):
+        """
+        推进一个固定物理步
+        inputs: 平台输入列表 [(left, right, up, speed_factor), ...]
+        返回本步产生的事件列表
+        """
+        self.events = []
+        if self.finished:
+            return self.events
+
+        # 记录上一步状态，用于渲染插值
+        self.ball.snapshot()
+        self.platform.snapshot()
+        self.camera.snapshot()
+
+        # 应用平台输入
+        if inputs:
+            for left, right, up, speed_factor in inputs:
+                self.platform.move(left, right, up, speed_factor=speed_factor)
+            self.ball.update(self.platform)
+
+        self._check_goal(dt)
+
+        # 检测小球是否在滚动和掉落
+        if not self.ball.is_falling_into_hole:
+            self._update_ball_state()
+
+        # 如果小球正在滚入洞口，更新动画
+        if self.ball.is_falling_into_hole:
+            if not self.ball_falling:
+                self.ball_falling = True
+                self.events.append("fall_start")
+
+            self.ball.update_fall_animation(dt)
+            # 动画完成后结束本局
+            if self.ball.is_animation_complete():
+                self.ball_falling = False
+                self._finish(False)
+        else:
+            self._update_entities(dt)
+
+            # 如果小球掉到屏幕下方（超过屏幕高度 + 一定缓冲距离），结束本局
+            screen_x, screen_y = self.camera.world_to_screen(self.ball.x, self.ball.y)
+            if screen_y > SCREEN_HEIGHT + 100 and not self.finished:
+                self.ball_falling = False
+                self._finish(False)
+
+        if self.beer:
+            GAME_STATE["slow_time"] = True
+            self.beer_timer -= dt
+            self.shake_timer = 50
+            if self.beer_timer <= 0:
+                self.beer = False
+                self.beer_timer = 0
+                GAME_STATE["slow_time"] = False
+
+        # 屏幕抖动计时
+        if self.shake_timer > 0:
+            self.shake_timer -= 1
+
+        # camera跟随ball
+        self.camera.follow(self.ball.x, self.ball.y, target_screen_x=self.ball.x)
+
+        return self.events
+
+    def _finish(self, victory):
+        if self.finished:
+            return
+        self.finished = True
+        self.victory = victory
+        if self.beer:
+            self.beer = False
+            GAME_STATE["slow_time"] = False
+        self.events.append("win" if victory else "lose")
+
+    def _check_goal(self, dt):
+        """子类可重写：检查胜利条件"""
+        pass
+
+    def compute_progress(self):
+        """距离终点的进度（0~1），没有终点时为 0"""
+        return 0
+
+    def _update_ball_state(self):
+        """根据小球和平台的位置判断滚动/掉落状态"""
+        # 检查小球是否在平台上
+        x1, y1 = 0, self.platform.y1
+        x2, y2 = GAME_WIDTH, self.platform.y2
+        dx = x2 - x1
+        dy = y2 - y1
+
+        if dx != 0:
+            k = dy / dx
+            b = y1
+            y_ground = k * self.ball.x + b
+            on_platform = abs(self.ball.y + BALL_RADIUS - y_ground) < 5  # 在平台上5像素范围内
+        else:
+            on_platform = False
+            y_ground = self.platform.y1
+
+        # 小球在滚动：在平台上且有明显的水平速度
+        self.ball_rolling = on_platform and abs(self.ball.vx) > 0.5
+
+        # 小球在平台下方：小球底部在平台下方
+        below_platform = (self.ball.y + BALL_RADIUS) > y_ground + 5
+        # 高度持续降低：Y坐标持续增加（向下是正方向）或垂直速度向下
+        height_decreasing = self.ball.y > self.last_ball_y or self.ball.vy > 0
+
+        # 如果小球在平台下方且高度持续降低，开始/继续掉落
+        if below_platform and height_decreasing:
+            if not self.ball_falling:
+                self.ball_falling = True
+                self.events.append("fall_start")
+        elif self.ball_falling:
+            # 如果小球不在平台下方或高度不再降低，停止掉落
+            self.ball_falling = False
+            self.events.append("fall_stop")
+
+        # 如果小球在掉落状态，继续检测
+        if self.ball_falling:
+            self.shake_timer = 40
+            # 如果掉出屏幕下方，停止掉落（即将结束本局）
+            screen_x, screen_y = self.camera.world_to_screen(self.ball.x, self.ball.y)
+            if screen_y > SCREEN_HEIGHT + 100:
+                self.ball_falling = False
+                self.events.append("fall_out")
+
+        # 更新上一步的Y坐标
+        self.last_ball_y = self.ball.y
+
+    def _update_entities(self, dt):
+        self.ball.update(self.platform, dt)
+
+        # 更新障碍物和金币
+        self._update_objects(dt)
+
+        # 碰撞边缘抖动
+        if self.ball.collision_side():
+            self.shake_timer = 10
+
+        # 判断是否碰撞洞口，如果碰撞则开始动画
+        with self.section("collisions"):
+            self._fall_into_hole()
+
+    def _update_score(self):
+        # 计算向下移动的距离（游戏是向下进行的）
+        # 使用Y坐标的差值：向下移动时，start_y > ball.y，所以是正数
+        distance_traveled = self.start_y - self.ball.y
+
+        # 只有当距离增加时才更新分数（避免后退时减少分数）
+        if distance_traveled > self.last_distance:
+            # 根据距离增加分数：每移动10像素 = 1分
+            score_increase = int((distance_traveled - self.last_distance) / 10)
+
+            if score_increase > 0:
+                self.score += score_increase
+                self.last_distance = distance_traveled
+
+    def _update_objects(self, dt):
+        """更新移动平台、弹簧、传送门和金币"""
+        # 实时增加分数（基于距离起点的位置）
+        if not self.ball.is_falling_into_hole:
+            self._update_score()
+
+        for platform in self.moving_platforms:
+            platform.update(dt)
+            self.moving_platform_grid.move(platform, platform.bounds())
+        for spring in self.springs:
+            spring.update(dt)
+        for teleporter_pair in self.teleporters:
+            for teleporter in teleporter_pair:
+                teleporter.update(dt)
+        for coin in self.coins:
+            coin.update(dt)
+
+        with self.section("collisions"):
+            self._check_collisions()
+
+    def _check_collisions(self):
+        """小球与移动平台、弹簧、传送门、金币的碰撞"""
+        # 碰撞检测只查询小球附近格子里的实体
+        for platform in self.moving_platform_grid.query(self.ball.bounds()):
+            if platform.check_collision(self.ball):
+                # 小球撞到移动平台，轻微反弹
+                self.ball.vy = -abs(self.ball.vy) * 0.3
+                self.shake_timer = 10
+
+        for spring in self.spring_grid.query(self.ball.bounds()):
+            if spring.check_collision(self.ball):
+                # 弹簧弹跳
+                self.ball.vy = -spring.bounce_power
+                self.shake_timer = 20
+                self.events.append("spring")
+
+        for teleporter in self.teleporter_grid.query(self.ball.bounds()):
+            tele_target = teleporter.check_collision(self.ball)
+            if tele_target:
+                # 传送
+                self.ball.x, self.ball.y = tele_target
+                self.ball.snapshot()  # 传送是瞬移，不做插值
+                self.ball.vx *= 0.5
+                self.ball.vy *= 0.5
+                self.shake_timer = 30
+                # 设置传送冷却时间（0.5秒，防止立即传回）
+                self.ball.teleport_cooldown = 0.5
+                self.events.append("teleport")
+                break  # 同一步只传送一次，不删除传送门对，允许重复使用
+
+        # 传送后小球位置已变，重新查询
+        for coin in self.coin_grid.query(self.ball.bounds()):
+            if coin.check_collision(self.ball) and not coin.collected:
+                coin.collect()
+                self.coin_grid.remove(coin)
+                self.coins_collected += 1
+                self.score += 50
+                self.shake_timer = 10
+                self.events.append("coin")
+
+    def _fall_into_hole(self):
+        for hole in self.hole_grid.query(self.ball.bounds()):
+            if hole.check_collision(self.ball) and not self.ball.is_falling_into_hole:
+                # 在开始动画前，确保最后一次距离计算完成
+                self._update_score()
+
+                self.ball.start_fall_animation(hole.x, hole.y)
+
+                self.shake_timer = 50
+                self.events.append("hole")
+                break
+
+
+class LevelWorld(World):
+    """关卡模式：实体来自 level.json，到达终点线即胜利"""
+
+    def __init__(self, level_data):
+        super().__init__()
+
+        # 初始化终点线
+        self.finish_line = FinishLine(level_data["finish_line_y"])
+
+        # 初始化洞口
+        for pos in level_data.get("holes", []):
+            self.add_hole(pos["x"], pos["y"])
+
+        # 初始化金币
+        for pos in level_data.get("coins", []):
+            self.add_coin(pos["x"], pos["y"])
+
+        # 初始化障碍物
+        for obstacle in level_data.get("obstacles", []):
+            if obstacle["type"] == "moving_platform":
+                self.add_moving_platform(obstacle["x"], obstacle["y"], width=obstacle["width"],
+                                         height=obstacle["height"], direction=obstacle["direction"])
+            elif obstacle["type"] == "spring":
+                self.add_spring(obstacle["x"], obstacle["y"])
+            elif obstacle["type"] == "teleporterPair":
+                self.add_teleporter_pair(obstacle["x1"], obstacle["y1"], obstacle["x2"], obstacle["y2"])
+
+    def _check_goal(self, dt):
+        # 更新终点线动画
+        self.finish_line.update(dt)
+
+        # 检查是否到达终点
+        if self.finish_line.check_reached(self.ball):
+            self._finish(True)
+
+    def compute_progress(self):
+        total_distance = abs(self.start_y - self.finish_line.y)
+        current_distance = abs(self.ball.y - self.finish_line.y)
+
+        return 1.0 - (current_distance / total_distance) if total_distance > 0 else 0.0
+
+
+class Chunk:
+    """无尽模式中的一段竖直区域 [top, bottom)，持有该区域生成的实体"""
+
+    def __init__(self, index, top, bottom):
+        self.index = index
+        self.top = top
+        self.bottom = bottom
+
+        self.holes = []
+        self.coins = []
+        self.moving_platforms = []
+        self.springs = []
+        self.teleporters = []
+
+    def content_top(self):
+        """区块内容的最高点（传送门对可能伸出区块上边界）"""
+        top = self.top
+        for teleporter_pair in self.teleporters:
+            for teleporter in teleporter_pair:
+                top = min(top, teleporter.bounds()[1])
+        return top
+
+
+class EndlessWorld(World):
+    """
+    无尽模式：世界按 CHUNK_HEIGHT 切成竖直区块，在摄像机上方提前生成，
+    区块整体落到平台（和小球）下方后连同其中的实体一起释放，
+    因此长时间游戏时实体数量、内存和每帧开销保持恒定。
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self.chunks = []  # 从下到上排列
+        self.chunk_base = self.camera.y - 10  # 第一个区块的下边界：刚好在屏幕上方
+
+        self._stream_chunks()
+
+    # TODO: 优化生成逻辑，避免重叠
+    def _generate_chunk(self):
+        """在最上方的区块之上生成一个新区块"""
+        index = self.chunks[-1].index + 1 if self.chunks else 0
+        bottom = self.chunk_base - index * CHUNK_HEIGHT
+        top = bottom - CHUNK_HEIGHT
+        chunk = Chunk(index, top, bottom)
+
+        def random_y(margin=0):
+            return random.uniform(top + margin, bottom - margin)
+
+        # 洞口和金币
+        for _ in range(random.randint(5, 7)):
+            chunk.holes.append(self.add_hole(random.randint(0, int(GAME_WIDTH)), random_y()))
+        for _ in range(random.randint(3, 5)):
+            chunk.coins.append(self.add_coin(random.randint(0, int(GAME_WIDTH)), random_y()))
+
+        # 移动平台
+        direction = random.choice([-1, 1])
+        chunk.moving_platforms.append(
+            self.add_moving_platform(random.randint(100, int(GAME_WIDTH) - 100), random_y(10),
+                                     width=120, speed=80, direction=direction)
+        )
+
+        # 弹簧
+        for _ in range(random.randint(1, 2)):
+            chunk.springs.append(self.add_spring(random.randint(50, int(GAME_WIDTH) - 50), random_y(10)))
+
+        # 传送门对：第二个传送门在第一个上方 200~400 像素
+        tele1_x = random.randint(100, int(GAME_WIDTH) - 100)
+        tele1_y = random_y(HOLE_RADIUS)
+        tele2_x = random.randint(100, int(GAME_WIDTH) - 100)
+        tele2_y = tele1_y - random.randint(200, 400)
+        chunk.teleporters.append(list(self.add_teleporter_pair(tele1_x, tele1_y, tele2_x, tele2_y)))
+
+        self.chunks.append(chunk)
+
+    def _evict_chunk(self, chunk):
+        """从世界和碰撞网格中移除一个区块的全部实体"""
+        for hole in chunk.holes:
+            self.hole_grid.remove(hole)
+        for coin in chunk.coins:
+            self.coin_grid.remove(coin)
+        for platform in chunk.moving_platforms:
+            self.moving_platform_grid.remove(platform)
+        for spring in chunk.springs:
+            self.spring_grid.remove(spring)
+        for teleporter_pair in chunk.teleporters:
+            for teleporter in teleporter_pair:
+                self.teleporter_grid.remove(teleporter)
+        self.chunks.remove(chunk)
+
+    def _rebuild_entity_lists(self):
+        """区块变化后重建扁平实体列表（按区块从下到上，保持插入顺序）"""
+        self.holes = [hole for chunk in self.chunks for hole in chunk.holes]
+        self.coins = [coin for chunk in self.chunks for coin in chunk.coins]
+        self.moving_platforms = [p for chunk in self.chunks for p in chunk.moving_platforms]
+        self.springs = [spring for chunk in self.chunks for spring in chunk.springs]
+        self.teleporters = [pair for chunk in self.chunks for pair in chunk.teleporters]
+
+    def _stream_chunks(self):
+        """在摄像机上方保持至少一个区块，释放已经落到平台和小球下方的区块"""
+        changed = False
+
+        while not self.chunks or self.chunks[-1].top > self.camera.y - CHUNK_HEIGHT:
+            self._generate_chunk()
+            changed = True
+
+        # 与原来清理屏幕外物体的边界一致：平台下方 0.4 个游戏区域高度再加 100 像素
+        # 传送可能把小球送到平台下方，所以区块还必须在小球下方
+        lower_bound = max(min(self.platform.y1, self.platform.y2) + GAME_HEIGHT * 0.4 + 100,
+                          self.ball.y + BALL_RADIUS)
+        while self.chunks and self.chunks[0].content_top() > lower_bound:
+            self._evict_chunk(self.chunks[0])
+            changed = True
+
+        if changed:
+            self._rebuild_entity_lists()
+
+    def _update_entities(self, dt):
+        self.ball.update(self.platform, dt)
+
+        # 更新障碍物和金币
+        self._update_objects(dt)
+
+        # 生成新区块、释放落后的区块
+        self._stream_chunks()
+
+        # 碰撞边缘抖动
+        if self.ball.collision_side():
+            self.shake_timer = 10
+
+        # 判断是否碰撞洞口，如果碰撞则开始动画
+        with self.section("collisions"):
+            self._fall_into_hole()
@@ -1,7 +1,5 @@
 import math
 
-import pygame
-
 from utils.settings import BALL_RADIUS, TILT_SENSITIVITY, GRAVITY, GAME_WIDTH, GAME_STATE, BEER_SPEED_FACTOR
 
 
@@ -13,6 +11,10 @@ class Ball:
         self.vy = vy
         self.bounce = bounce
 
+        # 上一个物理步的位置（用于渲染插值）
+        self.prev_x = x
+        self.prev_y = y
+
         # 滚入动画相关属性
         self.is_falling_into_hole = False
         self.fall_animation_progress = 0.0  # 0.0 到 1.0
@@ -33,6 +35,15 @@ class Ball:
             return self.original_radius * (1.0 - eased_t)
         return self.original_radius
 
+    def snapshot(self):
+        """物理步开始前记录当前位置"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def bounds(self):
+        """世界坐标包围盒 (left, top, right, bottom)，用于查询碰撞网格"""
+        return self.x - BALL_RADIUS, self.y - BALL_RADIUS, self.x + BALL_RADIUS, self.y + BALL_RADIUS
+
     def update(self, platform, dt=0.0):
         if GAME_STATE["slow_time"]:
             self.vx *= BEER_SPEED_FACTOR
@@ -130,12 +141,14 @@ class Ball:
         """检查动画是否完成"""
         return self.is_falling_into_hole and self.fall_animation_progress >= 1.0
 
-    def draw(self, screen, camera):
-        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
-        current_radius = self._get_current_radius()
+    # 高光角度量化的份数；半径按 1/RADIUS_STEPS 像素量化
+    HIGHLIGHT_ANGLES = 64
+    RADIUS_STEPS = 4
 
-        if current_radius <= 0:
-            return
+    @staticmethod
+    def _paint(surface, cx, cy, radius, angle):
+        """画小球：铜色主体、浅铜色第二层和高光（angle 为高光方向）"""
+        import pygame
 
         # === 铜色渐变主体 ===
         base_color = (184, 115, 51)  # 铜色 (可调暖)
@@ -143,39 +156,63 @@ class Ball:
         light_color = (240, 180, 120)  # 高光色
 
         # 主体：深铜色
-        pygame.draw.circle(
-            screen, base_color,
-            (int(screen_x), int(screen_y)),
-            int(current_radius)
-        )
+        pygame.draw.circle(surface, base_color, (int(cx), int(cy)), int(radius))
 
         # 第二层：略小一点的浅铜色，让球体更有体积
-        pygame.draw.circle(
-            screen, mid_color,
-            (int(screen_x), int(screen_y)),
-            int(current_radius * 0.8)
-        )
+        pygame.draw.circle(surface, mid_color, (int(cx), int(cy)), int(radius * 0.8))
 
         # === 高光（关键，决定金属感）===
+        hx = cx + math.cos(angle) * radius * 0.4
+        hy = cy + math.sin(angle) * radius * 0.4
+
+        pygame.draw.circle(surface, light_color, (int(hx), int(hy)), int(radius * 0.28))
+
+        # 内部更亮的点，强化金属感
+        pygame.draw.circle(surface, (255, 220, 180), (int(hx), int(hy)), int(radius * 0.15))
+
+    @classmethod
+    def _bake_sprite(cls, radius_step, angle_index):
+        """烘焙半径为 radius_step / RADIUS_STEPS、高光方向为第 angle_index 份的小球"""
+        import pygame
+
+        radius = radius_step / cls.RADIUS_STEPS
+        half = int(radius) + 2
+        sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        cls._paint(sprite, half, half, radius, angle_index * 2 * math.pi / cls.HIGHLIGHT_ANGLES)
+        return sprite
+
+    @classmethod
+    def _sprite(cls, radius, angle):
+        from core.sprite_cache import sprite_cache
+
+        radius_step = round(radius * cls.RADIUS_STEPS)
+        angle_index = round(angle / (2 * math.pi) * cls.HIGHLIGHT_ANGLES) % cls.HIGHLIGHT_ANGLES
+        return sprite_cache.get(("ball", radius_step, angle_index),
+                                lambda: cls._bake_sprite(radius_step, angle_index))
+
+    @classmethod
+    def prewarm_sprites(cls, zoom):
+        """加载关卡时烘焙正常大小小球的全部高光方向"""
+        for angle_index in range(cls.HIGHLIGHT_ANGLES):
+            cls._sprite(BALL_RADIUS * zoom, angle_index * 2 * math.pi / cls.HIGHLIGHT_ANGLES)
+
+    def draw(self, screen, camera, alpha=1.0):
+        """绘制小球：按半径和高光方向量化后预先烘焙，每帧只需一次 blit"""
+        # 在上一物理步和当前物理步之间插值
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+
+        screen_x, screen_y = camera.world_to_screen(x, y)
+        current_radius = self._get_current_radius() * camera.zoom
+
+        if current_radius <= 0:
+            return
+
         if self.is_falling_into_hole:
             angle = self.fall_animation_progress * 12
         else:
-            angle = (self.x + self.y) * 0.05  # 普通旋转感
-
-        hx = screen_x + math.cos(angle) * current_radius * 0.4
-        hy = screen_y + math.sin(angle) * current_radius * 0.4
+            angle = (x + y) * 0.05  # 普通旋转感
 
-        pygame.draw.circle(
-            screen,
-            light_color,
-            (int(hx), int(hy)),
-            int(current_radius * 0.28)
-        )
-
-        # 内部更亮的点，强化金属感
-        pygame.draw.circle(
-            screen,
-            (255, 220, 180),
-            (int(hx), int(hy)),
-            int(current_radius * 0.15)
-        )
+        sprite = self._sprite(current_radius, angle)
+        half = sprite.get_width() // 2
+        screen.blit(sprite, (int(screen_x) - half, int(screen_y) - half))
@@ -1,9 +1,6 @@
 import math
 
-import pygame
-
 from utils.settings import BALL_RADIUS, COIN_RADIUS
-from core.sound import sound_manager
 
 
 class Coin:
@@ -20,6 +17,10 @@ class Coin:
             self.rotation += dt * 3.0  # 旋转速度
             self.pulse += dt * 5.0  # 脉冲速度
 
+    def bounds(self):
+        """世界坐标包围盒 (left, top, right, bottom)"""
+        return self.x - COIN_RADIUS, self.y - COIN_RADIUS, self.x + COIN_RADIUS, self.y + COIN_RADIUS
+
     def check_collision(self, ball):
         """检查是否与小球碰撞"""
         if self.collected:
@@ -28,64 +29,91 @@ class Coin:
         return distance <= COIN_RADIUS + BALL_RADIUS
 
     def collect(self):
-        """收集金币并播放音效（幂等）。"""
-        if self.collected:
-            return
+        """收集金币（幂等），音效由场景根据 World 事件播放。"""
         self.collected = True
-        try:
-            sound_manager.play_sound("eat_coins")
-        except Exception:
-            pass
-
-    def draw(self, screen, camera):
-        """绘制金币（复古像素风格）"""
-        if self.collected:
-            return
 
-        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
+    # 脉冲和旋转一个周期（2π）各烘焙的帧数
+    PULSE_FRAMES = 32
+    ROTATION_FRAMES = 32
 
-        # 只绘制在屏幕可见范围内的金币
-        if screen_x < -COIN_RADIUS or screen_x > screen.get_width() + COIN_RADIUS:
-            return
-        if screen_y < -COIN_RADIUS or screen_y > screen.get_height() + COIN_RADIUS:
-            return
+    @staticmethod
+    def _paint(surface, cx, cy, radius, pulse, rotation):
+        """画金币：外圈、内圈、旋转的高光和"$"符号"""
+        import pygame
+        from core.font_cache import font_cache
 
         # 脉冲效果（大小变化）
-        pulse_scale = 1.0 + math.sin(self.pulse) * 0.2
+        pulse_scale = 1.0 + math.sin(pulse) * 0.2
 
         # 绘制金币（8-bit风格）
         # 外圈（金色）
-        pygame.draw.circle(
-            screen,
-            (255, 215, 0),
-            (int(screen_x), int(screen_y)),
-            int(COIN_RADIUS * pulse_scale)
-        )
-
-        # 内圈（深金色） 
-        pygame.draw.circle(
-            screen,
-            (200, 150, 0),
-            (int(screen_x), int(screen_y)),
-            int(COIN_RADIUS * pulse_scale * 0.7)
-        )
+        pygame.draw.circle(surface, (255, 215, 0), (int(cx), int(cy)), int(radius * pulse_scale))
+
+        # 内圈（深金色）
+        pygame.draw.circle(surface, (200, 150, 0), (int(cx), int(cy)), int(radius * pulse_scale * 0.7))
 
         # 高光（模拟旋转）
-        highlight_x = screen_x + math.cos(self.rotation) * COIN_RADIUS * 0.5
-        highlight_y = screen_y + math.sin(self.rotation) * COIN_RADIUS * 0.5
-        pygame.draw.circle(
-            screen,
-            (255, 255, 200),
-            (int(highlight_x), int(highlight_y)),
-            int(COIN_RADIUS * pulse_scale * 0.3)
-        )
+        highlight_x = cx + math.cos(rotation) * radius * 0.5
+        highlight_y = cy + math.sin(rotation) * radius * 0.5
+        pygame.draw.circle(surface, (255, 255, 200), (int(highlight_x), int(highlight_y)),
+                           int(radius * pulse_scale * 0.3))
 
         # 像素风格的"$"符号
         try:
-            font = pygame.font.SysFont("Courier", max(8, int(COIN_RADIUS * pulse_scale)))
-            text = font.render("$", True, (255, 255, 255))
-            text_rect = text.get_rect(center=(int(screen_x), int(screen_y)))
-            screen.blit(text, text_rect)
+            text = font_cache.render("$", max(4, int(radius * pulse_scale)), (255, 255, 255), face="Courier")
+            text_rect = text.get_rect(center=(int(cx), int(cy)))
+            surface.blit(text, text_rect)
         except:
             # 如果字体渲染失败，就只绘制圆圈
             pass
+
+    @classmethod
+    def _bake_sprite(cls, pulse_frame, rotation_frame, zoom):
+        """烘焙脉冲第 pulse_frame 帧、旋转第 rotation_frame 帧的金币"""
+        import pygame
+
+        radius = COIN_RADIUS * zoom
+        half = int(radius * 1.2) + 2  # 脉冲最大时的外圈
+        sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        cls._paint(sprite, half, half, radius,
+                   pulse_frame * 2 * math.pi / cls.PULSE_FRAMES,
+                   rotation_frame * 2 * math.pi / cls.ROTATION_FRAMES)
+        return sprite
+
+    @classmethod
+    def _sprite(cls, pulse, rotation, zoom):
+        from core.sprite_cache import sprite_cache
+
+        pulse_frame = int(pulse / (2 * math.pi) * cls.PULSE_FRAMES) % cls.PULSE_FRAMES
+        rotation_frame = int(rotation / (2 * math.pi) * cls.ROTATION_FRAMES) % cls.ROTATION_FRAMES
+        return sprite_cache.get(("coin", pulse_frame, rotation_frame, zoom),
+                                lambda: cls._bake_sprite(pulse_frame, rotation_frame, zoom))
+
+    @classmethod
+    def prewarm_sprites(cls, zoom):
+        """
+        加载关卡时烘焙一个完整的动画周期：金币的脉冲和旋转从 0 开始同步前进（速度 5:3），
+        所以 t 走过 2π 时两者同时回到起点，实际用到的帧组合只有这一条轨迹上的几百个
+        """
+        steps = 10 * cls.PULSE_FRAMES
+        for i in range(steps):
+            t = i * 2 * math.pi / steps
+            cls._sprite(t * 5.0, t * 3.0, zoom)
+
+    def draw(self, screen, camera):
+        """绘制金币（复古像素风格）：动画按相位量化后预先烘焙，每帧只需一次 blit"""
+        if self.collected:
+            return
+
+        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
+        radius = COIN_RADIUS * camera.zoom
+
+        # 只绘制在屏幕可见范围内的金币
+        if screen_x < -radius or screen_x > screen.get_width() + radius:
+            return
+        if screen_y < -radius or screen_y > screen.get_height() + radius:
+            return
+
+        sprite = self._sprite(self.pulse, self.rotation, camera.zoom)
+        half = sprite.get_width() // 2
+        screen.blit(sprite, (int(screen_x) - half, int(screen_y) - half))
@@ -1,5 +1,5 @@
-import pygame
 import math
+
 from utils.settings import GAME_WIDTH
 
 
@@ -23,8 +23,12 @@ class FinishLine:
 
     def draw(self, screen, camera):
         """绘制终点线（复古像素风格）"""
+        import pygame
+        from core.font_cache import font_cache
+
         screen_x1, screen_y = camera.world_to_screen(0, self.y)
         screen_x2, _ = camera.world_to_screen(GAME_WIDTH, self.y)
+        zoom = camera.zoom
         
         # 只绘制在屏幕可见范围内
         if screen_y < -50 or screen_y > screen.get_height() + 50:
@@ -40,34 +44,35 @@ class FinishLine:
             line_color,
             (int(screen_x1), int(screen_y)),
             (int(screen_x2), int(screen_y)),
-            self.thickness
+            max(1, int(self.thickness * zoom))
         )
         
         # 绘制装饰性的虚线效果（像素风格）
-        dash_length = 20
-        dash_gap = 10
+        dash_length = 20 * zoom
+        dash_gap = 10 * zoom
+        dash_offset = 2 * zoom
+        dash_width = max(1, int(2 * zoom))
         current_x = screen_x1
         while current_x < screen_x2:
             pygame.draw.line(
                 screen,
                 (100, 255, 100),
-                (int(current_x), int(screen_y - 2)),
-                (int(current_x + dash_length), int(screen_y - 2)),
-                2
+                (int(current_x), int(screen_y - dash_offset)),
+                (int(current_x + dash_length), int(screen_y - dash_offset)),
+                dash_width
             )
             pygame.draw.line(
                 screen,
                 (100, 255, 100),
-                (int(current_x), int(screen_y + 2)),
-                (int(current_x + dash_length), int(screen_y + 2)),
-                2
+                (int(current_x), int(screen_y + dash_offset)),
+                (int(current_x + dash_length), int(screen_y + dash_offset)),
+                dash_width
             )
             current_x += dash_length + dash_gap
         
         # 绘制"FINISH"文字（像素风格）
         try:
-            font = pygame.font.SysFont("Courier", 24)
-            text = font.render("FINISH", True, (0, 255, 0))
+            text = font_cache.render("FINISH", max(8, int(24 * zoom)), (0, 255, 0), face="Courier")
             text_rect = text.get_rect(center=(int((screen_x1 + screen_x2) / 2), int(screen_y)))
             screen.blit(text, text_rect)
         except:
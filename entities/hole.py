@@ -1,7 +1,5 @@
 import math
 
-import pygame
-
 from utils.settings import BALL_RADIUS, HOLE_RADIUS
 
 
@@ -10,16 +8,44 @@ class Hole:
         self.x = x
         self.y = y
 
+    def bounds(self):
+        """世界坐标包围盒 (left, top, right, bottom)"""
+        return self.x - HOLE_RADIUS, self.y - HOLE_RADIUS, self.x + HOLE_RADIUS, self.y + HOLE_RADIUS
+
     def check_collision(self, ball):
         distance = math.hypot(self.x - ball.x, self.y - ball.y)
         return distance <= HOLE_RADIUS + BALL_RADIUS
 
-    def draw(self, screen, camera):
-        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
+    @staticmethod
+    def _bake_sprite(zoom):
+        """烘焙洞口：简单的立体效果，外圈边框 + 内圈黑色"""
+        import pygame
 
-        # 简单的立体效果：外圈边框 + 内圈黑色
+        radius = int(HOLE_RADIUS * zoom)
         # 外圈边框（深灰色，2像素宽）
-        pygame.draw.circle(screen, (50, 50, 50), (int(screen_x), int(screen_y)), HOLE_RADIUS + 2, 2)
+        border = max(1, int(2 * zoom))
+        half = radius + border + 1
+        sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (50, 50, 50), (half, half), radius + border, border)
 
         # 主洞口（黑色）
-        pygame.draw.circle(screen, (0, 0, 0), (int(screen_x), int(screen_y)), HOLE_RADIUS)
+        pygame.draw.circle(sprite, (0, 0, 0), (half, half), radius)
+        return sprite
+
+    @classmethod
+    def _sprite(cls, zoom):
+        from core.sprite_cache import sprite_cache
+
+        return sprite_cache.get(("hole", zoom), lambda: cls._bake_sprite(zoom))
+
+    @classmethod
+    def prewarm_sprites(cls, zoom):
+        """加载关卡时烘焙洞口"""
+        cls._sprite(zoom)
+
+    def draw(self, screen, camera):
+        """绘制洞口（预先烘焙，每帧只需一次 blit）"""
+        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
+        sprite = self._sprite(camera.zoom)
+        half = sprite.get_width() // 2
+        screen.blit(sprite, (int(screen_x) - half, int(screen_y) - half))
@@ -1,5 +1,5 @@
-import pygame
 import math
+
 from utils.settings import BALL_RADIUS, HOLE_RADIUS
 
 
@@ -27,6 +27,11 @@ class MovingPlatform:
             self.direction = 1
 
 
+    def bounds(self):
+        """世界坐标包围盒 (left, top, right, bottom)"""
+        return (self.x - self.width / 2, self.y - self.height / 2,
+                self.x + self.width / 2, self.y + self.height / 2)
+
     def check_collision(self, ball):
         """检查与小球碰撞"""
         # 简单的矩形碰撞检测
@@ -48,25 +53,30 @@ class MovingPlatform:
 
     def draw(self, screen, camera):
         """绘制移动平台"""
+        import pygame
+
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
+        width = self.width * camera.zoom
+        height = self.height * camera.zoom
         
         # 绘制平台主体（复古像素风格）
         rect = pygame.Rect(
-            int(screen_x - self.width / 2),
-            int(screen_y - self.height / 2),
-            int(self.width),
-            int(self.height)
+            int(screen_x - width / 2),
+            int(screen_y - height / 2),
+            int(width),
+            int(height)
         )
         pygame.draw.rect(screen, (150, 150, 150), rect)
-        pygame.draw.rect(screen, (100, 100, 100), rect, 2)
+        pygame.draw.rect(screen, (100, 100, 100), rect, max(1, int(2 * camera.zoom)))
         
         # 添加像素风格的细节
         for i in range(0, int(self.width), 10):
+            detail_x = int(screen_x - width / 2 + i * camera.zoom)
             pygame.draw.line(
                 screen,
                 (120, 120, 120),
-                (int(screen_x - self.width / 2 + i), int(screen_y - self.height / 2)),
-                (int(screen_x - self.width / 2 + i), int(screen_y + self.height / 2)),
+                (detail_x, int(screen_y - height / 2)),
+                (detail_x, int(screen_y + height / 2)),
                 1
             )
 
@@ -92,6 +102,11 @@ class Spring:
                 self.compression_time = 0.0
 
 
+    def bounds(self):
+        """世界坐标包围盒 (left, top, right, bottom)"""
+        return (self.x - self.width / 2, self.y - self.height / 2,
+                self.x + self.width / 2, self.y + self.height / 2)
+
     def check_collision(self, ball):
         """检查碰撞并返回是否应该弹跳"""
         ball_left = ball.x - BALL_RADIUS
@@ -114,35 +129,64 @@ class Spring:
         return False
 
 
-    def draw(self, screen, camera):
-        """绘制弹簧"""
-        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
-        
-        # 根据压缩状态调整高度
-        draw_height = self.height * (0.5 if self.compressed else 1.0)
-        
+    @staticmethod
+    def _paint(surface, left, top, width, draw_height, line_width):
+        """画弹簧：主体矩形、边框和线圈（left/top 为左上角）"""
+        import pygame
+
         # 绘制弹簧主体（像素风格）
-        rect = pygame.Rect(
-            int(screen_x - self.width / 2),
-            int(screen_y - draw_height / 2),
-            int(self.width),
-            int(draw_height)
-        )
-        pygame.draw.rect(screen, (200, 100, 50), rect)
-        pygame.draw.rect(screen, (150, 75, 25), rect, 2)
-        
+        rect = pygame.Rect(int(left), int(top), int(width), int(draw_height))
+        pygame.draw.rect(surface, (200, 100, 50), rect)
+        pygame.draw.rect(surface, (150, 75, 25), rect, line_width)
+
         # 绘制弹簧线圈（像素风格）
         coil_count = 5
         for i in range(coil_count):
-            coil_x = screen_x - self.width / 2 + (self.width / coil_count) * i
+            coil_x = left + (width / coil_count) * i
             pygame.draw.line(
-                screen,
+                surface,
                 (100, 50, 25),
-                (int(coil_x), int(screen_y - draw_height / 2)),
-                (int(coil_x), int(screen_y + draw_height / 2)),
-                2
+                (int(coil_x), int(top)),
+                (int(coil_x), int(top + draw_height)),
+                line_width
             )
 
+    def _draw_size(self, compressed, zoom):
+        # 根据压缩状态调整高度
+        return self.width * zoom, self.height * (0.5 if compressed else 1.0) * zoom
+
+    def _bake_sprite(self, compressed, zoom):
+        """烘焙正常/压缩状态的弹簧（四周留出线宽的余量）"""
+        import pygame
+
+        width, draw_height = self._draw_size(compressed, zoom)
+        line_width = max(1, int(2 * zoom))
+        sprite = pygame.Surface((int(width) + line_width * 2, int(draw_height) + line_width * 2), pygame.SRCALPHA)
+        self._paint(sprite, line_width, line_width, width, draw_height, line_width)
+        return sprite
+
+    def _sprite(self, compressed, zoom):
+        from core.sprite_cache import sprite_cache
+
+        key = ("spring", self.width, self.height, compressed, zoom)
+        return sprite_cache.get(key, lambda: self._bake_sprite(compressed, zoom))
+
+    @classmethod
+    def prewarm_sprites(cls, zoom):
+        """加载关卡时烘焙正常和压缩两种状态"""
+        spring = cls(0, 0)
+        for compressed in (False, True):
+            spring._sprite(compressed, zoom)
+
+    def draw(self, screen, camera):
+        """绘制弹簧（两种状态预先烘焙，每帧只需一次 blit）"""
+        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
+        width, draw_height = self._draw_size(self.compressed, camera.zoom)
+        line_width = max(1, int(2 * camera.zoom))
+
+        sprite = self._sprite(self.compressed, camera.zoom)
+        screen.blit(sprite, (int(screen_x - width / 2) - line_width, int(screen_y - draw_height / 2) - line_width))
+
 
 class Teleporter:
     """传送门"""
@@ -169,6 +213,10 @@ class Teleporter:
         """更新动画"""
         self.animation_time += dt * 3.0
 
+    def bounds(self):
+        """世界坐标包围盒 (left, top, right, bottom)"""
+        return self.x - self.radius, self.y - self.radius, self.x + self.radius, self.y + self.radius
+
     def check_collision(self, ball):
         """检查碰撞并返回传送目标位置"""
         # 如果小球还在传送冷却时间内，不触发传送
@@ -181,94 +229,149 @@ class Teleporter:
         return None
 
 
-    def draw(self, screen, camera):
-        """绘制传送门"""
-        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
-        
-        # 根据配对ID选择颜色
-        color_index = self.pair_id % len(self.PAIR_COLORS)
-        outer_color, inner_color, accent_color = self.PAIR_COLORS[color_index]
-        
+    # 动画一个周期（2π）烘焙的帧数；箭头方向量化的份数
+    SPRITE_FRAMES = 64
+    ARROW_DIRECTIONS = 128
+
+    @staticmethod
+    def _paint_body(surface, cx, cy, radius, zoom, colors, animation_time):
+        """画传送门本体：脉冲外圈、内圈和旋转的 8 条短线"""
+        import pygame
+
+        outer_color, inner_color, accent_color = colors
+        line_width = max(1, int(2 * zoom))
+
         # 脉冲效果
-        pulse_radius = self.radius + math.sin(self.animation_time) * 5
-        
+        pulse_radius = radius + math.sin(animation_time) * 5 * zoom
+
         # 外圈（根据配对ID选择颜色）
-        pygame.draw.circle(screen, outer_color, (int(screen_x), int(screen_y)), int(pulse_radius), 3)
-        
+        pygame.draw.circle(surface, outer_color, (int(cx), int(cy)), int(pulse_radius), max(1, int(3 * zoom)))
+
         # 内圈
-        pygame.draw.circle(screen, inner_color, (int(screen_x), int(screen_y)), int(self.radius))
-        
+        pygame.draw.circle(surface, inner_color, (int(cx), int(cy)), int(radius))
+
         # 旋转效果（像素风格）
         for i in range(8):
-            angle = self.animation_time + (i * math.pi / 4)
-            start_x = screen_x + math.cos(angle) * self.radius * 0.7
-            start_y = screen_y + math.sin(angle) * self.radius * 0.7
-            end_x = screen_x + math.cos(angle) * self.radius
-            end_y = screen_y + math.sin(angle) * self.radius
-            pygame.draw.line(screen, accent_color, 
-                           (int(start_x), int(start_y)), 
-                           (int(end_x), int(end_y)), 2)
-        
-        # 绘制内部箭头指示传送方向（复古像素风格）
-        target_screen_x, target_screen_y = camera.world_to_screen(self.target_x, self.target_y)
-        
-        # 计算方向角度
-        dx = target_screen_x - screen_x
-        dy = target_screen_y - screen_y
+            angle = animation_time + (i * math.pi / 4)
+            start_x = cx + math.cos(angle) * radius * 0.7
+            start_y = cy + math.sin(angle) * radius * 0.7
+            end_x = cx + math.cos(angle) * radius
+            end_y = cy + math.sin(angle) * radius
+            pygame.draw.line(surface, accent_color,
+                             (int(start_x), int(start_y)),
+                             (int(end_x), int(end_y)), line_width)
+
+    @staticmethod
+    def _paint_arrow(surface, cx, cy, radius, zoom, accent_color, direction_angle, animation_time):
+        """画内部箭头，指示传送方向（复古像素风格）"""
+        import pygame
+
+        # 箭头动画：脉冲效果（大小变化）
+        arrow_pulse = 1.0 + math.sin(animation_time * 2.0) * 0.3
+        arrow_size = 8 * arrow_pulse * zoom  # 基础大小8像素，带脉冲
+
+        # 箭头位置：稍微偏离中心，指向目标方向
+        arrow_offset = radius * 0.3  # 箭头距离中心的距离
+        arrow_center_x = cx + math.cos(direction_angle) * arrow_offset
+        arrow_center_y = cy + math.sin(direction_angle) * arrow_offset
+
+        # 箭头动画：轻微前后移动（模拟流动效果）
+        flow_offset = math.sin(animation_time * 3.0) * 2.0 * zoom
+        arrow_tip_x = arrow_center_x + math.cos(direction_angle) * (arrow_size + flow_offset)
+        arrow_tip_y = arrow_center_y + math.sin(direction_angle) * (arrow_size + flow_offset)
+
+        # 箭头两翼的位置（复古像素风格，使用较小的角度）
+        wing_angle = math.pi / 5  # 约36度，复古风格
+        wing_length = arrow_size * 0.7
+
+        arrow_left_x = arrow_tip_x - wing_length * math.cos(direction_angle - wing_angle)
+        arrow_left_y = arrow_tip_y - wing_length * math.sin(direction_angle - wing_angle)
+        arrow_right_x = arrow_tip_x - wing_length * math.cos(direction_angle + wing_angle)
+        arrow_right_y = arrow_tip_y - wing_length * math.sin(direction_angle + wing_angle)
+
+        # 箭头尾部中心点
+        tail_x = arrow_center_x - math.cos(direction_angle) * arrow_size * 0.3
+        tail_y = arrow_center_y - math.sin(direction_angle) * arrow_size * 0.3
+
+        # 绘制箭头（像素风格，使用较亮的颜色）
+        arrow_color = (min(255, accent_color[0] + 50),
+                       min(255, accent_color[1] + 50),
+                       min(255, accent_color[2] + 50))
+        points = [
+            (int(arrow_tip_x), int(arrow_tip_y)),
+            (int(arrow_left_x), int(arrow_left_y)),
+            (int(tail_x), int(tail_y)),
+            (int(arrow_right_x), int(arrow_right_y))
+        ]
+
+        # 绘制箭头主体（三角形）
+        pygame.draw.polygon(surface, arrow_color, points)
+
+        # 绘制箭头边框（像素风格，更粗的边框）
+        pygame.draw.polygon(surface, (255, 255, 255), points, 1)
+
+        # 添加像素风格的内部高光
+        highlight_x = arrow_tip_x - math.cos(direction_angle) * arrow_size * 0.3
+        highlight_y = arrow_tip_y - math.sin(direction_angle) * arrow_size * 0.3
+        pygame.draw.circle(surface, (255, 255, 255),
+                           (int(highlight_x), int(highlight_y)), max(1, int(2 * zoom)))
+
+    @classmethod
+    def _sprite_half_size(cls, radius, zoom):
+        # 精灵中心到边缘的距离：要容纳脉冲最大时的外圈
+        return int(radius * zoom + 5 * zoom) + 2
+
+    @classmethod
+    def _bake_body(cls, color_index, frame, radius, zoom):
+        """烘焙本体动画的第 frame 帧（每种配对颜色一组）"""
+        import pygame
+
+        half = cls._sprite_half_size(radius, zoom)
+        sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        animation_time = frame * 2 * math.pi / cls.SPRITE_FRAMES
+        cls._paint_body(sprite, half, half, radius * zoom, zoom, cls.PAIR_COLORS[color_index], animation_time)
+        return sprite
+
+    @classmethod
+    def _bake_sprite(cls, color_index, direction, frame, radius, zoom):
+        """烘焙完整的一帧：本体（取自本体动画帧）+ 指向 direction 方向的箭头"""
+        from core.sprite_cache import sprite_cache
+
+        body = sprite_cache.get(("teleporter_body", color_index, frame, radius, zoom),
+                                lambda: cls._bake_body(color_index, frame, radius, zoom))
+        if direction is None:
+            return body
+
+        sprite = body.copy()
+        half = sprite.get_width() // 2
+        direction_angle = direction * 2 * math.pi / cls.ARROW_DIRECTIONS
+        animation_time = frame * 2 * math.pi / cls.SPRITE_FRAMES
+        cls._paint_arrow(sprite, half, half, radius * zoom, zoom, cls.PAIR_COLORS[color_index][2],
+                         direction_angle, animation_time)
+        return sprite
+
+    def draw(self, screen, camera):
+        """绘制传送门：动画按相位量化后预先烘焙，每帧只需一次 blit"""
+        from core.sprite_cache import sprite_cache
+
+        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
+        zoom = camera.zoom
+
+        # 根据配对ID选择颜色
+        color_index = self.pair_id % len(self.PAIR_COLORS)
+
+        # 动画是 animation_time 的周期函数（周期 2π），量化到 SPRITE_FRAMES 帧
+        frame = int(self.animation_time / (2 * math.pi) * self.SPRITE_FRAMES) % self.SPRITE_FRAMES
+
+        # 箭头方向只取决于传送门和目标的世界坐标，量化到 ARROW_DIRECTIONS 份
+        dx = self.target_x - self.x
+        dy = self.target_y - self.y
         if dx != 0 or dy != 0:
-            direction_angle = math.atan2(dy, dx)
-            
-            # 箭头动画：脉冲效果（大小变化）
-            arrow_pulse = 1.0 + math.sin(self.animation_time * 2.0) * 0.3
-            arrow_size = 8 * arrow_pulse  # 基础大小8像素，带脉冲
-            
-            # 箭头位置：稍微偏离中心，指向目标方向
-            arrow_offset = self.radius * 0.3  # 箭头距离中心的距离
-            arrow_center_x = screen_x + math.cos(direction_angle) * arrow_offset
-            arrow_center_y = screen_y + math.sin(direction_angle) * arrow_offset
-            
-            # 箭头动画：轻微前后移动（模拟流动效果）
-            flow_offset = math.sin(self.animation_time * 3.0) * 2.0
-            arrow_tip_x = arrow_center_x + math.cos(direction_angle) * (arrow_size + flow_offset)
-            arrow_tip_y = arrow_center_y + math.sin(direction_angle) * (arrow_size + flow_offset)
-            
-            # 箭头两翼的位置（复古像素风格，使用较小的角度）
-            wing_angle = math.pi / 5  # 约36度，复古风格
-            wing_length = arrow_size * 0.7
-            
-            arrow_left_x = arrow_tip_x - wing_length * math.cos(direction_angle - wing_angle)
-            arrow_left_y = arrow_tip_y - wing_length * math.sin(direction_angle - wing_angle)
-            arrow_right_x = arrow_tip_x - wing_length * math.cos(direction_angle + wing_angle)
-            arrow_right_y = arrow_tip_y - wing_length * math.sin(direction_angle + wing_angle)
-            
-            # 箭头尾部中心点
-            tail_x = arrow_center_x - math.cos(direction_angle) * arrow_size * 0.3
-            tail_y = arrow_center_y - math.sin(direction_angle) * arrow_size * 0.3
-            
-            # 绘制箭头（像素风格，使用较亮的颜色）
-            arrow_color = (min(255, accent_color[0] + 50), 
-                          min(255, accent_color[1] + 50), 
-                          min(255, accent_color[2] + 50))
-            
-            # 绘制箭头主体（三角形）
-            pygame.draw.polygon(screen, arrow_color, [
-                (int(arrow_tip_x), int(arrow_tip_y)),
-                (int(arrow_left_x), int(arrow_left_y)),
-                (int(tail_x), int(tail_y)),
-                (int(arrow_right_x), int(arrow_right_y))
-            ])
-            
-            # 绘制箭头边框（像素风格，更粗的边框）
-            pygame.draw.polygon(screen, (255, 255, 255), [
-                (int(arrow_tip_x), int(arrow_tip_y)),
-                (int(arrow_left_x), int(arrow_left_y)),
-                (int(tail_x), int(tail_y)),
-                (int(arrow_right_x), int(arrow_right_y))
-            ], 1)
-            
-            # 添加像素风格的内部高光
-            highlight_x = arrow_tip_x - math.cos(direction_angle) * arrow_size * 0.3
-            highlight_y = arrow_tip_y - math.sin(direction_angle) * arrow_size * 0.3
-            pygame.draw.circle(screen, (255, 255, 255), 
-                             (int(highlight_x), int(highlight_y)), 2)
+            direction = round(math.atan2(dy, dx) / (2 * math.pi) * self.ARROW_DIRECTIONS) % self.ARROW_DIRECTIONS
+        else:
+            direction = None
 
+        key = ("teleporter", color_index, direction, frame, self.radius, zoom)
+        sprite = sprite_cache.get(key, lambda: self._bake_sprite(color_index, direction, frame, self.radius, zoom))
+        half = sprite.get_width() // 2
+        screen.blit(sprite, (int(screen_x) - half, int(screen_y) - half))
@@ -1,6 +1,7 @@
 import pygame
 
 import core.scenes.common.menu_navigation_mixin as menu_nav
+from core.surface_pool import surface_pool
 from utils.settings import GAME_WIDTH, GAME_HEIGHT
 
 
@@ -36,7 +37,7 @@ class PauseMenu(menu_nav.MenuNavigationMixin):
 
     def draw(self, screen):
         # 半透明遮罩
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
+        overlay = surface_pool.get("pause_overlay", (self.screen_width, self.screen_height))
         overlay.set_alpha(150)
         overlay.fill((0, 0, 0))
         screen.blit(overlay, (0, 0))
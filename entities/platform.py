@@ -1,5 +1,3 @@
-import pygame
-
 from utils.settings import GAME_WIDTH, PLATFORM_MAX_SLOPE, PLATFORM_VY, BALL_RADIUS
 
 
@@ -10,6 +8,15 @@ class Platform:
         self.speed = speed
         self.base_y = y
 
+        # 上一个物理步的位置（用于渲染插值）
+        self.prev_y1 = y
+        self.prev_y2 = y
+
+    def snapshot(self):
+        """物理步开始前记录当前位置"""
+        self.prev_y1 = self.y1
+        self.prev_y2 = self.y2
+
     def move(self, left, right, up, speed_factor=1.0):
         if up:
             if left:
@@ -35,6 +42,8 @@ class Platform:
                     self.y1 = self.y2 - PLATFORM_MAX_SLOPE
 
     def _draw_metal_line(self,screen, start, end, width):
+        import pygame
+
         # 金属的三层颜色
         colors = [(220, 220, 220), (180, 180, 180), (120, 120, 120)]
         offsets = [-width // 4, 0, width // 4]
@@ -48,10 +57,14 @@ class Platform:
                 width // 3
             )
 
-    def draw(self, screen, camera):
+    def draw(self, screen, camera, alpha=1.0):
+        # 在上一物理步和当前物理步之间插值
+        y1 = self.prev_y1 + (self.y1 - self.prev_y1) * alpha
+        y2 = self.prev_y2 + (self.y2 - self.prev_y2) * alpha
+
         self._draw_metal_line(
             screen,
-            camera.world_to_screen(0, self.y1),
-            camera.world_to_screen(GAME_WIDTH, self.y2),
-            12
+            camera.world_to_screen(0, y1),
+            camera.world_to_screen(GAME_WIDTH, y2),
+            max(3, int(12 * camera.zoom))
         )
@@ -1,21 +1,21 @@
+import argparse
 import json
 from pathlib import Path
 
 import pygame
 
-from core.scenes.gameplay.endlessScene import EndlessScene
-from core.scenes.gameplay.gameoverScene import GameoverScene
-from core.scenes.gameplay.levelScene import LevelScene
-from core.scenes.gameplay.levelendScene import LevelendScene
-from core.scenes.main_menu.creditsScene import CreditsScene
-from core.scenes.main_menu.helpScene import HelpScene
-from core.scenes.main_menu.menuScene import MenuScene
-from core.scenes.main_menu.modeScene import ModeScene
-from core.scenes.main_menu.selectScene import SelectScene
-from core.scenes.main_menu.settingScene import SettingScene
-from core.scenes.main_menu.shopScene import ShopScene
+from core.governor import quality_governor
+from core.loader import asset_loader
+from core.postfx import postfx
+from core.profiler import profiler
+from core.scenes.registry import scene_registry
 from core.sound import sound_manager
-from utils.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_STATE
+from core.surface_pool import surface_pool
+from core.ui import ui
+from utils import startup
+from utils.helper import save_data
+from utils.settings import (SCREEN_WIDTH, SCREEN_HEIGHT, FPS, IDLE_WAIT, GAME_STATE, MAX_FRAME_TIME, QUALITY_HIGH,
+                            QUALITY_LEVELS)
 
 
 def game_state_load():
@@ -33,7 +33,7 @@ def game_state_load():
     # 如果文件不存在或为空，就创建默认数据
     if not data_path.exists() or data_path.stat().st_size == 0:
         data = {"pass_count": 0, "play_count": 0, "highest_score": 0, "total_coins": 0, "beer": 0, "volume": 5,
-                "vibration": True}
+                "vibration": True, "quality": QUALITY_HIGH, "pixel_mode": False, "effects": {}}
         with data_path.open("w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=4)
     else:
@@ -43,7 +43,7 @@ def game_state_load():
         except json.JSONDecodeError:
             # 文件内容损坏时也用默认值重建
             data = {"pass_count": 0, "play_count": 0, "highest_score": 0, "total_coins": 0, "beer": 0, "volume": 5,
-                    "vibration": True}
+                    "vibration": True, "quality": QUALITY_HIGH, "pixel_mode": False, "effects": {}}
             with data_path.open("w", encoding="utf-8") as f:
                 json.dump(data, f, ensure_ascii=False, indent=4)
 
@@ -54,54 +54,87 @@ def game_state_load():
     GAME_STATE["beer"] = data.get("beer", 0)
     GAME_STATE["volume"] = data.get("volume", 5)
     GAME_STATE["vibration"] = data.get("vibration", True)
+    quality = data.get("quality", QUALITY_HIGH)
+    GAME_STATE["quality"] = quality if quality in QUALITY_LEVELS else QUALITY_HIGH
+    GAME_STATE["pixel_mode"] = data.get("pixel_mode", False)
+    effects = data.get("effects", {})
+    GAME_STATE["effects"] = effects if isinstance(effects, dict) else {}
+    postfx.load_settings(GAME_STATE["effects"])
+
+
+def parse_args(argv=None):
+    """命令行参数"""
+    parser = argparse.ArgumentParser(description="Ice Cold Beer")
+    parser.add_argument("--no-effects", action="store_true", help="关闭所有后期特效")
+    parser.add_argument("--effect", action="append", default=[], metavar="NAME=on|off",
+                        help="开关单个后期特效（本次运行有效，可以重复），例如 --effect glitch=off")
+    parser.add_argument("--pixel", choices=("on", "off"),
+                        help="开关像素化渲染模式（与设置界面的 Pixel 选项相同，会写入存档）")
+    parser.add_argument("--no-governor", action="store_true", help="关闭画质调节器（帧率不够时也不自动降低画质）")
+    parser.add_argument("--profile", action="store_true", help="显示帧耗时分析面板（游戏中按 F3 开关）")
+    return parser.parse_args(argv)
+
+
+def apply_effect_args(args):
+    """命令行的特效开关（覆盖存档中的设置，不写入存档）"""
+    if args.no_effects:
+        postfx.enabled = False
+    for spec in args.effect:
+        name, _, value = spec.partition("=")
+        value = value.strip().lower() or "on"
+        if value not in ("on", "off", "1", "0", "true", "false"):
+            print(f"无效的特效开关: {spec}（应为 NAME=on 或 NAME=off）")
+            continue
+        if not postfx.set_enabled(name.strip(), value in ("on", "1", "true")):
+            names = ", ".join(stage.name for stage in postfx.stages)
+            print(f"未知的特效: {name}（可用: {names}）")
+
+
+def wait_frame(clock, scene):
+    """
+    等到下一帧开始，返回 (经过的毫秒数, 本帧的输入事件)。
+    场景在动画中时按 FPS 限制帧率；静止时阻塞等待输入（有输入立即唤醒），
+    最多等到场景要求的下一次重画（scene.idle_timeout()），且不超过 IDLE_WAIT 秒
+    """
+    if scene.animating:
+        return clock.tick(FPS), pygame.event.get()
+
+    timeout = scene.idle_timeout()
+    timeout = IDLE_WAIT if timeout is None else max(0.0, min(timeout, IDLE_WAIT))
+    first = pygame.event.wait(int(timeout * 1000) + 1)
+    elapsed = clock.tick()
+    events = pygame.event.get()
+    if first.type != pygame.NOEVENT:
+        events.insert(0, first)
+    return elapsed, events
 
 
 def scene_switch(current_scene):
-    if current_scene.next_scene == "menu":
-        current_scene = MenuScene()
-    elif current_scene.next_scene == "mode":
-        current_scene = ModeScene()
-    elif current_scene.next_scene == "help":
-        current_scene = HelpScene()
-    elif current_scene.next_scene == "shop":
-        current_scene = ShopScene()
-    elif current_scene.next_scene == "setting":
-        current_scene = SettingScene()
-    elif current_scene.next_scene == "credits":
-        current_scene = CreditsScene()
-    elif current_scene.next_scene == "select":
-        current_scene = SelectScene()
-    elif current_scene.next_scene == "endless":
-        current_scene = EndlessScene()
-    elif current_scene.next_scene == "gameover":
-        current_scene = GameoverScene()
-    elif current_scene.next_scene == "level_win":
-        current_scene = LevelendScene(True)
-    elif current_scene.next_scene == "level_lose":
-        current_scene = LevelendScene(False)
-    else:
-        for i in range(1, 4):
-            for j in range(1, 4):
-                if current_scene.next_scene == f"level_{i}_{j}":
-                    current_scene = LevelScene(f"level_{i}_{j}")
-                    break
+    new_scene = scene_registry.create(current_scene.next_scene)
+    if new_scene is None:
+        return current_scene
 
-    return current_scene
+    # 新场景创建完成后再让旧场景释放资源，两者共用的图片清单不会被淘汰后重新加载；
+    # 无状态场景放回场景池，下次直接复用
+    scene_registry.release(current_scene)
+    return new_scene
 
 
 class IntroScene:
-    def __init__(self, screen, music_file=None, duration=2.0, fade_time=2.0):
+    def __init__(self, screen, music_file=None, duration=2.0, fade_time=2.0, loader=None):
         """
         screen: pygame 屏幕
         music_file: 背景音乐路径（可选）
         duration: 图片完全显示的时间（秒）
         fade_time: 淡入/淡出时间（秒）
+        loader: 后台资源加载器（可选），开场期间显示加载进度，加载完成前不会开始淡出
         """
         self.screen = screen
         self.duration = duration
         self.fade_time = fade_time
         self.timer = 0.0
         self.done = False
+        self.loader = loader
 
         # 加载图片
         project_root = Path(__file__).resolve().parent
@@ -134,6 +167,12 @@ class IntroScene:
     def update(self, dt):
         self.timer += dt
 
+        if self.loader is not None:
+            self.loader.poll()
+            # 资源还没加载完时停在完全显示阶段
+            if not self.loader.done:
+                self.timer = min(self.timer, self.fade_time + self.duration)
+
         if self.music_file:
             # 音乐渐入（淡入阶段）
             if self.timer < self.fade_time:
@@ -167,29 +206,50 @@ class IntroScene:
             alpha = int(255 * (1 - (self.timer - self.fade_time - self.duration) / self.fade_time))
 
         alpha = max(0, min(255, alpha))
-        img = self.image.copy()
-        img.set_alpha(alpha)
-        self.screen.blit(img, (self.image_x, self.image_y))
+        # 开场图片只在这里使用，直接修改它的整体透明度，不用每帧复制一份
+        self.image.set_alpha(alpha)
+        self.screen.blit(self.image, (self.image_x, self.image_y))
+
+        # 加载进度条（加载完成后隐藏）
+        if self.loader is not None and not self.loader.done:
+            bar_width = 300
+            bar_x = (self.screen.get_width() - bar_width) // 2
+            bar_y = self.screen.get_height() - 40
+            pygame.draw.rect(self.screen, (60, 60, 60), (bar_x, bar_y, bar_width, 6))
+            pygame.draw.rect(self.screen, (255, 180, 50),
+                             (bar_x, bar_y, int(bar_width * self.loader.progress), 6))
 
 
-def main():
+def main(argv=None):
+    args = parse_args(argv)
     pygame.init()
     screen = pygame.display.set_mode(
         (SCREEN_WIDTH, SCREEN_HEIGHT),
         pygame.DOUBLEBUF | pygame.HWSURFACE | pygame.SCALED
     )
     pygame.display.set_caption("Cold Ice Beer")
+    startup.mark("window")
     clock = pygame.time.Clock()
 
     game_state_load()
+    apply_effect_args(args)
+    if args.pixel is not None:
+        GAME_STATE["pixel_mode"] = args.pixel == "on"
+        save_data()
+    if args.no_governor:
+        quality_governor.disable()
+    profiler.set_enabled(args.profile)
     # 注意：音乐由 IntroScene 管理，这里不提前设置
 
     # ======== 开场淡入 + 音乐渐入 + 显示 + 淡出 ========
+    # 开场期间在后台线程解码菜单/游戏机背景和音效
+    loader = asset_loader
     intro_scene = IntroScene(
         screen,
         music_file="data/sounds/background.mp3",
         duration=1.0,
-        fade_time=1.0  # 可以加长淡入淡出时间让效果更明显
+        fade_time=1.0,  # 可以加长淡入淡出时间让效果更明显
+        loader=loader
     )
     intro_running = True
     while intro_running:
@@ -199,25 +259,78 @@ def main():
         intro_scene.update(dt)
         intro_scene.draw()
         pygame.display.flip()
+        if not loader.started:
+            startup.mark("first_intro_frame")
+            # 第一帧显示后再导入场景模块并提交后台加载任务
+            loader.start()
         if intro_scene.done:
             intro_running = False
 
+    # 开场被提前关闭时，等剩余资源加载完
+    loader.wait()
+
     # ======== 正常游戏菜单 ========
-    current_scene = MenuScene()
+    current_scene = scene_registry.create("menu")
     running = True
 
     while running:
-        dt = clock.tick(FPS) / 1000
-        events = pygame.event.get()
+        # 渲染帧 dt：物理场景内部用固定步长累加器消化它
+        idle = not current_scene.animating
+        elapsed, events = wait_frame(clock, current_scene)
+        dt = min(elapsed / 1000, MAX_FRAME_TIME)
+        if idle:
+            # 静止时的帧间隔包含等待输入的时间，不计入画质调节（下一帧也跳过）
+            quality_governor.reset_window(skip_frames=1)
+        else:
+            # 画质调节器只看上一帧实际工作的时间（不含 tick 为限制帧率等待的时间）
+            tier = quality_governor.tier
+            quality_governor.record(clock.get_rawtime())
+            if quality_governor.tier != tier:
+                # 特效变化后整屏重绘（静态场景可能还留着上一档的扫描线）
+                current_scene.invalidate()
+        profiler.begin_frame()
         for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # 窗口内容需要重绘（被遮挡/最小化后恢复）
+                current_scene.invalidate()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                # 开关帧耗时分析面板（关闭后整屏重绘，去掉面板）
+                profiler.toggle()
+                current_scene.invalidate()
 
-        current_scene.handle_events(events)
-        current_scene.update(dt)
-        current_scene.draw(screen)
-        pygame.display.flip()
-        current_scene = scene_switch(current_scene)
+        ui.begin_frame(dt)
+        with profiler.section("events"):
+            current_scene.handle_events(events)
+        with profiler.section("update"):
+            current_scene.update(dt)
+        with profiler.section("draw"):
+            current_scene.draw(screen)
+        overlay_rect = profiler.draw(screen, clock.get_fps())
+        if overlay_rect is not None and current_scene.dirty_rects is not None:
+            current_scene.dirty_rects.append(overlay_rect)
+        # 脏矩形模式的场景只更新变化的区域（没有变化时不更新屏幕），其他场景整屏刷新
+        with profiler.section("flip"):
+            if current_scene.dirty_rects is None:
+                pygame.display.flip()
+            elif current_scene.dirty_rects:
+                pygame.display.update(current_scene.dirty_rects)
+        postfx.end_frame()
+        surface_pool.end_frame()
+        profiler.end_frame()
+        # 空闲时预热可能的下一个场景
+        scene_registry.prewarm_step()
+        if not startup.marks.get("interactive_menu"):
+            # 菜单第一帧已处理输入并显示
+            startup.mark("interactive_menu")
+            if startup.BENCHMARK:
+                running = False
+        next_scene = scene_switch(current_scene)
+        if next_scene is not current_scene:
+            # 切换场景的这一帧包含创建场景的时间，不计入画质调节
+            quality_governor.reset_window(skip_frames=1)
+        current_scene = next_scene
 
     pygame.quit()
 
@@ -1,7 +1,7 @@
 import json
 from pathlib import Path
 
-from utils.settings import GAME_STATE
+from utils.settings import GAME_STATE, QUALITY_HIGH
 
 
 def save_data():
@@ -12,7 +12,10 @@ def save_data():
         "total_coins": GAME_STATE.get("total_coins", 0),
         "beer": GAME_STATE.get("beer", 0),
         "volume": GAME_STATE.get("volume", 5),
-        "vibration": GAME_STATE.get("vibration", True)
+        "vibration": GAME_STATE.get("vibration", True),
+        "quality": GAME_STATE.get("quality", QUALITY_HIGH),
+        "pixel_mode": GAME_STATE.get("pixel_mode", False),
+        "effects": GAME_STATE.get("effects", {})
     }
 
     # 获取项目根目录
@@ -1,6 +1,13 @@
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-FPS = 60
+FPS = 60  # 渲染帧率上限（弱机器可以调低，不影响物理）
+IDLE_WAIT = 0.25  # 场景静止（Scene.animating 为 False）时两帧之间最长的等待时间（秒），有输入时立即唤醒
+
+# 物理模拟参数（固定步长，与渲染帧率无关）
+SIM_FPS = 60
+SIM_DT = 1.0 / SIM_FPS
+MAX_SUBSTEPS = 5  # 单帧最多追赶的物理步数
+MAX_FRAME_TIME = 0.25  # 单帧 dt 上限（秒），防止窗口拖动等长时间卡顿后一次性跳跃
 
 GAME_WIDTH = SCREEN_WIDTH * 0.55 + 5
 GAME_HEIGHT = SCREEN_WIDTH * 0.55 + 5
@@ -21,10 +28,37 @@ HOLE_RADIUS = BALL_RADIUS + 5
 # 金币参数
 COIN_RADIUS = 12
 
+# 碰撞网格参数（空间哈希格子边长，约为可见区域的 1/4）
+GRID_CELL_SIZE = 128
+
+# 视口裁剪的外扩边距（像素）：传送门脉冲光圈、洞口描边等会画到包围盒外面一点
+CULL_MARGIN = 16
+
+# 无尽模式区块高度（每次在摄像机上方生成一个区块）
+CHUNK_HEIGHT = GAME_HEIGHT
+
 # 啤酒参数
 BEER_DURATION = 5  # seconds
 BEER_SPEED_FACTOR = 0.5
 
+# 画质档位（影响色差等后期特效）：高画质色差逐行处理，中画质隔行处理（带隔行条纹），低画质关闭色差
+QUALITY_LOW = "low"
+QUALITY_MEDIUM = "medium"
+QUALITY_HIGH = "high"
+QUALITY_LEVELS = [QUALITY_LOW, QUALITY_MEDIUM, QUALITY_HIGH]
+
+# 画质调节器（core/governor.py）：每 GOVERNOR_WINDOW 帧评估一次帧耗时
+GOVERNOR_WINDOW = 60
+GOVERNOR_DOWNGRADE_PERCENTILE = 0.9  # 窗口内这个分位的帧超出预算（1 / FPS）时降一档
+GOVERNOR_UPGRADE_HEADROOM = 0.6  # 这个分位的帧低于预算的这个比例时算作有富余
+GOVERNOR_UPGRADE_WINDOWS = 5  # 连续这么多个窗口有富余才升一档
+
+# 像素化渲染模式：游戏世界先画到 1/PIXEL_SIZE 分辨率的目标上，再用最近邻放大
+PIXEL_SIZE = 2
+
+# 图片资源缓存的内存预算（字节），超出后按 LRU 淘汰没有场景引用的图片
+ASSET_MEMORY_BUDGET = 64 * 1024 * 1024
+
 # 游戏状态（用于场景间传递数据）
 GAME_STATE = {
     "pass_count": 0,
@@ -38,6 +72,9 @@ GAME_STATE = {
     "victory": False,
     "volume": 5,
     "vibration": True,
+    "quality": QUALITY_HIGH,
+    "pixel_mode": False,
+    "effects": {},  # 后期特效开关 {阶段名: 开关}，见 core/postfx.py
 
     "slow_time": False
 }
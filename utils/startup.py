@@ -0,0 +1,17 @@
+import os
+import time
+
+# 启动基准测试模式（benchmarks/startup_benchmark.py 设置）：打印启动里程碑，进入菜单后退出
+BENCHMARK = os.environ.get("ICB_STARTUP_BENCHMARK") == "1"
+
+# 里程碑名 -> 时间戳（time.time()，便于和父进程的计时对齐）
+marks = {}
+
+
+def mark(name):
+    """记录启动里程碑（每个只记录第一次）"""
+    if name in marks:
+        return
+    marks[name] = time.time()
+    if BENCHMARK:
+        print(f"STARTUP {name} {marks[name]:.6f}", flush=True)